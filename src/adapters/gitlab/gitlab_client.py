@@ -178,7 +178,7 @@ class GitLabClient:
             Liste des membres du projet
         """
         try:
-            project = self.gl.projects.get(project_id)
+            project = self.gl.projects.get(project_id, lazy=True)
             members = project.members.all(all=True)
             return [self._to_dict(member) for member in members]
         except (GitlabError, requests.RequestException) as e:
@@ -235,7 +235,7 @@ class GitLabClient:
             Liste des commits
         """
         try:
-            project = self.gl.projects.get(project_id)
+            project = self.gl.projects.get(project_id, lazy=True)
             
             params = {'per_page': 100}
             if since:
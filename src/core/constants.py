@@ -17,6 +17,105 @@ DEFAULT_GITLAB_MAX_RETRIES = 3
 DEFAULT_GITLAB_RETRY_DELAY = 5
 DEFAULT_GITLAB_ITEMS_PER_PAGE = 100
 
+# Extraction concurrente GitLab (pool de workers borné)
+DEFAULT_GITLAB_MAX_WORKERS = 8
+DEFAULT_GITLAB_RESOURCE_CONCURRENCY = {
+    "commits": 4,
+    "pipelines": 4,
+    "issues": 4,
+    "branches": 4,
+    "merge_requests": 4,
+    "members": 4,
+    "events": 4,
+}
+
+# Gouverneur de débit GitLab (seau à jetons partagé par tous les workers)
+DEFAULT_GITLAB_RATE_LIMIT_PER_SECOND = 30
+DEFAULT_GITLAB_RATE_LIMIT_BURST = 30
+DEFAULT_GITLAB_RATE_LIMIT_RESERVE = 10  # requêtes laissées intactes avant le reset serveur
+DEFAULT_GITLAB_RATE_LIMIT_MAX_WAIT_SECONDS = 300
+
+# Client GitLab asynchrone (requêtes simultanées et keep-alive)
+DEFAULT_GITLAB_ASYNC_CONCURRENCY = 64
+DEFAULT_GITLAB_KEEPALIVE_SECONDS = 30
+
+# Fenêtre de recouvrement des filtres incrémentiels (décalages d'horloge)
+DEFAULT_INCREMENTAL_OVERLAP_MINUTES = 10
+
+# Enrichissement des emails utilisateurs (étape concurrente + cache persistant)
+DEFAULT_GITLAB_EMAIL_WORKERS = 8
+DEFAULT_GITLAB_USER_EMAIL_CACHE_FILE = "data/gitlab_user_emails.json"
+
+# Statistiques de commits (immuables par SHA) : store persistant et seuil de relecture groupée
+DEFAULT_GITLAB_COMMIT_STATS_FILE = "data/gitlab_commit_stats.json"
+DEFAULT_GITLAB_COMMIT_STATS_RANGE_THRESHOLD = 5  # au-delà, relecture de la plage avec with_stats
+
+# Moteurs de calcul de GitLabStatsExtractor (résultats identiques)
+STATS_BACKENDS = ("python", "pandas")
+
+# Accumulateurs de statistiques glissantes (compteurs et sommes par projet, métrique et jour)
+DEFAULT_GITLAB_STATS_ACCUMULATOR_FILE = "data/gitlab_stats_accumulators.json"
+# Jours conservés ouverts : au-delà, les compartiments sont figés et les contributions oubliées
+DEFAULT_GITLAB_STATS_RETENTION_DAYS = 90
+
+# Cache disque des réponses conditionnelles (ETag / Last-Modified) GitLab
+DEFAULT_GITLAB_HTTP_CACHE_DIR = "data/http_cache"
+# Chemins d'API (relatifs à /api/v4) dont les réponses changent rarement entre deux exécutions
+GITLAB_CONDITIONAL_CACHE_PATTERNS = [
+    r"^/projects(/[^/]+)?$",
+    r"^/projects/[^/]+/members(/all)?$",
+    r"^/projects/[^/]+/repository/branches$",
+    r"^/groups(/[^/]+)?$",
+    r"^/groups/[^/]+/members(/all)?$",
+]
+
+# Tri imposé par GitLab pour la pagination keyset, par ressource
+# (les autres listings, dont commits et événements, ne supportent que l'offset)
+GITLAB_KEYSET_ORDERING = {
+    "projects": {"order_by": "id", "sort": "asc"},
+    "users": {"order_by": "id", "sort": "asc"},
+    "groups": {"order_by": "name", "sort": "asc"},
+}
+
+# Extraction concurrente SonarQube (pool de workers borné, serveur plus sensible à la charge)
+DEFAULT_SONARQUBE_MAX_WORKERS = 4
+
+# Nombre maximal de clés de projet par appel à api/measures/search (limite de l'API)
+SONARQUBE_MEASURES_SEARCH_MAX_PROJECTS = 100
+
+# Nombre maximal de résultats accessibles par pagination sur api/issues/search
+SONARQUBE_ISSUES_SEARCH_WINDOW = 10000
+# Taille de page maximale acceptée par api/issues/search
+SONARQUBE_ISSUES_PAGE_SIZE = 500
+# Valeurs servant à découper une recherche d'issues trop large
+SONARQUBE_ISSUE_SEVERITIES = ["INFO", "MINOR", "MAJOR", "CRITICAL", "BLOCKER"]
+SONARQUBE_ISSUE_TYPES = ["BUG", "VULNERABILITY", "CODE_SMELL"]
+
+# Dossier des extractions SonarQube conservées par projet (extraction incrémentielle par date d'analyse)
+DEFAULT_SONARQUBE_SNAPSHOT_DIR = "data/sonarqube_snapshots"
+
+# Métriques SonarQube extraites par projet
+SONARQUBE_QUALITY_METRICS = [
+    "bugs", "reliability_rating", "vulnerabilities", "security_rating",
+    "security_hotspots", "security_hotspots_reviewed", "code_smells",
+    "sqale_index", "sqale_debt_ratio", "sqale_rating",
+    "duplicated_lines_density", "duplicated_blocks", "cognitive_complexity", "complexity",
+]
+SONARQUBE_COVERAGE_METRICS = [
+    "coverage", "line_coverage", "branch_coverage", "uncovered_lines", "lines_to_cover",
+    "uncovered_conditions", "conditions_to_cover", "tests", "test_success_density",
+    "test_failures", "test_errors", "skipped_tests", "test_execution_time",
+]
+# Métriques portant le statut de Quality Gate (lues avec les mesures groupées)
+SONARQUBE_QUALITY_GATE_METRICS = ["alert_status", "quality_gate_details"]
+
+# Aperçus de charges utiles dans les journaux (nombre d'éléments, longueur de l'échantillon)
+DEFAULT_PAYLOAD_PREVIEW_ITEMS = 3
+DEFAULT_PAYLOAD_PREVIEW_CHARS = 500
+# Bornes appliquées à chaque valeur échantillonnée (imbrication, longueur des textes)
+DEFAULT_PAYLOAD_PREVIEW_DEPTH = 3
+DEFAULT_PAYLOAD_PREVIEW_VALUE_CHARS = 80
+
 # Ressources GitLab supportées
 SUPPORTED_GITLAB_RESOURCES = [
     "users",
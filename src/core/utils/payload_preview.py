@@ -0,0 +1,174 @@
+"""
+Module contenant les aperçus de charges utiles pour les journaux.
+
+Afficher une charge utile complète (réponse d'API, fichiers bruts, lignes
+transformées) coûte une sérialisation de toute la donnée, même lorsque le
+message n'est finalement pas émis. PayloadPreview n'est converti en texte
+qu'au moment de l'émission du message et se limite à un échantillon : type
+et taille, ensemble des clés et premiers éléments. Chaque valeur de
+l'échantillon est elle-même bornée (profondeur d'imbrication, nombre
+d'éléments, longueur des textes) avant sérialisation.
+"""
+import json
+import logging
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from src.core.constants import (
+    DEFAULT_PAYLOAD_PREVIEW_CHARS,
+    DEFAULT_PAYLOAD_PREVIEW_DEPTH,
+    DEFAULT_PAYLOAD_PREVIEW_ITEMS,
+    DEFAULT_PAYLOAD_PREVIEW_VALUE_CHARS,
+)
+
+
+def _size(value: Any) -> str:
+    """Décrit le type et la taille d'une valeur (ex: 'list[12]', 'dict[3]')."""
+    if isinstance(value, (list, tuple, dict, set, str)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Tronque un texte en indiquant le nombre de caractères omis."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + f"... (+{len(text) - max_chars} car.)"
+
+
+def _preview_value(value: Any, max_items: int, depth: int, max_chars: int) -> Any:
+    """
+    Réduit une valeur à un aperçu sérialisable de taille bornée.
+
+    Args:
+        value: Valeur à réduire
+        max_items: Nombre d'éléments (ou d'entrées) conservés par conteneur
+        depth: Niveaux d'imbrication encore autorisés ; au-delà, un conteneur
+            est remplacé par sa taille (ex: '<dict[12]>')
+        max_chars: Longueur maximale des textes
+
+    Returns:
+        Aperçu de la valeur (les éléments omis sont signalés par '...')
+    """
+    if isinstance(value, str):
+        return _truncate(value, max_chars)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (dict, list, tuple, set)):
+        if depth <= 0:
+            return f"<{_size(value)}>"
+        omitted = len(value) - max_items
+        if isinstance(value, dict):
+            preview = {
+                str(key): _preview_value(item, max_items, depth - 1, max_chars)
+                for key, item in islice(value.items(), max_items)
+            }
+            if omitted > 0:
+                preview["..."] = f"+{omitted} clés"
+            return preview
+        items = [_preview_value(item, max_items, depth - 1, max_chars) for item in islice(value, max_items)]
+        if omitted > 0:
+            items.append(f"... (+{omitted} éléments)")
+        return items
+    return _truncate(str(value), max_chars)
+
+
+class PayloadPreview:
+    """
+    Aperçu échantillonné d'une charge utile, calculé seulement à l'affichage.
+
+    Utilisable directement comme argument d'un message de journal
+    (logger.debug("Réponse: %s", PayloadPreview(data))) ou dans une f-string
+    pour borner la taille d'un enregistrement affiché.
+    """
+
+    def __init__(
+        self,
+        payload: Any,
+        max_items: int = DEFAULT_PAYLOAD_PREVIEW_ITEMS,
+        max_chars: int = DEFAULT_PAYLOAD_PREVIEW_CHARS,
+        max_depth: int = DEFAULT_PAYLOAD_PREVIEW_DEPTH,
+        max_value_chars: int = DEFAULT_PAYLOAD_PREVIEW_VALUE_CHARS,
+    ) -> None:
+        """
+        Initialise l'aperçu sans rien sérialiser.
+
+        Args:
+            payload: Charge utile à décrire
+            max_items: Nombre d'éléments (ou d'entrées d'un dictionnaire) échantillonnés,
+                à chaque niveau d'imbrication
+            max_chars: Longueur maximale de la sérialisation de l'échantillon
+            max_depth: Niveaux d'imbrication conservés dans chaque élément échantillonné
+            max_value_chars: Longueur maximale des textes de l'échantillon
+        """
+        self.payload = payload
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.max_depth = max_depth
+        self.max_value_chars = max_value_chars
+
+    def _sample_value(self, value: Any) -> Any:
+        """Aperçu borné d'un élément échantillonné."""
+        return _preview_value(value, self.max_items, self.max_depth, self.max_value_chars)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Décrit la charge utile.
+
+        Returns:
+            Dictionnaire {"size", "keys" (éventuel), "sample"} ; 'sample' contient
+            les premiers éléments ou les premières entrées, chacun réduit à un aperçu borné
+        """
+        payload = self.payload
+        summary: Dict[str, Any] = {"size": _size(payload)}
+        if isinstance(payload, dict):
+            summary["keys"] = sorted(map(str, payload))
+            summary["sample"] = {
+                str(key): self._sample_value(value) for key, value in islice(payload.items(), self.max_items)
+            }
+        elif isinstance(payload, (list, tuple)):
+            sample = list(payload[:self.max_items])
+            keys = sorted({str(key) for item in sample if isinstance(item, dict) for key in item})
+            if keys:
+                summary["keys"] = keys
+            summary["sample"] = [self._sample_value(item) for item in sample]
+        else:
+            summary["sample"] = self._sample_value(payload)
+        return summary
+
+    def __str__(self) -> str:
+        summary = self.summary()
+        # L'échantillon est déjà borné ; la troncature finale ne porte que sur un texte court
+        sample = _truncate(json.dumps(summary.pop("sample"), ensure_ascii=False, default=str), self.max_chars)
+        parts: List[str] = [summary["size"]]
+        if "keys" in summary:
+            parts.append(f"keys={summary['keys']}")
+        parts.append(f"sample={sample}")
+        return " ".join(parts)
+
+    __repr__ = __str__
+
+
+def log_payload(
+    logger: logging.Logger,
+    label: str,
+    payload: Any,
+    level: int = logging.DEBUG,
+    max_items: int = DEFAULT_PAYLOAD_PREVIEW_ITEMS,
+    max_chars: Optional[int] = None,
+) -> None:
+    """
+    Journalise l'aperçu d'une charge utile si le niveau est actif pour ce logger.
+
+    Args:
+        logger: Logger à utiliser
+        label: Libellé du message
+        payload: Charge utile à décrire
+        level: Niveau du message (DEBUG par défaut)
+        max_items: Nombre d'éléments échantillonnés
+        max_chars: Longueur maximale de l'échantillon sérialisé (optionnel)
+    """
+    if not logger.isEnabledFor(level):
+        return
+    preview = PayloadPreview(payload, max_items, max_chars or DEFAULT_PAYLOAD_PREVIEW_CHARS)
+    logger.log(level, "%s: %s", label, preview)
@@ -0,0 +1,412 @@
+"""
+Module contenant le client GitLab asynchrone basé sur aiohttp.
+
+Ce client expose la même surface que GitLabProjectsGateway (projets, commits
+avec statistiques, merge requests, issues, pipelines, branches, membres,
+events) ainsi que les utilisateurs et groupes. Toutes les requêtes partagent
+une session aiohttp (pool de connexions, keep-alive) et un sémaphore qui borne
+le nombre de requêtes en vol.
+"""
+import asyncio
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from dateutil.parser import parse as parse_date
+from requests.utils import parse_header_links
+
+from src.core.constants import (
+    DEFAULT_GITLAB_ASYNC_CONCURRENCY,
+    DEFAULT_GITLAB_COMMIT_STATS_RANGE_THRESHOLD,
+    DEFAULT_GITLAB_ITEMS_PER_PAGE,
+    DEFAULT_GITLAB_KEEPALIVE_SECONDS,
+    DEFAULT_GITLAB_MAX_RETRIES,
+    DEFAULT_GITLAB_RETRY_DELAY,
+    DEFAULT_GITLAB_TIMEOUT,
+    ERROR_MESSAGES,
+    SSL_CONFIG,
+)
+from src.core.exceptions import APIRateLimitError, ExtractionError
+from src.extractors.gitlab.commit_stats_store import GitLabCommitStatsStore
+from src.extractors.gitlab.gitlab_client_improved import build_keyset_parameters
+from src.extractors.gitlab.rate_limit_governor import RateLimitGovernor
+from src.extractors.gitlab.response_cache import GitLabResponseCache
+
+# Statuts HTTP pour lesquels une requête est rejouée
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncGitLabClient:
+    """
+    Client GitLab asynchrone.
+
+    La session est ouverte par 'open()' (ou 'async with') dans la boucle
+    d'événements qui exécute les requêtes, et doit être fermée par 'close()'.
+    """
+
+    def __init__(
+        self,
+        gitlab_config: Dict[str, Any],
+        max_concurrency: int = DEFAULT_GITLAB_ASYNC_CONCURRENCY,
+        rate_limit_governor: Optional[RateLimitGovernor] = None,
+        response_cache: Optional[GitLabResponseCache] = None,
+        commit_stats_store: Optional[GitLabCommitStatsStore] = None,
+    ) -> None:
+        """
+        Initialise le client asynchrone.
+
+        Args:
+            gitlab_config: Configuration GitLab (mêmes clés que GitLabClient)
+            max_concurrency: Nombre maximal de requêtes simultanées
+            rate_limit_governor: Gouverneur de débit partagé (optionnel)
+            response_cache: Cache des réponses conditionnelles (optionnel)
+            commit_stats_store: Store des statistiques de commits par SHA (optionnel)
+
+        Raises:
+            ValueError: Si des paramètres obligatoires sont manquants
+        """
+        self._logger = logging.getLogger(__name__)
+        missing_parameters = [p for p in ("api_url", "private_token") if not gitlab_config.get(p)]
+        if missing_parameters:
+            raise ValueError(
+                ERROR_MESSAGES["MISSING_CONFIG"].format(parameter=", ".join(missing_parameters))
+            )
+
+        base_url = re.sub(r"(/api/v4)+$", "", gitlab_config["api_url"].rstrip("/"))
+        self._api_url = f"{base_url.rstrip('/')}/api/v4"
+        self._private_token = gitlab_config["private_token"]
+        self._request_timeout = gitlab_config.get("timeout", DEFAULT_GITLAB_TIMEOUT)
+        self._max_retry_attempts = gitlab_config.get("max_retries", DEFAULT_GITLAB_MAX_RETRIES)
+        self._retry_delay_seconds = gitlab_config.get("retry_delay", DEFAULT_GITLAB_RETRY_DELAY)
+        self._items_per_page = gitlab_config.get("items_per_page", DEFAULT_GITLAB_ITEMS_PER_PAGE)
+        self._ssl_verification_enabled = gitlab_config.get("verify_ssl", SSL_CONFIG["VERIFY_SSL_DEFAULT"])
+        self._keepalive_timeout = gitlab_config.get("keepalive_timeout", DEFAULT_GITLAB_KEEPALIVE_SECONDS)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.rate_limit_governor = rate_limit_governor or RateLimitGovernor()
+        self.response_cache = response_cache
+        self.commit_stats_store = commit_stats_store
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.request_count = 0
+
+    async def open(self) -> None:
+        """Ouvre la session HTTP partagée (pool de connexions avec keep-alive)."""
+        if self._session is not None and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            keepalive_timeout=self._keepalive_timeout,
+            ssl=None if self._ssl_verification_enabled else False,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"PRIVATE-TOKEN": self._private_token},
+            timeout=aiohttp.ClientTimeout(total=self._request_timeout),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self) -> None:
+        """Ferme la session HTTP."""
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncGitLabClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def is_connected(self) -> bool:
+        """Indique si la session HTTP est ouverte."""
+        return self._session is not None and not self._session.closed
+
+    # -----------------
+    # Requêtes et pagination
+    # -----------------
+    @staticmethod
+    def _query_params(params: Dict[str, Any]) -> Dict[str, str]:
+        """Convertit les paramètres au format attendu par aiohttp (booléens en 'true'/'false')."""
+        return {
+            key: (str(value).lower() if isinstance(value, bool) else str(value))
+            for key, value in params.items()
+            if value is not None
+        }
+
+    async def _request_page(self, url: Any, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Optional[Any]]:
+        """
+        Exécute une requête GET sous le sémaphore, avec rejeu sur 429 et erreurs 5xx.
+
+        Args:
+            url: URL absolue (ou URL 'next' de l'en-tête 'Link')
+            params: Paramètres de la requête
+
+        Returns:
+            Tuple (contenu JSON, URL de la page suivante ou None)
+
+        Raises:
+            APIRateLimitError: Si la réponse est encore 429 après la dernière tentative
+            aiohttp.ClientResponseError: Si la requête échoue définitivement
+            ExtractionError: Si aucune tentative n'a produit de réponse exploitable
+        """
+        if self._session is None:
+            await self.open()
+        query = self._query_params(params or {})
+        cache = self.response_cache
+        cacheable = cache is not None and cache.is_cacheable("GET", url)
+        headers = cache.conditional_headers(str(url), query) if cacheable else {}
+        for attempt in range(self._max_retry_attempts + 1):
+            async with self._semaphore:
+                await self.rate_limit_governor.acquire_async()
+                async with self._session.get(url, params=query, headers=headers) as response:
+                    self.request_count += 1
+                    self.rate_limit_governor.observe(response.status, response.headers)
+                    if response.status == 304 and cacheable:
+                        cached = cache.replay(str(url), query)
+                        if cached is not None:
+                            return self._parse_page(*cached)
+                        # Entrée disparue : nouvelle tentative non conditionnelle
+                        headers, delay = {}, 0.0
+                    elif response.status in RETRYABLE_STATUSES and attempt < self._max_retry_attempts:
+                        # Sur 429, la pause globale est portée par le gouverneur de débit
+                        delay = 0.0 if response.status == 429 else self._retry_delay(response.headers.get("Retry-After"))
+                    elif response.status == 429:
+                        # Tentatives épuisées : l'erreur ne doit pas être absorbée par _safe_get_all
+                        raise APIRateLimitError(ERROR_MESSAGES["RATE_LIMIT_EXCEEDED"].format(service="GitLab"))
+                    else:
+                        response.raise_for_status()
+                        body = await response.read()
+                        if cacheable:
+                            cache.store(str(url), query, response.headers, body)
+                        return self._parse_page(response.headers, body)
+            self._logger.warning(f"Réponse {response.status} pour {url}, nouvelle tentative dans {delay}s")
+            await asyncio.sleep(delay)
+        # Seule une réponse 304 sans entrée de cache à la dernière tentative mène ici
+        raise ExtractionError(
+            f"Aucune réponse exploitable pour {url} après {self._max_retry_attempts + 1} tentatives"
+        )
+
+    @staticmethod
+    def _parse_page(headers: Any, body: bytes) -> Tuple[Any, Optional[str]]:
+        """Décode une page JSON et extrait l'URL 'next' de l'en-tête 'Link'."""
+        next_url = None
+        for link in parse_header_links(headers.get("Link", "")):
+            if link.get("rel") == "next":
+                next_url = link.get("url")
+        return json.loads(body) if body else None, next_url
+
+    def _retry_delay(self, retry_after: Optional[str]) -> float:
+        """Délai avant nouvelle tentative : 'Retry-After' en secondes, sinon le délai configuré."""
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            return float(self._retry_delay_seconds)
+
+    async def _follow_pages(self, url: Any, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Suit l'en-tête 'Link' jusqu'à la dernière page et concatène les éléments."""
+        items: List[Dict[str, Any]] = []
+        query: Optional[Dict[str, Any]] = params
+        while url:
+            page, url = await self._request_page(url, query)
+            if not isinstance(page, list) or not page:
+                break
+            items.extend(page)
+            # L'URL 'next' contient déjà tous les paramètres de la requête
+            query = None
+        return items
+
+    async def get_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      resource_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère tous les éléments d'un endpoint paginé.
+
+        La pagination keyset est utilisée si la ressource la supporte, avec
+        repli sur la pagination offset si le serveur la refuse.
+
+        Args:
+            endpoint: Chemin relatif à /api/v4 (ex: '/projects/1/commits')
+            params: Paramètres de la requête
+            resource_type: Type de ressource, pour déterminer le tri keyset
+
+        Returns:
+            Liste des éléments
+        """
+        parameters = dict(params or {})
+        parameters.setdefault("per_page", self._items_per_page)
+        url = f"{self._api_url}{endpoint}"
+
+        keyset_parameters = build_keyset_parameters(resource_type, parameters)
+        if keyset_parameters is not None:
+            try:
+                return await self._follow_pages(url, keyset_parameters)
+            except aiohttp.ClientResponseError as keyset_error:
+                if keyset_error.status not in (400, 405):
+                    raise
+                self._logger.warning(
+                    f"Pagination keyset refusée pour {endpoint} ({keyset_error.status}), "
+                    f"repli sur la pagination offset"
+                )
+        return await self._follow_pages(url, parameters)
+
+    async def _safe_get_all(self, endpoint: str, label: str, params: Optional[Dict[str, Any]] = None,
+                            resource_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Variante de get_all qui journalise l'erreur et retourne une liste vide."""
+        try:
+            return await self.get_all(endpoint, params, resource_type)
+        except APIRateLimitError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Erreur lors de la récupération des {label}: {e}")
+            return []
+
+    # -----------------
+    # Surface équivalente à GitLabProjectsGateway
+    # -----------------
+    async def get_projects(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère la liste des projets (archivés exclus par défaut).
+        """
+        request_params = dict(params or {})
+        request_params.setdefault("archived", "false")
+        return await self._safe_get_all("/projects", "projects", request_params, resource_type="projects")
+
+    async def get_project_members(self, project_id: int) -> List[Dict[str, Any]]:
+        """
+        Récupère la liste des membres d'un projet.
+        """
+        return await self._safe_get_all(f"/projects/{project_id}/members", f"membres du projet {project_id}")
+
+    async def get_project_commits(self, project_id: int, params: Optional[Dict[str, Any]] = None,
+                                  since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les commits d'un projet ; les statistiques d'ajouts/suppressions
+        sont ajoutées depuis le store s'il est fourni.
+        """
+        parameters = dict(params or {})
+        if since:
+            parameters["since"] = since
+        commits = await self._safe_get_all(
+            f"/projects/{project_id}/repository/commits", f"commits du projet {project_id}", parameters
+        )
+        # Stats d'ajouts/suppressions : 'with_stats' explicite, sinon via le store par SHA
+        if "with_stats" not in parameters and self.commit_stats_store is not None:
+            await self._attach_commit_stats(project_id, commits, parameters)
+        return commits
+
+    async def get_project_commit(self, project_id: int, sha: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère le détail d'un commit (avec ses statistiques).
+        """
+        try:
+            commit, _ = await self._request_page(f"{self._api_url}/projects/{project_id}/repository/commits/{sha}")
+            return commit
+        except APIRateLimitError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Erreur lors de la récupération du commit {sha} du projet {project_id}: {e}")
+            return None
+
+    async def _attach_commit_stats(self, project_id: int, commits: List[Dict[str, Any]],
+                                   parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Ajoute 'stats' aux commits à partir du store, en ne demandant à GitLab
+        que les statistiques des SHA inconnus (même logique que GitLabProjectsGateway).
+        """
+        store = self.commit_stats_store
+        unknown = [c for c in commits if c.get("id") and store.get(c["id"]) is None]
+        if len(unknown) > DEFAULT_GITLAB_COMMIT_STATS_RANGE_THRESHOLD:
+            dates = [parse_date(c["committed_date"]) for c in unknown if c.get("committed_date")]
+            if dates:
+                ranged = {k: v for k, v in parameters.items() if k != "page"}
+                ranged.update(with_stats=True, since=min(dates).isoformat(), until=max(dates).isoformat())
+                ranged_commits = await self._safe_get_all(
+                    f"/projects/{project_id}/repository/commits", f"commits du projet {project_id}", ranged
+                )
+                for commit in ranged_commits:
+                    if commit.get("stats"):
+                        store.store(commit["id"], commit["stats"])
+        remaining = [commit["id"] for commit in unknown if store.get(commit["id"]) is None]
+        # Lectures unitaires concurrentes, bornées par le sémaphore du client
+        details = await asyncio.gather(*(self.get_project_commit(project_id, sha) for sha in remaining))
+        for detail in details:
+            if detail and detail.get("stats"):
+                store.store(detail["id"], detail["stats"])
+        for commit in commits:
+            stats = store.get(commit.get("id"))
+            if stats is not None:
+                commit["stats"] = stats
+        return commits
+
+    async def get_project_merge_requests(self, project_id: int, params: Optional[Dict[str, Any]] = None,
+                                         updated_after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les merge requests d'un projet.
+        """
+        parameters = dict(params or {})
+        if updated_after:
+            parameters["updated_after"] = updated_after
+        return await self._safe_get_all(
+            f"/projects/{project_id}/merge_requests", f"merge requests du projet {project_id}", parameters
+        )
+
+    async def get_project_issues(self, project_id: int, params: Optional[Dict[str, Any]] = None,
+                                 updated_after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les issues d'un projet.
+        """
+        parameters = dict(params or {})
+        if updated_after:
+            parameters["updated_after"] = updated_after
+        return await self._safe_get_all(
+            f"/projects/{project_id}/issues", f"issues du projet {project_id}", parameters
+        )
+
+    async def get_project_pipelines(self, project_id: int, params: Optional[Dict[str, Any]] = None,
+                                    updated_after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les pipelines d'un projet.
+        """
+        parameters = dict(params or {})
+        if updated_after:
+            parameters["updated_after"] = updated_after
+        return await self._safe_get_all(
+            f"/projects/{project_id}/pipelines", f"pipelines du projet {project_id}", parameters
+        )
+
+    async def get_project_branches(self, project_id: int,
+                                   params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les branches d'un projet.
+        """
+        return await self._safe_get_all(
+            f"/projects/{project_id}/repository/branches", f"branches du projet {project_id}", params
+        )
+
+    async def get_project_events(self, project_id: int,
+                                 params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les événements d'un projet.
+        """
+        return await self._safe_get_all(
+            f"/projects/{project_id}/events", f"events du projet {project_id}", params
+        )
+
+    async def get_all_users(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère tous les utilisateurs internes de l'instance (emails non enrichis).
+        """
+        parameters = dict(params or {})
+        parameters["external"] = False
+        parameters.setdefault("with_email", True)
+        return await self._safe_get_all("/users", "utilisateurs", parameters, resource_type="users")
+
+    async def get_all_groups(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère tous les groupes de l'instance.
+        """
+        return await self._safe_get_all("/groups", "groupes", params, resource_type="groups")
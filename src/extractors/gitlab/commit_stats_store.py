@@ -0,0 +1,94 @@
+"""
+Module contenant le store persistant des statistiques de commits GitLab.
+
+Les statistiques d'un commit (lignes ajoutées, supprimées, total) ne changent
+jamais une fois le SHA créé. Le store les conserve par SHA afin que GitLab ne
+recalcule les diffstats ('with_stats=true') que pour les commits inconnus.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from src.core.constants import DEFAULT_GITLAB_COMMIT_STATS_FILE
+
+
+class GitLabCommitStatsStore:
+    """
+    Store persistant (fichier JSON) des statistiques de commits par SHA.
+
+    Chaque entrée associe le SHA au triplet [additions, deletions, total].
+    """
+
+    def __init__(self, store_file: str = DEFAULT_GITLAB_COMMIT_STATS_FILE) -> None:
+        """
+        Initialise le store et charge les entrées existantes.
+
+        Args:
+            store_file: Chemin du fichier JSON du store
+        """
+        self._logger = logging.getLogger(__name__)
+        self.store_file = store_file
+        self._lock = threading.Lock()
+        self._entries: Dict[str, list] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, list]:
+        """Charge le fichier du store, ou retourne un store vide s'il est absent ou illisible."""
+        if not os.path.exists(self.store_file):
+            return {}
+        try:
+            with open(self.store_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Store de statistiques illisible ({self.store_file}), ignoré: {e}")
+            return {}
+
+    def get(self, sha: Optional[str]) -> Optional[Dict[str, int]]:
+        """
+        Retourne les statistiques connues d'un commit.
+
+        Args:
+            sha: SHA du commit
+
+        Returns:
+            Dictionnaire {'additions', 'deletions', 'total'} ou None si le SHA est inconnu
+        """
+        entry = self._entries.get(str(sha))
+        if entry is None:
+            return None
+        additions, deletions, total = entry
+        return {"additions": additions, "deletions": deletions, "total": total}
+
+    def store(self, sha: str, stats: Dict[str, Any]) -> None:
+        """
+        Enregistre les statistiques d'un commit.
+
+        Args:
+            sha: SHA du commit
+            stats: Statistiques renvoyées par GitLab ('additions', 'deletions', 'total')
+        """
+        with self._lock:
+            self._entries[str(sha)] = [
+                int(stats.get("additions") or 0),
+                int(stats.get("deletions") or 0),
+                int(stats.get("total") or 0),
+            ]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Écrit le store sur disque s'il a été modifié."""
+        with self._lock:
+            if not self._dirty:
+                return
+            folder = os.path.dirname(self.store_file)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.store_file, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, separators=(",", ":"))
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
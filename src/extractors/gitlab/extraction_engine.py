@@ -0,0 +1,415 @@
+"""
+Moteur d'extraction concurrente des ressources projets GitLab.
+
+Ce module répartit les appels de GitLabProjectsGateway (commits, pipelines,
+issues, branches, merge requests, membres, events) sur un pool de workers
+borné, avec une limite de concurrence globale et une limite par ressource.
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.core.constants import (
+    DEFAULT_GITLAB_MAX_WORKERS,
+    DEFAULT_GITLAB_RESOURCE_CONCURRENCY,
+)
+from src.core.exceptions import APIRateLimitError
+from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+
+# Correspondance ressource -> méthode de la passerelle
+RESOURCE_FETCHERS = {
+    "commits": "get_project_commits",
+    "pipelines": "get_project_pipelines",
+    "issues": "get_project_issues",
+    "branches": "get_project_branches",
+    "merge_requests": "get_project_merge_requests",
+    "members": "get_project_members",
+    "events": "get_project_events",
+}
+
+# Correspondance ressource -> itérateur paginé de la passerelle (extraction en flux)
+RESOURCE_ITERATORS = {
+    "commits": "iter_project_commits",
+    "pipelines": "iter_project_pipelines",
+    "issues": "iter_project_issues",
+    "branches": "iter_project_branches",
+    "merge_requests": "iter_project_merge_requests",
+    "members": "iter_project_members",
+    "events": "iter_project_events",
+}
+
+
+def _read_spool(path: str) -> Iterator[Dict[str, Any]]:
+    """Relit un fichier tampon JSON Lines élément par élément."""
+    with open(path, "r", encoding="utf-8") as spool:
+        for line in spool:
+            yield json.loads(line)
+
+
+class GitLabExtractionEngine:
+    """
+    Moteur d'extraction concurrente des ressources par projet.
+
+    Chaque couple (projet, ressource) devient une tâche exécutée dans un pool
+    de threads borné. Un sémaphore par ressource limite le nombre d'appels
+    simultanés sur un même endpoint. En mode déterministe, les résultats sont
+    fusionnés dans l'ordre des projets (puis des ressources) fourni, quel que
+    soit l'ordre de terminaison des tâches.
+    """
+
+    def __init__(
+        self,
+        projects_gateway: GitLabProjectsGateway,
+        max_workers: int = DEFAULT_GITLAB_MAX_WORKERS,
+        resource_concurrency: Optional[Dict[str, int]] = None,
+        deterministic: bool = True,
+    ) -> None:
+        """
+        Initialise le moteur d'extraction.
+
+        Args:
+            projects_gateway: Passerelle d'accès aux projets GitLab
+            max_workers: Nombre maximal de requêtes simultanées (toutes ressources)
+            resource_concurrency: Limite de concurrence par ressource (optionnel)
+            deterministic: Si True, l'ordre des résultats suit l'ordre des projets
+        """
+        self._logger = logging.getLogger(__name__)
+        self.gateway = projects_gateway
+        self.max_workers = max(1, int(max_workers))
+        self.deterministic = deterministic
+
+        concurrency = dict(DEFAULT_GITLAB_RESOURCE_CONCURRENCY)
+        concurrency.update(resource_concurrency or {})
+        self._resource_semaphores = {
+            resource: threading.BoundedSemaphore(max(1, min(int(limit), self.max_workers)))
+            for resource, limit in concurrency.items()
+        }
+
+    def fetch_resources(
+        self,
+        projects: List[Dict[str, Any]],
+        resources: List[str],
+        params_by_resource: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[Any, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Récupère plusieurs ressources pour chaque projet en parallèle.
+
+        Args:
+            projects: Liste des projets (dictionnaires contenant au moins 'id')
+            resources: Ressources à extraire (clés de RESOURCE_FETCHERS)
+            params_by_resource: Paramètres d'appel optionnels par ressource
+
+        Returns:
+            Dictionnaire {project_id: {ressource: [éléments]}}
+
+        Raises:
+            ValueError: Si une ressource n'est pas supportée
+        """
+        unsupported = [r for r in resources if r not in RESOURCE_FETCHERS]
+        if unsupported:
+            raise ValueError(
+                f"Ressource(s) non supportée(s): {unsupported}. "
+                f"Ressources supportées: {list(RESOURCE_FETCHERS)}"
+            )
+        params_by_resource = params_by_resource or {}
+        self._ensure_connection()
+
+        results: Dict[Any, Dict[str, List[Dict[str, Any]]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for project in projects:
+                for resource in resources:
+                    future = executor.submit(
+                        self._fetch_one, project["id"], resource, params_by_resource.get(resource)
+                    )
+                    futures[future] = (project["id"], resource)
+
+            try:
+                for future in as_completed(futures):
+                    project_id, resource = futures[future]
+                    results.setdefault(project_id, {})[resource] = future.result()
+            except APIRateLimitError:
+                # Étape interrompue : aucune donnée partielle n'est retournée
+                for future in futures:
+                    future.cancel()
+                raise
+
+        if not self.deterministic:
+            return results
+        return {
+            project["id"]: {resource: results[project["id"]][resource] for resource in resources}
+            for project in projects
+        }
+
+    def fetch_resource(
+        self,
+        projects: List[Dict[str, Any]],
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Récupère une seule ressource pour chaque projet en parallèle.
+
+        Returns:
+            Dictionnaire {project_id: [éléments]}
+        """
+        data = self.fetch_resources(projects, [resource], {resource: params} if params else None)
+        return {project_id: items[resource] for project_id, items in data.items()}
+
+    def stream_resource(
+        self,
+        projects: List[Dict[str, Any]],
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Tuple[Any, int, Iterator[Dict[str, Any]]]]:
+        """
+        Extrait une ressource pour chaque projet en parallèle, sans la garder en mémoire.
+
+        Chaque worker parcourt les pages de son projet (itérateurs iter_project_*)
+        et les écrit dans un fichier tampon JSON Lines temporaire. Les projets
+        sont restitués dans l'ordre fourni ; l'itérateur d'éléments d'un projet
+        doit être consommé avant de passer au projet suivant.
+
+        Args:
+            projects: Liste des projets (dictionnaires contenant au moins 'id')
+            resource: Ressource à extraire (clé de RESOURCE_ITERATORS)
+            params: Paramètres d'appel optionnels
+
+        Yields:
+            Tuples (project_id, nombre d'éléments, itérateur d'éléments)
+
+        Raises:
+            ValueError: Si la ressource n'est pas supportée
+            APIRateLimitError: Si le budget de requêtes est épuisé
+        """
+        if resource not in RESOURCE_ITERATORS:
+            raise ValueError(
+                f"Ressource non supportée: {resource}. "
+                f"Ressources supportées: {list(RESOURCE_ITERATORS)}"
+            )
+        self._ensure_connection()
+
+        with tempfile.TemporaryDirectory(prefix=f"gitlab_{resource}_") as spool_dir:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                spools = []
+                for index, project in enumerate(projects):
+                    path = os.path.join(spool_dir, f"{index}.jsonl")
+                    future = executor.submit(self._spool_one, project["id"], resource, params, path)
+                    spools.append((project["id"], path, future))
+
+                try:
+                    for project_id, path, future in spools:
+                        count = future.result()
+                        yield project_id, count, _read_spool(path)
+                        os.remove(path)
+                except (APIRateLimitError, GeneratorExit):
+                    for _, _, future in spools:
+                        future.cancel()
+                    raise
+
+    def _spool_one(
+        self, project_id: Any, resource: str, params: Optional[Dict[str, Any]], path: str
+    ) -> int:
+        """
+        Écrit les éléments d'une ressource d'un projet dans un fichier tampon.
+
+        En cas d'erreur (hors limite de débit), le tampon est vidé : le projet
+        est restitué sans éléments plutôt qu'avec une liste tronquée.
+        """
+        iterator = getattr(self.gateway, RESOURCE_ITERATORS[resource])
+        count = 0
+        with self._resource_semaphores[resource]:
+            try:
+                with open(path, "w", encoding="utf-8") as spool:
+                    for item in (iterator(project_id, params=params) if params else iterator(project_id)):
+                        spool.write(json.dumps(item, ensure_ascii=False))
+                        spool.write("\n")
+                        count += 1
+                return count
+            except APIRateLimitError:
+                raise
+            except Exception as e:
+                self._logger.error(f"Erreur lors de l'extraction {resource} du projet {project_id}: {e}")
+                open(path, "w", encoding="utf-8").close()
+                return 0
+
+    def _fetch_one(
+        self, project_id: Any, resource: str, params: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Exécute un appel de passerelle sous le sémaphore de la ressource."""
+        fetcher = getattr(self.gateway, RESOURCE_FETCHERS[resource])
+        with self._resource_semaphores[resource]:
+            try:
+                # get_project_members n'accepte pas de paramètres
+                return fetcher(project_id, params=params) if params else fetcher(project_id)
+            except APIRateLimitError:
+                raise
+            except Exception as e:
+                self._logger.error(f"Erreur lors de l'extraction {resource} du projet {project_id}: {e}")
+                return []
+
+    def _ensure_connection(self) -> None:
+        """Établit la connexion avant la répartition pour éviter les connexions concurrentes."""
+        client = getattr(self.gateway, "client", None)
+        if client is not None and not getattr(client, "is_connected", True):
+            client.connect()
+
+
+class AsyncGitLabExtractionEngine:
+    """
+    Moteur d'extraction basé sur AsyncGitLabClient.
+
+    Expose la même interface que GitLabExtractionEngine. Toutes les étapes
+    s'exécutent dans une boucle d'événements unique, conservée pour toute
+    l'exécution : la session HTTP (et ses connexions keep-alive) est ainsi
+    partagée entre les étapes. Chaque couple (projet, ressource) devient une
+    coroutine ; un sémaphore par ressource limite les appels simultanés sur
+    un même endpoint, le sémaphore du client borne le total en vol.
+    """
+
+    def __init__(
+        self,
+        async_client,
+        resource_concurrency: Optional[Dict[str, int]] = None,
+        deterministic: bool = True,
+    ) -> None:
+        """
+        Initialise le moteur d'extraction asynchrone.
+
+        Args:
+            async_client: Instance de AsyncGitLabClient
+            resource_concurrency: Limite de concurrence par ressource (optionnel)
+            deterministic: Si True, l'ordre des résultats suit l'ordre des projets
+        """
+        self._logger = logging.getLogger(__name__)
+        self.client = async_client
+        self.deterministic = deterministic
+        self._loop = asyncio.new_event_loop()
+        self._resource_concurrency = dict(DEFAULT_GITLAB_RESOURCE_CONCURRENCY)
+        self._resource_concurrency.update(resource_concurrency or {})
+        self._resource_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def run(self, coroutine):
+        """
+        Exécute une coroutine dans la boucle d'événements du moteur.
+
+        Args:
+            coroutine: Coroutine à exécuter (ex: client.get_projects())
+
+        Returns:
+            Résultat de la coroutine
+        """
+        return self._loop.run_until_complete(coroutine)
+
+    def fetch_resources(
+        self,
+        projects: List[Dict[str, Any]],
+        resources: List[str],
+        params_by_resource: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[Any, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Récupère plusieurs ressources pour chaque projet dans la boucle d'événements.
+
+        Args:
+            projects: Liste des projets (dictionnaires contenant au moins 'id')
+            resources: Ressources à extraire (clés de RESOURCE_FETCHERS)
+            params_by_resource: Paramètres d'appel optionnels par ressource
+
+        Returns:
+            Dictionnaire {project_id: {ressource: [éléments]}}
+
+        Raises:
+            ValueError: Si une ressource n'est pas supportée
+        """
+        unsupported = [r for r in resources if r not in RESOURCE_FETCHERS]
+        if unsupported:
+            raise ValueError(
+                f"Ressource(s) non supportée(s): {unsupported}. "
+                f"Ressources supportées: {list(RESOURCE_FETCHERS)}"
+            )
+        return self.run(self._fetch_resources(projects, resources, params_by_resource or {}))
+
+    def fetch_resource(
+        self,
+        projects: List[Dict[str, Any]],
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Récupère une seule ressource pour chaque projet.
+
+        Returns:
+            Dictionnaire {project_id: [éléments]}
+        """
+        data = self.fetch_resources(projects, [resource], {resource: params} if params else None)
+        return {project_id: items[resource] for project_id, items in data.items()}
+
+    def stream_resource(
+        self,
+        projects: List[Dict[str, Any]],
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Tuple[Any, int, Iterator[Dict[str, Any]]]]:
+        """
+        Même interface que GitLabExtractionEngine.stream_resource.
+
+        Le client asynchrone agrège les pages en listes : les éléments sont
+        extraits en une fois puis restitués projet par projet.
+        """
+        data = self.fetch_resource(projects, resource, params)
+        for project in projects:
+            items = data[project["id"]]
+            yield project["id"], len(items), iter(items)
+
+    async def _fetch_resources(
+        self,
+        projects: List[Dict[str, Any]],
+        resources: List[str],
+        params_by_resource: Dict[str, Dict[str, Any]],
+    ) -> Dict[Any, Dict[str, List[Dict[str, Any]]]]:
+        """Lance une coroutine par couple (projet, ressource) et fusionne les résultats."""
+        await self.client.open()
+        pairs = [(project["id"], resource) for project in projects for resource in resources]
+        results: Dict[Any, Dict[str, List[Dict[str, Any]]]] = {}
+
+        async def run_pair(project_id, resource):
+            results.setdefault(project_id, {})[resource] = await self._fetch_one(
+                project_id, resource, params_by_resource.get(resource)
+            )
+
+        await asyncio.gather(*(run_pair(project_id, resource) for project_id, resource in pairs))
+
+        if not self.deterministic:
+            return results
+        return {
+            project["id"]: {resource: results[project["id"]][resource] for resource in resources}
+            for project in projects
+        }
+
+    async def _fetch_one(
+        self, project_id: Any, resource: str, params: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Exécute un appel du client sous le sémaphore de la ressource."""
+        if resource not in self._resource_semaphores:
+            limit = self._resource_concurrency.get(resource, self.client.max_concurrency)
+            self._resource_semaphores[resource] = asyncio.Semaphore(max(1, int(limit)))
+        fetcher = getattr(self.client, RESOURCE_FETCHERS[resource])
+        async with self._resource_semaphores[resource]:
+            try:
+                return await (fetcher(project_id, params=params) if params else fetcher(project_id))
+            except APIRateLimitError:
+                raise
+            except Exception as e:
+                self._logger.error(f"Erreur lors de l'extraction {resource} du projet {project_id}: {e}")
+                return []
+
+    def close(self) -> None:
+        """Ferme la session HTTP du client puis la boucle d'événements."""
+        if not self._loop.is_closed():
+            self._loop.run_until_complete(self.client.close())
+            self._loop.close()
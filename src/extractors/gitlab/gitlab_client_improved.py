@@ -7,10 +7,12 @@ de nomenclature et de structuration du code Python.
 import gitlab
 import logging
 import ssl
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import urllib3
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 
 from src.core.constants import (
@@ -18,12 +20,41 @@ from src.core.constants import (
     DEFAULT_GITLAB_MAX_RETRIES,
     DEFAULT_GITLAB_RETRY_DELAY,
     DEFAULT_GITLAB_ITEMS_PER_PAGE,
+    DEFAULT_GITLAB_MAX_WORKERS,
+    GITLAB_KEYSET_ORDERING,
     SUPPORTED_GITLAB_RESOURCES,
     SSL_CONFIG,
     ERROR_MESSAGES,
     SUCCESS_MESSAGES
 )
 from src.core.exceptions import APIAuthenticationError, APIConnectionError, APIRateLimitError
+from src.extractors.gitlab.rate_limit_governor import RateLimitGovernor, RateLimitedSession
+
+
+def build_keyset_parameters(resource_type: Optional[str],
+                            parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Construit les paramètres de pagination keyset pour une ressource.
+
+    La pagination keyset n'est utilisée que si la ressource la supporte et
+    que le tri demandé est compatible avec celui imposé par GitLab.
+
+    Args:
+        resource_type: Type de ressource
+        parameters: Paramètres de la requête
+
+    Returns:
+        Paramètres keyset, ou None si la pagination offset doit être utilisée
+    """
+    ordering = GITLAB_KEYSET_ORDERING.get(resource_type)
+    if not ordering or parameters.get("pagination") == "offset" or "page" in parameters:
+        return None
+    if any(parameters.get(key, value) != value for key, value in ordering.items()):
+        return None
+    keyset_parameters = dict(parameters)
+    keyset_parameters.update(ordering)
+    keyset_parameters["pagination"] = "keyset"
+    return keyset_parameters
 
 
 class GitLabClient:
@@ -57,6 +88,11 @@ class GitLabClient:
         self._gitlab_client: Optional[gitlab.Gitlab] = None
         self._current_user_info: Optional[Dict[str, Any]] = None
         self._connection_status = False
+
+        # Compteurs de requêtes HTTP (partagés entre les workers)
+        self._request_counter_lock = threading.Lock()
+        self._http_request_count = 0
+        self._avoided_project_lookups = 0
     
     def _validate_configuration(self, config: Dict[str, Any]) -> None:
         """
@@ -95,7 +131,14 @@ class GitLabClient:
         self._retry_delay_seconds = config.get("retry_delay", DEFAULT_GITLAB_RETRY_DELAY)
         self._items_per_page = config.get("items_per_page", DEFAULT_GITLAB_ITEMS_PER_PAGE)
         self._ssl_verification_enabled = config.get("verify_ssl", SSL_CONFIG["VERIFY_SSL_DEFAULT"])
-        
+        # Taille du pool de connexions HTTP (à aligner sur le nombre de workers)
+        self._pool_maxsize = config.get("pool_maxsize", DEFAULT_GITLAB_MAX_WORKERS)
+
+        # Gouverneur de débit, partageable entre plusieurs clients
+        self._rate_limit_governor = config.get("rate_limit_governor") or RateLimitGovernor()
+        # Cache des réponses conditionnelles (ETag / Last-Modified), désactivé par défaut
+        self._response_cache = config.get("response_cache")
+
         # Configuration proxy
         self._proxy_settings = self._extract_proxy_configuration(config.get("proxy", {}))
     
@@ -190,11 +233,71 @@ class GitLabClient:
             url=base_url,
             private_token=self._private_token,
             ssl_verify=self._ssl_verification_enabled,
-            timeout=self._request_timeout
+            timeout=self._request_timeout,
+            session=RateLimitedSession(self._rate_limit_governor, self._response_cache)
         )
         if self._proxy_settings:
             gitlab_client.session.proxies.update(self._proxy_settings)
+        # Pool de connexions dimensionné pour l'extraction concurrente
+        pooled_adapter = HTTPAdapter(
+            pool_connections=self._pool_maxsize,
+            pool_maxsize=self._pool_maxsize
+        )
+        gitlab_client.session.mount("http://", pooled_adapter)
+        gitlab_client.session.mount("https://", pooled_adapter)
+        gitlab_client.session.hooks["response"].append(self._count_http_response)
         return gitlab_client
+
+    def _count_http_response(self, response, *args, **kwargs):
+        """Hook de session comptabilisant chaque réponse HTTP reçue."""
+        with self._request_counter_lock:
+            self._http_request_count += 1
+        return response
+
+    def _project_handle(self, project_id: int):
+        """
+        Retourne un objet projet paresseux, sans requête GET sur le projet.
+
+        Seul l'ID est nécessaire pour construire les URLs des sous-ressources
+        (commits, pipelines, ...), le détail du projet n'est donc pas chargé.
+
+        Args:
+            project_id: ID du projet
+
+        Returns:
+            Objet projet python-gitlab non chargé
+        """
+        with self._request_counter_lock:
+            self._avoided_project_lookups += 1
+        return self._gitlab_client.projects.get(project_id, lazy=True)
+
+    @property
+    def rate_limit_governor(self) -> RateLimitGovernor:
+        """Gouverneur de débit utilisé par la session HTTP."""
+        return self._rate_limit_governor
+
+    def get_rate_limit_budget(self) -> Dict[str, Any]:
+        """
+        Retourne le budget de requêtes courant du gouverneur de débit.
+
+        Returns:
+            Dictionnaire décrit par RateLimitGovernor.budget()
+        """
+        return self._rate_limit_governor.budget()
+
+    def get_request_statistics(self) -> Dict[str, int]:
+        """
+        Retourne les compteurs de requêtes HTTP de la session courante.
+
+        Returns:
+            Dictionnaire avec le nombre de requêtes émises et le nombre de
+            lectures de projets évitées grâce aux objets paresseux
+        """
+        with self._request_counter_lock:
+            return {
+                "http_requests": self._http_request_count,
+                "avoided_project_lookups": self._avoided_project_lookups,
+            }
     
     def _authenticate_user(self) -> None:
         """
@@ -312,7 +415,7 @@ class GitLabClient:
         
         try:
             # Récupération des utilisateurs
-            gitlab_users = self._gitlab_client.users.list(get_all=True, **request_parameters)
+            gitlab_users = self._list_all(self._gitlab_client.users, "users", request_parameters)
             
             # Conversion et filtrage
             processed_users = []
@@ -368,7 +471,7 @@ class GitLabClient:
             request_parameters["per_page"] = self._items_per_page
         
         try:
-            gitlab_projects = self._gitlab_client.projects.list(get_all=True, **request_parameters)
+            gitlab_projects = self._list_all(self._gitlab_client.projects, "projects", request_parameters)
             processed_projects = [
                 self._convert_gitlab_object_to_dict(project) 
                 for project in gitlab_projects
@@ -419,6 +522,8 @@ class GitLabClient:
             else:
                 return self._extract_resource_list(resource_manager, resource_type, additional_parameters)
                 
+        except APIRateLimitError:
+            raise
         except Exception as extraction_error:
             error_message = ERROR_MESSAGES["API_ERROR"].format(
                 service=f"GitLab {resource_type}", error=str(extraction_error)
@@ -480,11 +585,110 @@ class GitLabClient:
             Liste des ressources extraites
         """
         try:
-            resource_items = resource_manager.list(get_all=True, **(parameters or {}))
+            resource_items = self._list_all(resource_manager, resource_type, parameters)
             return [self._convert_gitlab_object_to_dict(item) for item in resource_items]
         except gitlab.exceptions.GitlabListError as list_error:
             self._logger.error(f"Erreur lors de la récupération de la liste {resource_type}: {list_error}")
             return []
+
+    def _list_all(self, resource_manager, resource_type: str,
+                  parameters: Optional[Dict[str, Any]]) -> List[Any]:
+        """
+        Liste tous les éléments d'une ressource en privilégiant la pagination keyset.
+
+        python-gitlab suit l'en-tête 'Link' renvoyé par GitLab. En cas de refus
+        de la pagination keyset par le serveur, la pagination offset est utilisée.
+
+        Args:
+            resource_manager: Gestionnaire de ressources
+            resource_type: Type de ressource
+            parameters: Paramètres additionnels
+
+        Returns:
+            Liste des objets GitLab
+        """
+        parameters = dict(parameters or {})
+        keyset_parameters = build_keyset_parameters(resource_type, parameters)
+        if keyset_parameters is not None:
+            try:
+                return resource_manager.list(get_all=True, **keyset_parameters)
+            except gitlab.exceptions.GitlabListError as keyset_error:
+                self._logger.warning(
+                    f"Pagination keyset refusée pour {resource_type} ({keyset_error}), "
+                    f"repli sur la pagination offset"
+                )
+        return resource_manager.list(get_all=True, **parameters)
+
+    def iter_http_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                        resource_type: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Parcourt page par page un endpoint de l'API REST GitLab.
+
+        La pagination keyset est utilisée lorsque la ressource la supporte, en
+        suivant l'en-tête 'Link'. Si le serveur la refuse dès la première page,
+        le parcours reprend en pagination offset.
+
+        Args:
+            endpoint: Chemin de l'endpoint (ex: '/users')
+            params: Paramètres de la requête
+            resource_type: Type de ressource, pour déterminer le tri keyset
+
+        Yields:
+            Listes de dictionnaires, une par page
+        """
+        if self._gitlab_client is None:
+            self.establish_connection()
+
+        parameters = dict(params or {})
+        parameters.setdefault("per_page", self._items_per_page)
+
+        keyset_parameters = build_keyset_parameters(resource_type, parameters)
+        if keyset_parameters is not None:
+            pages = self._follow_link_pages(endpoint, keyset_parameters)
+            try:
+                first_page = next(pages, None)
+            except gitlab.exceptions.GitlabHttpError as keyset_error:
+                self._logger.warning(
+                    f"Pagination keyset refusée pour {endpoint} ({keyset_error}), "
+                    f"repli sur la pagination offset"
+                )
+            else:
+                if first_page is not None:
+                    yield first_page
+                    yield from pages
+                return
+
+        yield from self._follow_link_pages(endpoint, parameters)
+
+    def _follow_link_pages(self, endpoint: str,
+                           parameters: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Suit l'en-tête 'Link' (ou 'X-Next-Page' à défaut) jusqu'à la dernière page.
+
+        Args:
+            endpoint: Chemin de l'endpoint
+            parameters: Paramètres de la première requête
+
+        Yields:
+            Listes de dictionnaires, une par page
+        """
+        url, query_data = endpoint, parameters
+        while url:
+            response = self._gitlab_client.http_request("get", url, query_data=query_data)
+            page = response.json()
+            if not isinstance(page, list) or not page:
+                return
+            yield page
+
+            next_url = response.links.get("next", {}).get("url")
+            next_page = response.headers.get("X-Next-Page")
+            if next_url:
+                # L'URL 'next' contient déjà tous les paramètres de la requête
+                url, query_data = next_url, {}
+            elif next_page:
+                url, query_data = endpoint, dict(parameters, page=int(next_page))
+            else:
+                url = None
     
     def _convert_gitlab_object_to_dict(self, gitlab_object) -> Dict[str, Any]:
         """
@@ -579,13 +783,76 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             commits = project.commits.list(get_all=True, **(params or {}))
             return [self._convert_gitlab_object_to_dict(commit) for commit in commits]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des commits du projet {project_id}: {e}")
             return []
 
+    def get_project_commit(self, project_id: int, sha: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère le détail d'un commit (statistiques incluses).
+
+        Args:
+            project_id: ID du projet
+            sha: SHA du commit
+
+        Returns:
+            Commit (dictionnaire) ou None en cas d'erreur
+        """
+        if self._gitlab_client is None:
+            self.establish_connection()
+        try:
+            project = self._project_handle(project_id)
+            return self._convert_gitlab_object_to_dict(project.commits.get(sha))
+        except APIRateLimitError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Erreur lors de la récupération du commit {sha} du projet {project_id}: {e}")
+            return None
+
+    def get_project_commit_count(self, project_id: int) -> Optional[int]:
+        """
+        Compte les commits d'un projet sans télécharger son historique.
+
+        Lit 'statistics.commit_count' (GET /projects/:id?statistics=true, droits
+        Reporter requis), sinon l'en-tête 'X-Total' d'une page d'un seul commit.
+        Comme le listing des commits, le compte porte sur la branche par défaut.
+
+        Args:
+            project_id: ID du projet
+
+        Returns:
+            Nombre de commits, ou None si aucune source n'est disponible
+        """
+        if self._gitlab_client is None:
+            self.establish_connection()
+        try:
+            project = self._gitlab_client.projects.get(project_id, statistics=True)
+            statistics = project.attributes.get("statistics") or {}
+            if statistics.get("commit_count") is not None:
+                return int(statistics["commit_count"])
+        except APIRateLimitError:
+            raise
+        except Exception as e:
+            self._logger.debug(f"Statistiques indisponibles pour le projet {project_id}: {e}")
+
+        try:
+            response = self._gitlab_client.http_request(
+                "get", f"/projects/{project_id}/repository/commits", query_data={"per_page": 1}
+            )
+            total = response.headers.get("X-Total")
+            if total:
+                return int(total)
+        except APIRateLimitError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Erreur lors du comptage des commits du projet {project_id}: {e}")
+        return None
+
     def get_project_pipelines(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Récupère les pipelines d'un projet GitLab.
@@ -593,9 +860,11 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             pipelines = project.pipelines.list(get_all=True, **(params or {}))
             return [self._convert_gitlab_object_to_dict(p) for p in pipelines]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des pipelines du projet {project_id}: {e}")
             return []
@@ -607,9 +876,11 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             issues = project.issues.list(get_all=True, **(params or {}))
             return [self._convert_gitlab_object_to_dict(i) for i in issues]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des issues du projet {project_id}: {e}")
             return []
@@ -621,9 +892,11 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             branches = project.branches.list(get_all=True, **(params or {}))
             return [self._convert_gitlab_object_to_dict(b) for b in branches]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des branches du projet {project_id}: {e}")
             return []
@@ -635,9 +908,11 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             mrs = project.mergerequests.list(get_all=True, **(params or {}))
             return [self._convert_gitlab_object_to_dict(mr) for mr in mrs]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des merge requests du projet {project_id}: {e}")
             return []
@@ -649,9 +924,11 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             members = project.members.list(get_all=True, **(params or {}))
             return [self._convert_gitlab_object_to_dict(m) for m in members]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des membres du projet {project_id}: {e}")
             return []
@@ -663,10 +940,91 @@ class GitLabClient:
         if self._gitlab_client is None:
             self.establish_connection()
         try:
-            project = self._gitlab_client.projects.get(project_id)
+            project = self._project_handle(project_id)
             return project.events.list(get_all=True, **(params or {}))
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self._logger.error(f"Erreur lors de la récupération des events du projet {project_id}: {e}")
             return []
 
+    # -----------------
+    # Itérateurs paginés (mémoire constante)
+    # -----------------
+    def _iter_project_resource(self, project_id: int, manager_name: str, resource_label: str,
+                               params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt une ressource d'un projet page par page via l'itérateur paresseux de python-gitlab.
+
+        Chaque objet est converti en dictionnaire dès sa réception : seule la page
+        courante est conservée en mémoire.
+
+        Args:
+            project_id: ID du projet
+            manager_name: Nom du gestionnaire python-gitlab (ex: 'commits', 'mergerequests')
+            resource_label: Libellé de la ressource pour les messages d'erreur
+            params: paramètres optionnels de filtrage
 
+        Yields:
+            Éléments de la ressource (dictionnaires)
+
+        Raises:
+            Exception: L'erreur d'une page est journalisée puis propagée, afin
+                que l'appelant n'écrive pas un export tronqué
+        """
+        if self._gitlab_client is None:
+            self.establish_connection()
+        request_parameters = dict(params or {})
+        request_parameters.setdefault("per_page", self._items_per_page)
+        try:
+            project = self._project_handle(project_id)
+            resource_manager = getattr(project, manager_name)
+            for gitlab_object in resource_manager.list(iterator=True, **request_parameters):
+                yield self._convert_gitlab_object_to_dict(gitlab_object)
+        except APIRateLimitError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Erreur lors du parcours des {resource_label} du projet {project_id}: {e}")
+            raise
+
+    def iter_project_commits(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les commits d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "commits", "commits", params)
+
+    def iter_project_pipelines(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les pipelines d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "pipelines", "pipelines", params)
+
+    def iter_project_issues(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les issues d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "issues", "issues", params)
+
+    def iter_project_branches(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les branches d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "branches", "branches", params)
+
+    def iter_project_merge_requests(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les merge requests d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "mergerequests", "merge requests", params)
+
+    def iter_project_members(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les membres d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "members", "membres", params)
+
+    def iter_project_events(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les événements d'un projet GitLab page par page.
+        """
+        return self._iter_project_resource(project_id, "events", "events", params)
@@ -1,14 +1,34 @@
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 # Ajout : inclure le dossier racine du projet dans sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from dateutil.parser import parse as parse_date  # Ajout pour gestion robuste des dates
+from src.core.constants import (
+    DEFAULT_GITLAB_ASYNC_CONCURRENCY,
+    DEFAULT_GITLAB_EMAIL_WORKERS,
+    DEFAULT_GITLAB_HTTP_CACHE_DIR,
+    DEFAULT_GITLAB_MAX_WORKERS,
+    DEFAULT_GITLAB_RATE_LIMIT_PER_SECOND,
+    DEFAULT_GITLAB_STATS_ACCUMULATOR_FILE,
+    DEFAULT_INCREMENTAL_OVERLAP_MINUTES,
+)
+from src.extractors.gitlab.async_gitlab_client import AsyncGitLabClient
+from src.extractors.gitlab.commit_stats_store import GitLabCommitStatsStore
+from src.extractors.gitlab.extraction_engine import AsyncGitLabExtractionEngine, GitLabExtractionEngine
 from src.extractors.gitlab.gitlab_client_improved import GitLabClient
+from src.extractors.gitlab.project_catalog import GitLabProjectCatalog
 from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+from src.extractors.gitlab.rate_limit_governor import RateLimitGovernor
+from src.extractors.gitlab.response_cache import GitLabResponseCache
+from src.extractors.gitlab.stats_accumulator import GitLabStatsAccumulator
+from src.extractors.gitlab.user_email_cache import GitLabUserEmailCache
 from src.extractors.gitlab.users_gateway import GitLabUsersGateway  # Ajout pour users/groups
 from src.utils import save_json  # 🔧 Fonction utilitaire pour sauvegarder les données
+from src.utils import save_json_object_stream
 from src.utils import get_last_extraction_date, set_last_extraction_date  # Ajout pour users/groups
 
 # --- Ajout: gestion de la date d'extraction incrémentielle ---
@@ -38,8 +58,50 @@ def set_last_extraction_date(resource_name, date_str):
 # 📁 FONCTIONS MÉTIERS
 # ---------------------------
 
-def fetch_projects(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
+def _get_engine(projects_gateway, engine=None):
+    """
+    Retourne le moteur d'extraction concurrente fourni, ou un moteur par défaut.
+    """
+    return engine if engine is not None else GitLabExtractionEngine(projects_gateway)
+
+def _list_projects(projects_gateway, params=None, catalog=None):
+    """
+    Retourne les projets du catalogue partagé de l'exécution s'il est fourni,
+    sinon effectue un listing via la passerelle.
+    """
+    if catalog is not None:
+        return catalog.get_projects()
+    return projects_gateway.get_projects(params=params)
+
+def _parse_resource_concurrency(value):
+    """
+    Convertit une chaîne 'commits=4,pipelines=2' en dictionnaire {ressource: limite}.
+    """
+    concurrency = {}
+    for entry in (value or "").split(","):
+        if "=" not in entry:
+            continue
+        resource, limit = entry.split("=", 1)
+        if resource.strip() and limit.strip().isdigit():
+            concurrency[resource.strip()] = int(limit.strip())
+    return concurrency
+
+def _fetch_resource_by_project_name(projects_gateway, resource, params=None, engine=None, catalog=None):
+    """
+    Récupère une ressource pour tous les projets en parallèle, indexée par nom de projet.
+    """
+    projects = _list_projects(projects_gateway, params, catalog)
+    print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
+    data = _get_engine(projects_gateway, engine).fetch_resource(projects, resource)
+    result = {}
+    for p in projects:
+        items = data[p['id']]
+        result[p['name']] = items
+        print(f"[DEBUG] {p['name']} ({p['id']}): {len(items)} {resource.replace('_', ' ')}")
+    return result
+
+def fetch_projects(projects_gateway, params=None, catalog=None):
+    projects = _list_projects(projects_gateway, params, catalog)
     print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
     return projects
 
@@ -57,30 +119,39 @@ def test_get_project_commits(projects_gateway, project_id):
     if len(commits) > 3:
         print(f"   ...et {len(commits)-3} autres commits.")
 
-def fetch_all_projects_and_commits(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
+def fetch_all_projects_and_commits(projects_gateway, params=None, engine=None, catalog=None):
+    projects = _list_projects(projects_gateway, params, catalog)
     print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
 
+    commits_by_project = _get_engine(projects_gateway, engine).fetch_resource(projects, "commits")
     all_data = {}
     for i, project in enumerate(projects, start=1):
         project_id = project['id']
+        commits = commits_by_project[project_id]
         print(f"\n[{i}] 📁 {project['name']} (ID: {project_id})")
-        commits = projects_gateway.get_project_commits(project_id)
         print(f"   Nombre de commits: {len(commits)}")
         all_data[project_id] = {"project": project, "commits": commits}
     return all_data
 
-def fetch_projects_commits_count(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
-    result = {}
-    for project in projects:
-        commits = projects_gateway.get_project_commits(project['id'])
-        result[project['name']] = len(commits)
-    return result
-
-def test_projects_gateway_methods(projects_gateway, params=None):
+def fetch_projects_commits_count(projects_gateway, params=None, engine=None, catalog=None):
+    """
+    Compte les commits de chaque projet sans télécharger leur historique :
+    'statistics.commit_count' du listing s'il est présent, sinon une requête
+    légère par projet (statistiques du projet ou en-tête 'X-Total').
+    Un catalogue fourni doit avoir été créé avec 'statistics': True.
+    """
+    projects = _list_projects(projects_gateway, {**(params or {}), "statistics": True}, catalog)
+    counts = {p['id']: (p.get('statistics') or {}).get('commit_count') for p in projects}
+    missing = [project_id for project_id, count in counts.items() if count is None]
+    if missing:
+        max_workers = getattr(engine, "max_workers", DEFAULT_GITLAB_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts.update(zip(missing, executor.map(projects_gateway.get_project_commit_count, missing)))
+    return {project['name']: counts[project['id']] for project in projects}
+
+def test_projects_gateway_methods(projects_gateway, params=None, catalog=None):
     result = {}
-    projects = projects_gateway.get_projects(params=params)
+    projects = _list_projects(projects_gateway, params, catalog)
     if not projects:
         print("Aucun projet trouvé pour les tests.")
         return {}
@@ -107,169 +178,42 @@ def test_projects_gateway_methods(projects_gateway, params=None):
 
     return result
 
-def fetch_all_projects_resources(projects_gateway, params=None):
+def fetch_all_projects_resources(projects_gateway, params=None, engine=None, catalog=None):
     """
     Récupère pour chaque projet toutes les ressources principales (commits, pipelines, issues, branches, merge requests, membres)
-    et retourne un dictionnaire structuré.
+    et retourne un dictionnaire structuré. Les appels sont répartis sur le moteur d'extraction concurrente.
     :param projects_gateway: Instance de GitLabProjectsGateway
     :param params: Dictionnaire de paramètres optionnels pour le filtrage des projets
+    :param engine: Instance optionnelle de GitLabExtractionEngine
     :return: Dictionnaire {projet_id: {"project": {...}, "commits": [...], "pipelines": [...], "issues": [...], "branches": [...], "merge_requests": [...], "members": [...]}}
     """
-    projects = projects_gateway.get_projects(params=params)
+    projects = _list_projects(projects_gateway, params, catalog)
     print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
+    resources = ["commits", "pipelines", "issues", "branches", "merge_requests", "members"]
+    data = _get_engine(projects_gateway, engine).fetch_resources(projects, resources)
     all_data = {}
     for i, project in enumerate(projects, start=1):
         project_id = project['id']
+        items = data[project_id]
         print(f"\n[{i}] 📁 {project['name']} (ID: {project_id})")
-        commits = projects_gateway.get_project_commits(project_id)
-        pipelines = projects_gateway.get_project_pipelines(project_id)
-        issues = projects_gateway.get_project_issues(project_id)
-        branches = projects_gateway.get_project_branches(project_id)
-        merge_requests = projects_gateway.get_project_merge_requests(project_id)
-        members = projects_gateway.get_project_members(project_id)
-        all_data[project_id] = {
-            "project": project,
-            "commits": commits,
-            "pipelines": pipelines,
-            "issues": issues,
-            "branches": branches,
-            "merge_requests": merge_requests,
-            "members": members
-        }
-        print(f"   commits: {len(commits)}, pipelines: {len(pipelines)}, issues: {len(issues)}, branches: {len(branches)}, merge_requests: {len(merge_requests)}, members: {len(members)}")
+        all_data[project_id] = {"project": project, **items}
+        print("   " + ", ".join(f"{r}: {len(items[r])}" for r in resources))
     return all_data
 
-def fetch_all_projects_pipelines(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
-    print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
-    all_pipelines = {}
-    for p in projects:
-        project_id = p['id']
-        project_name = p['name']
-        pipelines = projects_gateway.get_project_pipelines(project_id)
-        all_pipelines[project_name] = pipelines
-        print(f"[DEBUG] {project_name} ({project_id}): {len(pipelines)} pipelines")
-    return all_pipelines
-
-def fetch_all_projects_issues(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
-    print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
-    all_issues = {}
-    for p in projects:
-        project_id = p['id']
-        project_name = p['name']
-        issues = projects_gateway.get_project_issues(project_id)
-        all_issues[project_name] = issues
-        print(f"[DEBUG] {project_name} ({project_id}): {len(issues)} issues")
-    return all_issues
-
-def fetch_all_projects_branches(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
-    print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
-    all_branches = {}
-    for p in projects:
-        project_id = p['id']
-        project_name = p['name']
-        branches = projects_gateway.get_project_branches(project_id)
-        all_branches[project_name] = branches
-        print(f"[DEBUG] {project_name} ({project_id}): {len(branches)} branches")
-    return all_branches
-
-def fetch_all_projects_merge_requests(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
-    print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
-    all_mrs = {}
-    for p in projects:
-        project_id = p['id']
-        project_name = p['name']
-        mrs = projects_gateway.get_project_merge_requests(project_id)
-        all_mrs[project_name] = mrs
-        print(f"[DEBUG] {project_name} ({project_id}): {len(mrs)} merge requests")
-    return all_mrs
-
+def fetch_all_projects_pipelines(projects_gateway, params=None, engine=None, catalog=None):
+    return _fetch_resource_by_project_name(projects_gateway, "pipelines", params=params, engine=engine, catalog=catalog)
 
-def fetch_all_projects_branches_incremental(projects_gateway, params=None):
-    """
-    Extraction incrémentielle des branches basée sur la date du commit de la branche.
-    Seules les branches dont le commit est postérieur à la dernière extraction sont retournées.
-    """
-    last_date = get_last_extraction_date("branches")
-    projects = projects_gateway.get_projects(params={"membership": True})
-    all_new_branches = {}
-    max_commit_date = last_date
+def fetch_all_projects_issues(projects_gateway, params=None, engine=None, catalog=None):
+    return _fetch_resource_by_project_name(projects_gateway, "issues", params=params, engine=engine, catalog=catalog)
 
-    for p in projects:
-        project_id = p.get("id")
-        branches = projects_gateway.get_project_branches(project_id, params=params)
-        new_branches = []
-        for branch in branches:
-            commit_date = branch.get("commit", {}).get("committed_date")
-            if not commit_date:
-                continue
-            # Si on a une date de dernière extraction, on filtre
-            if last_date:
-                if commit_date > last_date:
-                    new_branches.append(branch)
-            else:
-                # Première extraction incrémentielle : on prend tout
-                new_branches.append(branch)
-            # Mise à jour de la date max
-            if not max_commit_date or commit_date > max_commit_date:
-                max_commit_date = commit_date
-        if new_branches:
-            all_new_branches[project_id] = new_branches
-
-    print(f"[DEBUG] branches last_date: {last_date}, max_commit_date: {max_commit_date}")
-    # Met à jour la date de dernière extraction si de nouvelles branches
-    if max_commit_date and max_commit_date != last_date:
-        set_last_extraction_date("branches", max_commit_date)
-        print(f"[INFO] Date de dernière extraction branches mise à jour: {max_commit_date}")
-    else:
-        print(f"[INFO] Aucune nouvelle date à enregistrer pour branches.")
+def fetch_all_projects_branches(projects_gateway, params=None, engine=None, catalog=None):
+    return _fetch_resource_by_project_name(projects_gateway, "branches", params=params, engine=engine, catalog=catalog)
 
-    return all_new_branches
+def fetch_all_projects_merge_requests(projects_gateway, params=None, engine=None, catalog=None):
+    return _fetch_resource_by_project_name(projects_gateway, "merge_requests", params=params, engine=engine, catalog=catalog)
 
-def fetch_all_projects_members(projects_gateway, params=None):
-    projects = projects_gateway.get_projects(params=params)
-    print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
-    all_members = {}
-    for p in projects:
-        project_id = p['id']
-        project_name = p['name']
-        members = projects_gateway.get_project_members(project_id)
-        all_members[project_name] = members
-        print(f"[DEBUG] {project_name} ({project_id}): {len(members)} members")
-    return all_members
-
-def fetch_all_projects_commits_incremental(projects_gateway, params=None):
-    last_date = get_last_extraction_date("commits")  # format ISO 8601
-    projects = projects_gateway.get_projects(params={"membership": True})
-    all_commits = {}
-    max_commit_date = last_date
-    for p in projects:
-        project_id = p.get("id")
-        commits = projects_gateway.get_project_commits(project_id, params=params)
-        new_commits = []
-        for commit in commits:
-            commit_date = commit.get("created_at") or commit.get("committed_date")
-            if not commit_date:
-                continue
-            # Filtrer explicitement côté Python
-            if last_date:
-                if commit_date > last_date:
-                    new_commits.append(commit)
-            else:
-                new_commits.append(commit)
-            if not max_commit_date or commit_date > max_commit_date:
-                max_commit_date = commit_date
-        all_commits[project_id] = new_commits
-    print(f"[DEBUG] last_date: {last_date}, max_commit_date: {max_commit_date}")
-    if max_commit_date and max_commit_date != last_date:
-        set_last_extraction_date("commits", max_commit_date)
-        print(f"[INFO] Date de dernière extraction mise à jour: {max_commit_date}")
-    else:
-        print("[INFO] Aucune nouvelle date à enregistrer.")
-    return all_commits
+def fetch_all_projects_members(projects_gateway, params=None, engine=None, catalog=None):
+    return _fetch_resource_by_project_name(projects_gateway, "members", params=params, engine=engine, catalog=catalog)
 
 # --- Ajout: gestion de la date d'extraction incrémentielle généralisée ---
 def get_last_extraction_date(resource_name):
@@ -293,105 +237,247 @@ def set_last_extraction_date(resource_name, date_str):
     with open(path, "w", encoding="utf-8") as f:
         f.write(date_str)
 
-def fetch_all_projects_resource_incremental(projects_gateway, resource, params=None, date_field="updated_at", api_param="updated_after"):
+def _seen_keys_path(resource_name):
+    return f"data/last_extraction_{resource_name}_seen.json"
+
+def get_seen_keys(resource_name):
     """
-    Extraction incrémentielle générique pour une ressource projet (issues, merge_requests, pipelines...).
-    Seuls les éléments dont la date (date_field) est postérieure à la dernière extraction sont retournés.
+    Récupère les clés ('id@date') des éléments déjà livrés dans la fenêtre de
+    recouvrement de la dernière extraction d'une ressource.
     """
-    last_date = get_last_extraction_date(resource)
-    projects = projects_gateway.get_projects(params={"membership": True})
-    all_items = {}
-    max_date = last_date
-    for p in projects:
-        project_id = p.get("id")
-        if resource == "merge_requests":
-            items = projects_gateway.get_project_merge_requests(project_id, params=params)
-        elif resource == "issues":
-            items = projects_gateway.get_project_issues(project_id, params=params)
-        elif resource == "pipelines":
-            items = projects_gateway.get_project_pipelines(project_id, params=params)
-        elif resource == "branches":
-            items = projects_gateway.get_project_branches(project_id, params=params)
-        else:
-            items = []
-        filtered_items = []
+    path = _seen_keys_path(resource_name)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return set(json.load(f))
+    return set()
+
+def set_seen_keys(resource_name, keys):
+    """
+    Sauvegarde les clés des éléments livrés dans la fenêtre de recouvrement.
+    """
+    path = _seen_keys_path(resource_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sorted(keys), f)
+
+def _incremental_key(item, date_value):
+    """Clé de dédoublonnage : identifiant (SHA pour les commits, nom pour les branches) et date de l'élément."""
+    identifier = item.get('id') if item.get('id') is not None else item.get('name')
+    return f"{identifier}@{date_value}"
+
+def _overlap_start(date_str, overlap_minutes=DEFAULT_INCREMENTAL_OVERLAP_MINUTES):
+    """Début de la fenêtre de recouvrement précédant une date, ou None si illisible."""
+    try:
+        return _as_aware(parse_date(date_str)) - timedelta(minutes=overlap_minutes)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def _as_aware(value):
+    """Ajoute le fuseau UTC aux dates naïves pour permettre les comparaisons."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+class IncrementalDelta:
+    """
+    Sélection incrémentielle d'une ressource, calculée élément par élément.
+
+    Les éléments datés de la fenêtre de recouvrement (watermark moins
+    'overlap_minutes') sont conservés, sauf ceux déjà livrés lors de la
+    précédente extraction (même identifiant et même date). La date maximale
+    observée devient le nouveau watermark.
+    """
+
+    def __init__(self, resource_name, last_date, date_getter,
+                 overlap_minutes=DEFAULT_INCREMENTAL_OVERLAP_MINUTES):
+        self.resource_name = resource_name
+        self.last_date = last_date
+        self.date_getter = date_getter
+        self.overlap_minutes = overlap_minutes
+        self.threshold = _overlap_start(last_date, overlap_minutes) if last_date else None
+        self.seen = get_seen_keys(resource_name) if self.threshold else set()
+        self.max_date = last_date
+        self.candidate_keys = set()
+
+    def keep(self, item):
+        """Indique si un élément fait partie du delta et met à jour le watermark."""
+        item_date = self.date_getter(item)
+        if not item_date:
+            return False
+        if not self.max_date or item_date > self.max_date:
+            self.max_date = item_date
+        item_start = _overlap_start(item_date, 0)
+        # Seuls les éléments postérieurs à l'ancien recouvrement peuvent tomber dans le nouveau
+        if self.threshold is None or item_start is None or item_start >= self.threshold:
+            self.candidate_keys.add(_incremental_key(item, item_date))
+        if self.threshold is None:
+            return True
+        return item_start is None or (
+            item_start >= self.threshold and _incremental_key(item, item_date) not in self.seen
+        )
+
+    def track(self, items, selected):
+        """Relaie un flux d'éléments en ajoutant ceux du delta à la liste 'selected'."""
         for item in items:
-            item_date = item.get(date_field)
-            if not item_date:
-                continue
-            if last_date:
-                if item_date > last_date:
-                    filtered_items.append(item)
-            else:
-                filtered_items.append(item)
-            if not max_date or item_date > max_date:
-                max_date = item_date
-        all_items[project_id] = filtered_items
-    print(f"[DEBUG] {resource} last_date: {last_date}, max_date: {max_date}")
-    if max_date and max_date != last_date:
-        set_last_extraction_date(resource, max_date)
-        print(f"[INFO] Date de dernière extraction {resource} mise à jour: {max_date}")
-    else:
-        print(f"[INFO] Aucune nouvelle date à enregistrer pour {resource}.")
-    return all_items
+            if self.keep(item):
+                selected.append(item)
+            yield item
+
+    def commit(self):
+        """Enregistre le nouveau watermark et les clés livrées dans sa fenêtre de recouvrement."""
+        print(f"[DEBUG] {self.resource_name} last_date: {self.last_date}, max_date: {self.max_date}")
+        if self.max_date and self.max_date != self.last_date:
+            set_last_extraction_date(self.resource_name, self.max_date)
+            print(f"[INFO] Date de dernière extraction {self.resource_name} mise à jour: {self.max_date}")
+        else:
+            print(f"[INFO] Aucune nouvelle date à enregistrer pour {self.resource_name}.")
+        _store_seen_keys(self.resource_name, self.candidate_keys, self.max_date, self.overlap_minutes)
 
-def fetch_all_projects_events(projects_gateway, params=None):
+def _store_seen_keys(resource_name, keys, watermark, overlap_minutes=DEFAULT_INCREMENTAL_OVERLAP_MINUTES):
+    """
+    Mémorise, parmi les clés déjà connues et 'keys', celles situées dans la
+    fenêtre de recouvrement du nouveau watermark.
+    """
+    window_start = _overlap_start(watermark, overlap_minutes) if watermark else None
+    if window_start is None:
+        return
+    keys = set(get_seen_keys(resource_name)) | set(keys)
+
+    def in_window(key):
+        key_start = _overlap_start(key.rsplit("@", 1)[-1], 0)
+        return key_start is not None and key_start >= window_start
+
+    set_seen_keys(resource_name, {key for key in keys if in_window(key)})
+
+def fetch_all_projects_events(projects_gateway, params=None, engine=None, catalog=None):
     """
     Récupère tous les events pour chaque projet.
     :return: dict {project_id: [events]}
     """
-    projects = projects_gateway.get_projects(params={"membership": True})
+    projects = _list_projects(projects_gateway, {"membership": True}, catalog)
     print(f"[DEBUG] Nombre de projets extraits : {len(projects)}")
+    events_by_project = _get_engine(projects_gateway, engine).fetch_resource(projects, "events", params=params)
     all_events = {}
     for p in projects:
         project_id = p.get("id")
         project_name = p.get("name")
-        events = projects_gateway.get_project_events(project_id, params=params)
+        events = events_by_project[project_id]
         # Conversion en dict si besoin
         events_dicts = [e.attributes if hasattr(e, "attributes") else e for e in events]
         all_events[project_id] = events_dicts
         print(f"[DEBUG] {project_name} ({project_id}): {len(events_dicts)} events")
     return all_events
 
-def fetch_all_projects_events_incremental(projects_gateway, params=None, date_field="created_at", api_param="after"):
+# Plan d'extraction en une passe : chaque (projet, ressource) n'est téléchargé qu'une fois.
+# C'est le seul chemin d'extraction incrémentielle des ressources projet : le delta est
+# dérivé du parcours complet qui alimente l'export full.
+# 'layout' donne la forme de l'export full : "project" -> {id: {"project", <ressource>}},
+# "name" -> {nom: [...]}, "id" -> {id: [...]}. 'date' pilote le delta incrémentiel.
+EXTRACTION_PLAN = {
+    "commits": {
+        "full_file": "projects_commits_full.json",
+        "incremental_file": "projects_commits_incremental.json",
+        "layout": "project",
+        "date": lambda commit: commit.get("created_at") or commit.get("committed_date"),
+    },
+    "pipelines": {
+        "full_file": "projects_pipelines_full.json",
+        "incremental_file": "projects_pipelines_incremental.json",
+        "layout": "name",
+        "date": lambda pipeline: pipeline.get("updated_at"),
+    },
+    "issues": {
+        "full_file": "projects_issues_full.json",
+        "incremental_file": "projects_issues_incremental.json",
+        "layout": "name",
+        "date": lambda issue: issue.get("updated_at"),
+    },
+    "branches": {
+        "full_file": "projects_branches_full.json",
+        "incremental_file": "projects_branches_incremental.json",
+        "layout": "name",
+        "date": lambda branch: (branch.get("commit") or {}).get("committed_date"),
+    },
+    "merge_requests": {
+        "full_file": "projects_merge_requests_full.json",
+        "incremental_file": "projects_merge_requests_incremental.json",
+        "layout": "name",
+        "date": lambda merge_request: merge_request.get("updated_at"),
+    },
+    "members": {
+        "full_file": "projects_members_full.json",
+        "incremental_file": None,
+        "layout": "name",
+        "date": None,
+    },
+    "events": {
+        "full_file": "projects_events_full.json",
+        "incremental_file": "projects_events_incremental.json",
+        "layout": "id",
+        "date": lambda event: event.get("created_at"),
+    },
+}
+
+def extract_resource_single_pass(projects_gateway, projects, resource, spec, engine=None, accumulator=None):
     """
-    Extraction incrémentielle des events pour chaque projet.
+    Extrait une ressource une seule fois pour tous les projets et en dérive
+    l'export full (écrit en flux), le delta incrémentiel et les comptes.
+
+    :param projects: Liste des projets à traiter
+    :param resource: Ressource (clé de EXTRACTION_PLAN)
+    :param spec: Entrée de EXTRACTION_PLAN pour la ressource
+    :param accumulator: GitLabStatsAccumulator alimenté par le delta incrémentiel (optionnel)
+    :return: dict {nom de projet: nombre d'éléments}
     """
-    last_date = get_last_extraction_date("events")
-    projects = projects_gateway.get_projects(params={"membership": True})
-    all_events = {}
-    max_date = last_date
-    for p in projects:
-        project_id = p.get("id")
-        project_name = p.get("name")
-        events = projects_gateway.get_project_events(project_id, params=params)
-        # Conversion en dict pour chaque event
-        events_dicts = [e.attributes if hasattr(e, "attributes") else e for e in events]
-        filtered_events = []
-        for event in events_dicts:
-            event_date = event.get(date_field)
-            if not event_date:
-                continue
-            if last_date:
-                if event_date > last_date:
-                    filtered_events.append(event)
+    delta = None
+    if spec.get("incremental_file"):
+        delta = IncrementalDelta(resource, get_last_extraction_date(resource), spec["date"])
+    by_id = {project['id']: project for project in projects}
+    counts = {}
+    incremental = {}
+
+    def entries():
+        stream = _get_engine(projects_gateway, engine).stream_resource(projects, resource)
+        for project_id, count, items in stream:
+            project = by_id[project_id]
+            counts[project['name']] = count
+            print(f"[DEBUG] {project['name']} ({project_id}): {count} {resource.replace('_', ' ')}")
+            if delta is not None:
+                items = delta.track(items, incremental.setdefault(project_id, []))
+            if spec["layout"] == "project":
+                yield project_id, {"project": project, resource: items}
+            elif spec["layout"] == "name":
+                yield project['name'], items
             else:
-                filtered_events.append(event)
-            if not max_date or event_date > max_date:
-                max_date = event_date
-        all_events[project_id] = filtered_events
-    print(f"[DEBUG] events last_date: {last_date}, max_date: {max_date}")
-    if max_date and max_date != last_date:
-        set_last_extraction_date("events", max_date)
-        print(f"[INFO] Date de dernière extraction events mise à jour: {max_date}")
-    else:
-        print(f"[INFO] Aucune nouvelle date à enregistrer pour events.")
-    return all_events
+                yield project_id, items
+
+    save_json_object_stream(entries(), spec["full_file"])
+    if delta is not None:
+        # Le watermark n'avance qu'une fois l'export full écrit en entier
+        delta.commit()
+        save_json(incremental, spec["incremental_file"])
+        if accumulator is not None:
+            changed = accumulator.ingest(resource, incremental)
+            print(f"[INFO] Accumulateurs {resource}: {changed} contributions mises à jour")
+    return counts
+
+def run_extraction_plan(projects_gateway, projects, engine=None, plan=None, accumulator=None):
+    """
+    Exécute le plan d'extraction en une passe pour toutes ses ressources.
 
-def fetch_all_users(users_gateway):
+    :return: dict {ressource: {nom de projet: nombre d'éléments}}
+    """
+    plan = plan or EXTRACTION_PLAN
+    counts = {}
+    for resource, spec in plan.items():
+        print(f"\n🗃️ Extraction des {resource.replace('_', ' ')} par projet (full + incrémentiel)...")
+        counts[resource] = extract_resource_single_pass(
+            projects_gateway, projects, resource, spec, engine, accumulator
+        )
+    return counts
+
+def fetch_all_users(users_gateway, email_cache=None, email_workers=DEFAULT_GITLAB_EMAIL_WORKERS):
     last_date = get_last_extraction_date("users")
     print("\n👥 Extraction incrémentielle des utilisateurs internes GitLab...")
-    all_users = users_gateway.get_all_users()
+    all_users = users_gateway.get_all_users(email_cache=email_cache, max_workers=email_workers)
     # Filtrage manuel par date
     if last_date:
         filtered_users = [
@@ -459,112 +545,129 @@ def main():
         "retry_delay": int(os.getenv("GITLAB_RETRY_DELAY", 2)),
         "verify_ssl": os.getenv("GITLAB_VERIFY_SSL", "true").lower() == "true"
     }
+    # Extraction concurrente : nombre de workers global et limites par ressource
+    max_workers = int(os.getenv("GITLAB_MAX_WORKERS", DEFAULT_GITLAB_MAX_WORKERS))
+    config["pool_maxsize"] = max_workers
+    # Gouverneur de débit partagé par tous les workers (clients synchrone et asynchrone)
+    rate_limit_governor = RateLimitGovernor(
+        rate_per_second=float(os.getenv("GITLAB_RATE_LIMIT_PER_SECOND", DEFAULT_GITLAB_RATE_LIMIT_PER_SECOND))
+    )
+    config["rate_limit_governor"] = rate_limit_governor
+    # Réponses conditionnelles (ETag / If-None-Match) pour les ressources qui changent peu
+    response_cache = None
+    if os.getenv("GITLAB_HTTP_CACHE", "true").lower() == "true":
+        response_cache = GitLabResponseCache(os.getenv("GITLAB_HTTP_CACHE_DIR", DEFAULT_GITLAB_HTTP_CACHE_DIR))
+    config["response_cache"] = response_cache
 
     client = GitLabClient(config)
-    projects_gateway = GitLabProjectsGateway(client)
+    # Statistiques de commits demandées à GitLab uniquement pour les SHA inconnus
+    commit_stats_store = GitLabCommitStatsStore()
+    projects_gateway = GitLabProjectsGateway(client, commit_stats_store=commit_stats_store)
     users_gateway = GitLabUsersGateway(client)  # Ajout pour users/groups
-
-    # 📥 Étape 1 : Projets
-    print("\n📂 Récupération des projets...")
-    projects = fetch_projects(projects_gateway, params={"membership": True})
-    save_json(projects, "projects.json")
-
-    # 📊 Étape 2 : Nombre de commits par projet
-    print("\n📈 Comptage des commits par projet...")
-    commits_count = fetch_projects_commits_count(projects_gateway, params={"membership": True})
-    save_json(commits_count, "commits_count.json")
-
-    # 📄 Étape 3 : Commits complets par projet
-    print("\n📄 Extraction des commits complets par projet...")
-    all_commits = fetch_all_projects_and_commits(projects_gateway, params={"membership": True})
-    save_json(all_commits, "projects_commits_full.json")
-
-    # 🧪 Étape 4 : Test complet des méthodes de ProjectsGateway
-    print("\n🧪 Tests des méthodes GitLab...")
-    tests = test_projects_gateway_methods(projects_gateway, params={"membership": True})
-    save_json(tests, "tests_methods.json")
-
-    # 🗃️ Étape 5 : Pipelines par projet
-    print("\n🗃️ Extraction des pipelines par projet...")
-    all_pipelines = fetch_all_projects_pipelines(projects_gateway, params={"membership": True})
-    save_json(all_pipelines, "projects_pipelines_full.json")
-
-    # 🗃️ Étape 6 : Issues par projet
-    print("\n🗃️ Extraction des issues par projet...")
-    all_issues = fetch_all_projects_issues(projects_gateway, params={"membership": True})
-    save_json(all_issues, "projects_issues_full.json")
-
-    # 🗃️ Étape 7 : Branches par projet
-    print("\n🗃️ Extraction des branches par projet...")
-    all_branches = fetch_all_projects_branches(projects_gateway, params={"membership": True})
-    save_json(all_branches, "projects_branches_full.json")
-
-    # 🗃️ Étape 8 : Merge Requests par projet
-    print("\n🗃️ Extraction des merge requests par projet...")
-    all_mrs = fetch_all_projects_merge_requests(projects_gateway, params={"membership": True})
-    save_json(all_mrs, "projects_merge_requests_full.json")
-
-    # 🗃️ Étape 9 : Membres par projet
-    print("\n🗃️ Extraction des membres par projet...")
-    all_members = fetch_all_projects_members(projects_gateway, params={"membership": True})
-    save_json(all_members, "projects_members_full.json")
-
-    # Extraction complète des events (full)
-    print("\n🗃️ Extraction des events par projet...")
-    all_events = fetch_all_projects_events(projects_gateway, params={"membership": True})
-    save_json(all_events, "projects_events_full.json")
-
-    # Extraction incrémentielle des commits
-    print("\n📄 Extraction incrémentielle des commits...")
-    all_commits_incremental = fetch_all_projects_commits_incremental(projects_gateway)
-    save_json(all_commits_incremental, "projects_commits_incremental.json")
-
-    # Extraction incrémentielle des merge requests
-    print("\n📄 Extraction incrémentielle des merge requests...")
-    all_mrs_incremental = fetch_all_projects_resource_incremental(
-        projects_gateway, "merge_requests", date_field="updated_at", api_param="updated_after"
-    )
-    save_json(all_mrs_incremental, "projects_merge_requests_incremental.json")
-
-    # Extraction incrémentielle des issues
-    print("\n📄 Extraction incrémentielle des issues...")
-    all_issues_incremental = fetch_all_projects_resource_incremental(
-        projects_gateway, "issues", date_field="updated_at", api_param="updated_after"
-    )
-    save_json(all_issues_incremental, "projects_issues_incremental.json")
-
-    # Extraction incrémentielle des pipelines
-    print("\n📄 Extraction incrémentielle des pipelines...")
-    all_pipelines_incremental = fetch_all_projects_resource_incremental(
-        projects_gateway, "pipelines", date_field="updated_at", api_param="updated_after"
-    )
-    save_json(all_pipelines_incremental, "projects_pipelines_incremental.json")
-
-    # Extraction incrémentielle des branches (si applicable)
-    print("\n📄 Extraction incrémentielle des branches...")
-    all_branches_incremental = fetch_all_projects_branches_incremental(projects_gateway)
-    save_json(all_branches_incremental, "projects_branches_incremental.json")
-
-    # Extraction incrémentielle des events
-    print("\n📄 Extraction incrémentielle des events...")
-    all_events_incremental = fetch_all_projects_events_incremental(projects_gateway)
-    save_json(all_events_incremental, "projects_events_incremental.json")
-
-    # Extraction des membres d'un groupe GitLab (non incrémental)
-    group_id = os.getenv("GITLAB_GROUP_ID")
-    if not group_id:
-        raise ValueError("❌ L'identifiant du groupe GitLab (GITLAB_GROUP_ID) est manquant dans le fichier .env.")
-    print(f"\n👥 Extraction des membres du groupe GitLab {group_id}...")
-    group_members = users_gateway.get_group_members(int(group_id))
-    print(f"[INFO] Nombre de membres dans le groupe : {len(group_members)}")
-    save_json(group_members, "group_members.json")
-
-    # Extraction incrémentielle des utilisateurs internes
-    fetch_all_users(users_gateway)
-
-    # Extraction incrémentielle des groupes
-    fetch_all_groups(users_gateway)
-
+    # Compteurs journaliers alimentés par les deltas (statistiques glissantes sans relecture)
+    stats_accumulator = None
+    if os.getenv("GITLAB_STATS_ACCUMULATORS", "true").lower() == "true":
+        stats_accumulator = GitLabStatsAccumulator(
+            os.getenv("GITLAB_STATS_ACCUMULATOR_FILE", DEFAULT_GITLAB_STATS_ACCUMULATOR_FILE)
+        )
+    resource_concurrency = _parse_resource_concurrency(os.getenv("GITLAB_RESOURCE_CONCURRENCY"))
+    deterministic = os.getenv("GITLAB_DETERMINISTIC_ORDER", "true").lower() == "true"
+    if os.getenv("GITLAB_ASYNC", "false").lower() == "true":
+        # Toutes les ressources de tous les projets dans une seule boucle d'événements
+        async_client = AsyncGitLabClient(
+            config,
+            max_concurrency=int(os.getenv("GITLAB_ASYNC_CONCURRENCY", DEFAULT_GITLAB_ASYNC_CONCURRENCY)),
+            rate_limit_governor=rate_limit_governor,
+            response_cache=response_cache,
+            commit_stats_store=commit_stats_store
+        )
+        engine = AsyncGitLabExtractionEngine(
+            async_client, resource_concurrency=resource_concurrency, deterministic=deterministic
+        )
+    else:
+        engine = GitLabExtractionEngine(
+            projects_gateway,
+            max_workers=max_workers,
+            resource_concurrency=resource_concurrency,
+            deterministic=deterministic
+        )
+    # Le moteur asynchrone (session HTTP et boucle d'événements) est fermé même si une étape échoue
+    try:
+        count_only = os.getenv("GITLAB_COUNT_ONLY", "false").lower() == "true"
+        # Catalogue de projets partagé par toutes les étapes (un seul listing par exécution)
+        catalog_params = {"membership": True}
+        if count_only:
+            # 'statistics.commit_count' fourni par le listing : aucune lecture de projet par ID
+            catalog_params["statistics"] = True
+        catalog = GitLabProjectCatalog(projects_gateway, params=catalog_params)
+
+        # 📥 Étape 1 : Projets
+        print("\n📂 Récupération des projets...")
+        projects = fetch_projects(projects_gateway, catalog=catalog)
+        save_json(projects, "projects.json")
+
+        if count_only:
+            # 📊 Comptage seul : statistiques des projets, sans téléchargement des commits
+            print("\n📈 Comptage des commits par projet...")
+            commits_count = fetch_projects_commits_count(projects_gateway, engine=engine, catalog=catalog)
+            save_json(commits_count, "commits_count.json")
+            return
+
+        # 🧪 Étape 2 : Test complet des méthodes de ProjectsGateway
+        print("\n🧪 Tests des méthodes GitLab...")
+        tests = test_projects_gateway_methods(projects_gateway, catalog=catalog)
+        save_json(tests, "tests_methods.json")
+
+        # 🗃️ Étape 3 : Ressources par projet en une passe (exports full, deltas incrémentiels, comptes)
+        counts = run_extraction_plan(projects_gateway, projects, engine=engine, accumulator=stats_accumulator)
+        save_json(counts["commits"], "commits_count.json")
+
+        # Extraction des membres d'un groupe GitLab (non incrémental)
+        group_id = os.getenv("GITLAB_GROUP_ID")
+        if not group_id:
+            raise ValueError("❌ L'identifiant du groupe GitLab (GITLAB_GROUP_ID) est manquant dans le fichier .env.")
+        print(f"\n👥 Extraction des membres du groupe GitLab {group_id}...")
+        group_members = users_gateway.get_group_members(int(group_id))
+        print(f"[INFO] Nombre de membres dans le groupe : {len(group_members)}")
+        save_json(group_members, "group_members.json")
+
+        # Extraction incrémentielle des utilisateurs internes
+        # Emails résolus une seule fois par version de fiche utilisateur (cache persistant)
+        fetch_all_users(
+            users_gateway,
+            email_cache=GitLabUserEmailCache(),
+            email_workers=int(os.getenv("GITLAB_EMAIL_WORKERS", DEFAULT_GITLAB_EMAIL_WORKERS))
+        )
+
+        # Extraction incrémentielle des groupes
+        fetch_all_groups(users_gateway)
+
+        request_stats = client.get_request_statistics()
+        print(
+            f"\n📡 Requêtes HTTP émises : {request_stats['http_requests']} "
+            f"({request_stats['avoided_project_lookups']} lectures de projet évitées)"
+        )
+        budget = rate_limit_governor.budget()
+        print(
+            f"📡 Budget de débit : {budget['server_remaining']} requêtes restantes côté serveur, "
+            f"débit {budget['rate_per_second']} req/s, {budget['rate_limited_responses']} réponses 429, "
+            f"{budget['throttled_seconds']}s d'attente imposée"
+        )
+        if response_cache is not None:
+            cache_stats = response_cache.statistics()
+            print(
+                f"📡 Cache HTTP conditionnel : {cache_stats['hits']} réponses 304 réutilisées "
+                f"sur {cache_stats['hits'] + cache_stats['misses']} (taux {cache_stats['hit_ratio']:.0%}), "
+                f"{cache_stats['bytes_saved'] / 1024:.1f} Ko non retéléchargés"
+            )
+    finally:
+        # Les statistiques déjà obtenues restent valables même si une étape a échoué
+        commit_stats_store.save()
+        if stats_accumulator is not None:
+            stats_accumulator.save()
+        if isinstance(engine, AsyncGitLabExtractionEngine):
+            print(f"📡 Requêtes HTTP asynchrones émises : {engine.client.request_count}")
+            engine.close()
     print("\n✅ Extraction terminée.")
 
 # Explication :
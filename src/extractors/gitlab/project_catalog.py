@@ -0,0 +1,48 @@
+"""
+Module contenant le catalogue de projets GitLab partagé par une exécution.
+
+Le catalogue récupère la liste des projets une seule fois et la met à
+disposition de toutes les étapes de l'extraction, au lieu de relancer un
+listing paginé complet à chaque étape.
+"""
+import logging
+from typing import Any, Dict, List, Optional
+
+from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+
+
+class GitLabProjectCatalog:
+    """
+    Catalogue des projets GitLab pour la durée d'une exécution.
+
+    La liste est chargée à la première demande puis conservée en mémoire.
+    """
+
+    def __init__(
+        self,
+        projects_gateway: GitLabProjectsGateway,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialise le catalogue.
+
+        Args:
+            projects_gateway: Passerelle d'accès aux projets GitLab
+            params: Paramètres de filtrage du listing des projets
+        """
+        self._logger = logging.getLogger(__name__)
+        self.gateway = projects_gateway
+        self.params = dict(params or {})
+        self._projects: Optional[List[Dict[str, Any]]] = None
+
+    def get_projects(self) -> List[Dict[str, Any]]:
+        """
+        Retourne la liste des projets, chargée une seule fois par exécution.
+        """
+        if self._projects is None:
+            self._projects = self.gateway.get_projects(params=self.params)
+            self._logger.info(f"Catalogue de projets chargé: {len(self._projects)} projets")
+        return self._projects
+
+    def __len__(self) -> int:
+        return len(self.get_projects())
@@ -1,8 +1,12 @@
 """
 Module contenant la passerelle pour l'accès aux projets GitLab.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+from dateutil.parser import parse as parse_date
+
+from src.core.constants import DEFAULT_GITLAB_COMMIT_STATS_RANGE_THRESHOLD, DEFAULT_GITLAB_ITEMS_PER_PAGE
+from src.extractors.gitlab.commit_stats_store import GitLabCommitStatsStore
 from src.extractors.gitlab.gitlab_client_improved import GitLabClient
 
 
@@ -11,8 +15,17 @@ class GitLabProjectsGateway:
     Passerelle pour accéder aux projets et leurs données associées dans GitLab.
     """
 
-    def __init__(self, gitlab_client: GitLabClient):
+    def __init__(self, gitlab_client: GitLabClient,
+                 commit_stats_store: Optional[GitLabCommitStatsStore] = None):
+        """
+        Args:
+            gitlab_client: Client GitLab
+            commit_stats_store: Store des statistiques de commits par SHA (optionnel).
+                S'il est fourni, les statistiques ne sont demandées à GitLab que
+                pour les commits inconnus du store.
+        """
         self.client = gitlab_client
+        self.commit_stats_store = commit_stats_store
 
     def get_projects(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -42,10 +55,17 @@ class GitLabProjectsGateway:
         parameters = params.copy() if params else {}
         if since:
             parameters["since"] = since
-        # Inclure les stats d'ajouts/suppressions pour chaque commit
-        if "with_stats" not in parameters:
-            parameters["with_stats"] = True
-        return self.client.get_project_commits(project_id, parameters)
+        commits = self.client.get_project_commits(project_id, parameters)
+        # Stats d'ajouts/suppressions : 'with_stats' explicite, sinon via le store par SHA
+        if "with_stats" not in parameters and self.commit_stats_store is not None:
+            self._attach_commit_stats(project_id, commits, parameters)
+        return commits
+
+    def get_project_commit_count(self, project_id: int) -> Optional[int]:
+        """
+        Compte les commits d'un projet à partir de ses statistiques (sans télécharger les commits).
+        """
+        return self.client.get_project_commit_count(project_id)
 
     def get_project_merge_requests(self, project_id: int, params: Optional[Dict[str, Any]] = None, updated_after: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -88,4 +108,103 @@ class GitLabProjectsGateway:
         # Maximiser le nombre d'items par page si la pagination n'est pas gérée en amont
         if "per_page" not in parameters:
             parameters["per_page"] = 100
-        return self.client.get_project_events(project_id, parameters or {})
\ No newline at end of file
+        return self.client.get_project_events(project_id, parameters or {})
+
+    def iter_project_commits(self, project_id: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les commits d'un projet page par page (mêmes paramètres que get_project_commits).
+        """
+        parameters = params.copy() if params else {}
+        if since:
+            parameters["since"] = since
+        if "with_stats" in parameters or self.commit_stats_store is None:
+            return self.client.iter_project_commits(project_id, parameters)
+        return self._iter_commits_with_stored_stats(project_id, parameters)
+
+    def _iter_commits_with_stored_stats(self, project_id: int, parameters: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Complète les statistiques des commits parcourus, une page à la fois."""
+        page_size = int(parameters.get("per_page", DEFAULT_GITLAB_ITEMS_PER_PAGE))
+        page = []
+        for commit in self.client.iter_project_commits(project_id, parameters):
+            page.append(commit)
+            if len(page) >= page_size:
+                yield from self._attach_commit_stats(project_id, page, parameters)
+                page = []
+        if page:
+            yield from self._attach_commit_stats(project_id, page, parameters)
+
+    def _attach_commit_stats(self, project_id: int, commits: List[Dict[str, Any]],
+                             parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Ajoute 'stats' aux commits à partir du store, en ne demandant à GitLab
+        que les statistiques des SHA inconnus.
+
+        Au-delà de DEFAULT_GITLAB_COMMIT_STATS_RANGE_THRESHOLD commits inconnus,
+        la plage de dates correspondante est relue avec 'with_stats' (une
+        requête par page) ; les commits restants sont lus un par un.
+        """
+        store = self.commit_stats_store
+        unknown = [c for c in commits if c.get("id") and store.get(c["id"]) is None]
+        if len(unknown) > DEFAULT_GITLAB_COMMIT_STATS_RANGE_THRESHOLD:
+            dates = [parse_date(c["committed_date"]) for c in unknown if c.get("committed_date")]
+            if dates:
+                ranged = {k: v for k, v in parameters.items() if k != "page"}
+                ranged.update(with_stats=True, since=min(dates).isoformat(), until=max(dates).isoformat())
+                for commit in self.client.iter_project_commits(project_id, ranged):
+                    if commit.get("stats"):
+                        store.store(commit["id"], commit["stats"])
+        for commit in unknown:
+            if store.get(commit["id"]) is None:
+                detail = self.client.get_project_commit(project_id, commit["id"])
+                if detail and detail.get("stats"):
+                    store.store(commit["id"], detail["stats"])
+        for commit in commits:
+            stats = store.get(commit.get("id"))
+            if stats is not None:
+                commit["stats"] = stats
+        return commits
+
+    def iter_project_merge_requests(self, project_id: int, params: Optional[Dict[str, Any]] = None, updated_after: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les merge requests d'un projet page par page.
+        """
+        parameters = params.copy() if params else {}
+        if updated_after:
+            parameters["updated_after"] = updated_after
+        return self.client.iter_project_merge_requests(project_id, parameters)
+
+    def iter_project_issues(self, project_id: int, params: Optional[Dict[str, Any]] = None, updated_after: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les issues d'un projet page par page.
+        """
+        parameters = params.copy() if params else {}
+        if updated_after:
+            parameters["updated_after"] = updated_after
+        return self.client.iter_project_issues(project_id, parameters)
+
+    def iter_project_pipelines(self, project_id: int, params: Optional[Dict[str, Any]] = None, updated_after: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les pipelines d'un projet page par page.
+        """
+        parameters = params.copy() if params else {}
+        if updated_after:
+            parameters["updated_after"] = updated_after
+        return self.client.iter_project_pipelines(project_id, parameters)
+
+    def iter_project_branches(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les branches d'un projet page par page.
+        """
+        return self.client.iter_project_branches(project_id, params)
+
+    def iter_project_members(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les membres d'un projet page par page.
+        """
+        return self.client.iter_project_members(project_id, params)
+
+    def iter_project_events(self, project_id: int, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les événements d'un projet page par page.
+        """
+        return self.client.iter_project_events(project_id, params)
@@ -0,0 +1,273 @@
+"""
+Module contenant le gouverneur de débit des appels à l'API GitLab.
+
+Le gouverneur est un seau à jetons partagé par tous les workers (threads du
+moteur d'extraction ou coroutines du client asynchrone). Son débit s'adapte
+aux en-têtes renvoyés par GitLab ('RateLimit-Remaining', 'RateLimit-Reset',
+'Retry-After') afin de rester sous la limite du serveur sans déclencher de
+rafales de réponses 429.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import requests
+
+from src.core.constants import (
+    DEFAULT_GITLAB_RATE_LIMIT_BURST,
+    DEFAULT_GITLAB_RATE_LIMIT_MAX_WAIT_SECONDS,
+    DEFAULT_GITLAB_RATE_LIMIT_PER_SECOND,
+    DEFAULT_GITLAB_RATE_LIMIT_RESERVE,
+    ERROR_MESSAGES,
+)
+from src.core.exceptions import APIRateLimitError
+
+# Débit plancher pour ne jamais bloquer définitivement les workers
+MIN_RATE_PER_SECOND = 0.1
+
+# Tolérance d'arrondi sur le nombre de jetons (évite des attentes infinitésimales)
+TOKEN_EPSILON = 1e-6
+
+
+class RateLimitGovernor:
+    """
+    Seau à jetons global piloté par les en-têtes de limite de débit GitLab.
+
+    Chaque requête consomme un jeton. Le débit de remplissage est plafonné par
+    'rate_per_second' et réduit pour répartir le budget restant annoncé par le
+    serveur jusqu'à son prochain reset. Une réponse 429 suspend tous les
+    workers jusqu'à la date indiquée par 'Retry-After' (ou 'RateLimit-Reset').
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_GITLAB_RATE_LIMIT_PER_SECOND,
+        burst: int = DEFAULT_GITLAB_RATE_LIMIT_BURST,
+        reserve: int = DEFAULT_GITLAB_RATE_LIMIT_RESERVE,
+        max_wait_seconds: float = DEFAULT_GITLAB_RATE_LIMIT_MAX_WAIT_SECONDS,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialise le gouverneur.
+
+        Args:
+            rate_per_second: Débit maximal (requêtes par seconde)
+            burst: Nombre maximal de jetons accumulés
+            reserve: Nombre de requêtes du budget serveur laissées intactes
+            max_wait_seconds: Attente maximale tolérée avant de lever APIRateLimitError
+            clock: Horloge (secondes depuis l'epoch), injectable pour les tests
+            sleep: Fonction d'attente bloquante, injectable pour les tests
+        """
+        self._logger = logging.getLogger(__name__)
+        self.max_rate = max(MIN_RATE_PER_SECOND, float(rate_per_second))
+        self.capacity = max(1, int(burst))
+        self.reserve = max(0, int(reserve))
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._rate = self.max_rate
+        self._tokens = float(self.capacity)
+        self._last_refill = clock()
+        self._paused_until = 0.0
+        self._server_limit: Optional[int] = None
+        self._server_remaining: Optional[int] = None
+        self._server_reset: Optional[float] = None
+        self._throttled_seconds = 0.0
+        self._rate_limited_responses = 0
+
+    # -----------------
+    # Consommation des jetons
+    # -----------------
+    def _refill(self, now: float) -> None:
+        """Ajoute les jetons accumulés depuis le dernier remplissage."""
+        elapsed = max(0.0, now - self._last_refill)
+        self._tokens = min(float(self.capacity), self._tokens + elapsed * self._rate)
+        self._last_refill = now
+
+    def reserve_token(self) -> float:
+        """
+        Tente de consommer un jeton sans bloquer.
+
+        Returns:
+            0 si un jeton a été consommé, sinon le délai (en secondes) à attendre
+            avant une nouvelle tentative
+
+        Raises:
+            APIRateLimitError: Si le délai dépasse l'attente maximale tolérée
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if self._paused_until - now > TOKEN_EPSILON:
+                wait = self._paused_until - now
+            elif self._tokens >= 1 - TOKEN_EPSILON:
+                self._tokens = max(0.0, self._tokens - 1)
+                return 0.0
+            else:
+                wait = (1 - self._tokens) / self._rate
+            self._throttled_seconds += wait
+        if self.max_wait_seconds is not None and wait > self.max_wait_seconds:
+            raise APIRateLimitError(ERROR_MESSAGES["RATE_LIMIT_EXCEEDED"].format(service="GitLab"))
+        return wait
+
+    def acquire(self) -> None:
+        """Bloque le thread appelant jusqu'à l'obtention d'un jeton."""
+        wait = self.reserve_token()
+        while wait > 0:
+            self._sleep(wait)
+            wait = self.reserve_token()
+
+    async def acquire_async(self) -> None:
+        """Suspend la coroutine appelante jusqu'à l'obtention d'un jeton."""
+        wait = self.reserve_token()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self.reserve_token()
+
+    # -----------------
+    # Adaptation aux en-têtes du serveur
+    # -----------------
+    @staticmethod
+    def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+        """Lit un en-tête numérique, ou retourne None s'il est absent ou invalide."""
+        value = headers.get(name)
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def observe(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        """
+        Met à jour le budget à partir d'une réponse du serveur.
+
+        Args:
+            status_code: Statut HTTP de la réponse
+            headers: En-têtes de la réponse
+        """
+        limit = self._header_number(headers, "RateLimit-Limit")
+        remaining = self._header_number(headers, "RateLimit-Remaining")
+        reset = self._header_number(headers, "RateLimit-Reset")
+        retry_after = self._header_number(headers, "Retry-After")
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if limit is not None:
+                self._server_limit = int(limit)
+            if reset is not None:
+                self._server_reset = reset
+            if remaining is not None:
+                self._server_remaining = int(remaining)
+                seconds_to_reset = max(1.0, (self._server_reset or now + 60) - now)
+                usable = max(0, int(remaining) - self.reserve)
+                # Répartit le budget restant jusqu'au reset, sans dépasser le débit configuré
+                self._rate = min(self.max_rate, max(MIN_RATE_PER_SECOND, usable / seconds_to_reset))
+                self._tokens = min(self._tokens, float(usable))
+                if usable == 0 and self._server_reset:
+                    self._paused_until = max(self._paused_until, self._server_reset)
+
+            if status_code == 429:
+                self._rate_limited_responses += 1
+                if retry_after is not None:
+                    resume_at = now + retry_after
+                elif self._server_reset and self._server_reset > now:
+                    resume_at = self._server_reset
+                else:
+                    resume_at = now + 60
+                self._paused_until = max(self._paused_until, resume_at)
+                self._tokens = 0.0
+                self._logger.warning(
+                    f"Limite de débit GitLab atteinte, pause globale de {resume_at - now:.1f}s"
+                )
+
+    # -----------------
+    # Métrique
+    # -----------------
+    def budget(self) -> Dict[str, Any]:
+        """
+        Retourne l'état courant du budget de requêtes.
+
+        Returns:
+            Dictionnaire avec les jetons disponibles, le débit courant, le
+            budget annoncé par le serveur, le temps total d'attente imposé et
+            le nombre de réponses 429 reçues
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                "tokens": round(self._tokens, 2),
+                "rate_per_second": round(self._rate, 3),
+                "server_limit": self._server_limit,
+                "server_remaining": self._server_remaining,
+                "server_reset": self._server_reset,
+                "paused_for_seconds": round(max(0.0, self._paused_until - now), 2),
+                "throttled_seconds": round(self._throttled_seconds, 2),
+                "rate_limited_responses": self._rate_limited_responses,
+            }
+
+
+class RateLimitedSession(requests.Session):
+    """
+    Session requests dont chaque requête passe par un RateLimitGovernor.
+
+    Destinée à être fournie à python-gitlab ('gitlab.Gitlab(session=...)').
+    Avec un GitLabResponseCache, les GET éligibles sont conditionnels et une
+    réponse 304 est remplacée par la réponse 200 mise en cache.
+    """
+
+    def __init__(self, governor: RateLimitGovernor, response_cache=None) -> None:
+        super().__init__()
+        self.governor = governor
+        self.response_cache = response_cache
+
+    def request(self, method, url, *args, **kwargs):
+        cache = self.response_cache
+        cacheable = cache is not None and not kwargs.get("stream") and cache.is_cacheable(method, url)
+        params = kwargs.get("params")
+        headers = kwargs.get("headers")
+        if cacheable:
+            conditional = cache.conditional_headers(url, params)
+            if conditional:
+                kwargs["headers"] = {**(headers or {}), **conditional}
+
+        response = self._governed_request(method, url, *args, **kwargs)
+        if not cacheable:
+            return response
+        if response.status_code == 304:
+            cached = cache.replay(url, params)
+            if cached is not None:
+                return self._cached_response(response, *cached)
+            # Entrée disparue entre l'envoi et la réponse : requête non conditionnelle
+            kwargs["headers"] = headers
+            response = self._governed_request(method, url, *args, **kwargs)
+        if response.status_code == 200:
+            cache.store(url, params, response.headers, response.content)
+        return response
+
+    def _governed_request(self, method, url, *args, **kwargs):
+        """Exécute une requête après obtention d'un jeton et met à jour le budget."""
+        self.governor.acquire()
+        response = super().request(method, url, *args, **kwargs)
+        self.governor.observe(response.status_code, response.headers)
+        return response
+
+    @staticmethod
+    def _cached_response(not_modified: requests.Response, headers: Mapping[str, Any],
+                         body: bytes) -> requests.Response:
+        """Construit une réponse 200 à partir d'une réponse 304 et de l'entrée de cache."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = body
+        response.headers = requests.structures.CaseInsensitiveDict(headers)
+        response.encoding = "utf-8"
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        return response
@@ -0,0 +1,202 @@
+"""
+Module contenant le cache disque des réponses HTTP conditionnelles GitLab.
+
+Les métadonnées de projets, les membres, les branches et les groupes changent
+rarement d'une exécution nocturne à l'autre. Le cache conserve, pour chaque
+URL et jeu de paramètres, le corps de la dernière réponse avec son 'ETag' et
+son 'Last-Modified'. La requête suivante envoie 'If-None-Match' /
+'If-Modified-Since' ; sur une réponse 304, le corps en cache est réutilisé.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.core.constants import DEFAULT_GITLAB_HTTP_CACHE_DIR, GITLAB_CONDITIONAL_CACHE_PATTERNS
+
+# En-têtes non rejoués : le corps est stocké décodé, sa longueur et son encodage changent
+EXCLUDED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "date"}
+
+
+class GitLabResponseCache:
+    """
+    Cache persistant (un fichier JSON par entrée) des réponses GET GitLab.
+
+    Seules les URLs correspondant à 'patterns' sont mises en cache. Le cache
+    est indépendant du client HTTP : les clients synchrone et asynchrone
+    appellent 'conditional_headers' avant la requête, puis 'store' sur une
+    réponse 200 ou 'replay' sur une réponse 304.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_GITLAB_HTTP_CACHE_DIR,
+        patterns: Iterable[str] = GITLAB_CONDITIONAL_CACHE_PATTERNS,
+    ) -> None:
+        """
+        Initialise le cache.
+
+        Args:
+            cache_dir: Dossier des entrées de cache
+            patterns: Expressions régulières des chemins d'API mis en cache
+                (chemin relatif à '/api/v4', ex: '/projects/12/members')
+        """
+        self._logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self._patterns = [re.compile(pattern) for pattern in patterns]
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    # -----------------
+    # Clés et éligibilité
+    # -----------------
+    def is_cacheable(self, method: str, url: str) -> bool:
+        """
+        Indique si une requête est éligible au cache.
+
+        Args:
+            method: Méthode HTTP
+            url: URL de la requête
+
+        Returns:
+            True pour un GET sur un chemin correspondant à l'un des motifs
+        """
+        if str(method).upper() != "GET":
+            return False
+        path = re.sub(r"^.*?/api/v4", "", urlsplit(str(url)).path).rstrip("/")
+        return any(pattern.search(path) for pattern in self._patterns)
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Mapping[str, Any]]) -> str:
+        """Calcule la clé d'une entrée à partir de l'URL et des paramètres triés."""
+        normalized = {str(k): str(v).lower() if isinstance(v, bool) else str(v)
+                      for k, v in (params or {}).items() if v is not None}
+        raw = json.dumps([str(url), sorted(normalized.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Charge une entrée, ou retourne None si elle est absente ou illisible."""
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Entrée de cache HTTP illisible ({path}), ignorée: {e}")
+            return None
+
+    # -----------------
+    # Cycle requête / réponse
+    # -----------------
+    def conditional_headers(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, str]:
+        """
+        Retourne les en-têtes conditionnels à envoyer pour une requête.
+
+        Args:
+            url: URL de la requête
+            params: Paramètres de la requête
+
+        Returns:
+            Dictionnaire 'If-None-Match' / 'If-Modified-Since' (vide sans entrée)
+        """
+        entry = self._load(self._cache_key(url, params))
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, params: Optional[Mapping[str, Any]],
+              headers: Mapping[str, Any], body: bytes) -> bool:
+        """
+        Enregistre une réponse 200 portant un validateur ('ETag' ou 'Last-Modified').
+
+        Args:
+            url: URL de la requête
+            params: Paramètres de la requête
+            headers: En-têtes de la réponse
+            body: Corps brut de la réponse
+
+        Returns:
+            True si la réponse a été mise en cache
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+
+        entry = {
+            "url": str(url),
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in EXCLUDED_HEADERS},
+            "body": text,
+        }
+        path = self._entry_path(self._cache_key(url, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Écriture atomique : plusieurs workers peuvent écrire des entrées en parallèle
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._misses += 1
+        return True
+
+    def replay(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """
+        Retourne la réponse en cache après un 304 et comptabilise le succès.
+
+        Args:
+            url: URL de la requête
+            params: Paramètres de la requête
+
+        Returns:
+            Tuple (en-têtes, corps) ou None si l'entrée a disparu
+        """
+        entry = self._load(self._cache_key(url, params))
+        if entry is None:
+            return None
+        body = entry["body"].encode("utf-8")
+        with self._lock:
+            self._hits += 1
+            self._bytes_saved += len(body)
+        return entry.get("headers", {}), body
+
+    # -----------------
+    # Métrique
+    # -----------------
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du cache pour l'exécution courante.
+
+        Returns:
+            Dictionnaire avec les succès (304), les réponses mises en cache,
+            le taux de succès et le volume de corps non retéléchargé
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / total, 3) if total else 0.0,
+                "bytes_saved": self._bytes_saved,
+            }
@@ -0,0 +1,401 @@
+"""
+Module contenant le store persistant des accumulateurs de statistiques GitLab.
+
+Plutôt que de relire l'historique brut des commits, merge requests, issues et
+pipelines à chaque calcul de fenêtre glissante, le store conserve pour chaque
+projet, chaque métrique et chaque jour un couple [nombre, somme]. Il est
+alimenté par les deltas de l'extraction incrémentielle ; les statistiques
+d'une période quelconque sont ensuite calculées à partir de ces compartiments.
+
+Un élément relivré (MR fusionnée après coup, pipeline terminé, élément de la
+fenêtre de recouvrement) remplace sa contribution précédente au lieu de
+s'y ajouter : la contribution de chaque élément est mémorisée par identifiant.
+Les commits, qui ne changent pas, ne sont dédoublonnés que par jour (SHA
+déjà comptés dans le compartiment du jour).
+
+Pour que ces mémoires ne grossissent pas avec l'historique, les jours plus
+anciens que la fenêtre de rétention sont figés par prune() : leurs
+compartiments ne sont plus modifiés, et les contributions ne portant que sur
+des jours figés ainsi que les SHA de ces jours sont oubliés.
+"""
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.constants import DEFAULT_GITLAB_STATS_ACCUMULATOR_FILE, DEFAULT_GITLAB_STATS_RETENTION_DAYS
+
+# Ressources alimentant les accumulateurs
+ACCUMULATED_RESOURCES = ("commits", "merge_requests", "issues", "pipelines")
+
+# Contribution d'un élément : liste de [métrique, jour (YYYY-MM-DD), valeur]
+Contribution = List[List[Any]]
+
+
+def _day(value: Optional[str]) -> Optional[str]:
+    """Retourne le jour local (YYYY-MM-DD) d'une date ISO 8601."""
+    return value[:10] if value else None
+
+
+def _hours_between(start: str, end: str) -> float:
+    """Retourne la durée en heures entre deux dates ISO 8601."""
+    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+    return (end_dt - start_dt).total_seconds() / 3600
+
+
+def item_contributions(resource: str, item: Dict[str, Any]) -> Contribution:
+    """
+    Calcule les contributions d'un élément aux accumulateurs.
+
+    Args:
+        resource: Ressource de l'élément (voir ACCUMULATED_RESOURCES)
+        item: Élément renvoyé par GitLab
+
+    Returns:
+        Liste de [métrique, jour, valeur] (vide si l'élément n'est pas daté)
+    """
+    contributions = []
+    if resource == 'commits':
+        day = _day(item.get('created_at') or item.get('committed_date'))
+        if day:
+            contributions.append(['commits', day, 0])
+
+    elif resource == 'merge_requests':
+        created_at = item.get('created_at')
+        if created_at:
+            contributions.append(['merge_requests_created', _day(created_at), 0])
+        merged_at = item.get('merged_at')
+        if item.get('state') == 'merged' and merged_at:
+            hours = _hours_between(created_at, merged_at) if created_at else 0
+            contributions.append(['merge_requests_merged', _day(merged_at), hours])
+
+    elif resource == 'issues':
+        created_at = item.get('created_at')
+        if created_at:
+            contributions.append(['issues_created', _day(created_at), 0])
+        closed_at = item.get('closed_at')
+        if item.get('state') == 'closed' and closed_at:
+            hours = _hours_between(created_at, closed_at) if created_at else 0
+            contributions.append(['issues_closed', _day(closed_at), hours])
+
+    elif resource == 'pipelines':
+        day = _day(item.get('created_at'))
+        if day:
+            status = item.get('status')
+            # Comme get_pipeline_stats : seule la durée des pipelines terminés compte
+            if status in ('success', 'failed'):
+                contributions.append([f'pipelines_{status}', day, item.get('duration') or 0])
+            else:
+                contributions.append(['pipelines_other', day, 0])
+
+    return contributions
+
+
+class GitLabStatsAccumulator:
+    """
+    Store persistant (fichier JSON) des accumulateurs de statistiques par jour.
+
+    Structure du fichier :
+    - buckets: {project_id: {métrique: {jour: [nombre, somme]}}}
+    - contributions: {ressource: {"project_id:item_id": [[métrique, jour, valeur], ...]}} (hors commits)
+    - commit_days: {project_id: {jour: [sha, ...]}}
+    - frozen_before: premier jour non figé (None tant que rien n'a été figé)
+    """
+
+    def __init__(
+        self,
+        store_file: str = DEFAULT_GITLAB_STATS_ACCUMULATOR_FILE,
+        retention_days: int = DEFAULT_GITLAB_STATS_RETENTION_DAYS,
+    ) -> None:
+        """
+        Initialise le store et charge les accumulateurs existants.
+
+        Args:
+            store_file: Chemin du fichier JSON du store
+            retention_days: Nombre de jours (avant aujourd'hui) dont les compartiments restent modifiables
+        """
+        self._logger = logging.getLogger(__name__)
+        self.store_file = store_file
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        data = self._load()
+        self._buckets: Dict[str, Dict[str, Dict[str, list]]] = data.get("buckets", {})
+        self._contributions: Dict[str, Dict[str, Contribution]] = data.get("contributions", {})
+        self._commit_days: Dict[str, Dict[str, List[str]]] = data.get("commit_days", {})
+        self._frozen_before: Optional[str] = data.get("frozen_before")
+        self._dirty = False
+        self._migrate_commit_contributions()
+
+    def _load(self) -> Dict[str, Any]:
+        """Charge le fichier du store, ou retourne un store vide s'il est absent ou illisible."""
+        if not os.path.exists(self.store_file):
+            return {}
+        try:
+            with open(self.store_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Store d'accumulateurs illisible ({self.store_file}), ignoré: {e}")
+            return {}
+
+    def _migrate_commit_contributions(self) -> None:
+        """Convertit les contributions de commits d'un ancien store en SHA par jour."""
+        legacy = self._contributions.pop("commits", None)
+        if not legacy:
+            return
+        for item_key, contributions in legacy.items():
+            project_key, sha = item_key.split(":", 1)
+            for _, day, _ in contributions:
+                self._commit_days.setdefault(project_key, {}).setdefault(day, []).append(sha)
+        self._dirty = True
+
+    # -----------------
+    # Alimentation
+    # -----------------
+    def _apply(self, project_id: str, contributions: Contribution, sign: int) -> None:
+        """Ajoute (sign=1) ou retire (sign=-1) des contributions aux compartiments."""
+        metrics = self._buckets.setdefault(project_id, {})
+        for metric, day, value in contributions:
+            days = metrics.setdefault(metric, {})
+            bucket = days.setdefault(day, [0, 0])
+            bucket[0] += sign
+            bucket[1] += sign * value
+            if bucket[0] == 0:
+                del days[day]
+
+    def _is_frozen(self, day: str) -> bool:
+        """Indique si le compartiment d'un jour est figé."""
+        return self._frozen_before is not None and day < self._frozen_before
+
+    def _open_part(self, contributions: Contribution) -> Contribution:
+        """Retourne les contributions portant sur des jours non figés."""
+        return [entry for entry in contributions if not self._is_frozen(entry[1])]
+
+    def ingest(self, resource: str, items_by_project: Dict[Any, Iterable[Dict[str, Any]]]) -> int:
+        """
+        Intègre le delta d'une extraction incrémentielle.
+
+        Seules les contributions portant sur des jours non figés modifient les
+        compartiments : un élément oublié puis relivré (MR commentée après sa
+        fusion, issue fermée longtemps après sa création) n'est pas recompté.
+
+        Args:
+            resource: Ressource extraite (les ressources hors ACCUMULATED_RESOURCES sont ignorées)
+            items_by_project: Éléments nouveaux ou modifiés, par projet
+
+        Returns:
+            Nombre d'éléments dont la contribution a changé
+        """
+        if resource not in ACCUMULATED_RESOURCES:
+            return 0
+        with self._lock:
+            if resource == 'commits':
+                changed = self._ingest_commits(items_by_project)
+            else:
+                changed = self._ingest_items(resource, items_by_project)
+            if changed:
+                self._dirty = True
+        return changed
+
+    def _ingest_commits(self, items_by_project: Dict[Any, Iterable[Dict[str, Any]]]) -> int:
+        """Compte les commits non encore vus dans le compartiment de leur jour."""
+        changed = 0
+        for project_id, items in items_by_project.items():
+            project_key = str(project_id)
+            for item in items:
+                day = _day(item.get('created_at') or item.get('committed_date'))
+                if item.get('id') is None or not day or self._is_frozen(day):
+                    continue
+                shas = self._commit_days.setdefault(project_key, {}).setdefault(day, [])
+                if item['id'] in shas:
+                    continue
+                shas.append(item['id'])
+                self._apply(project_key, [['commits', day, 0]], 1)
+                changed += 1
+        return changed
+
+    def _ingest_items(self, resource: str, items_by_project: Dict[Any, Iterable[Dict[str, Any]]]) -> int:
+        """Remplace la contribution des éléments (MRs, issues, pipelines) relivrés."""
+        changed = 0
+        known = self._contributions.setdefault(resource, {})
+        for project_id, items in items_by_project.items():
+            project_key = str(project_id)
+            for item in items:
+                if item.get('id') is None:
+                    continue
+                item_key = f"{project_key}:{item['id']}"
+                contributions = item_contributions(resource, item)
+                previous = known.get(item_key)
+                if previous == contributions:
+                    continue
+                previous_open = self._open_part(previous or [])
+                current_open = self._open_part(contributions)
+                if current_open:
+                    known[item_key] = contributions
+                else:
+                    known.pop(item_key, None)
+                if previous_open == current_open:
+                    continue
+                self._apply(project_key, previous_open, -1)
+                self._apply(project_key, current_open, 1)
+                changed += 1
+        return changed
+
+    def prune(self, before: Optional[str] = None) -> int:
+        """
+        Fige les jours antérieurs à la fenêtre de rétention et oublie leurs mémoires.
+
+        Args:
+            before: Premier jour conservé ouvert (YYYY-MM-DD, par défaut aujourd'hui
+                moins 'retention_days')
+
+        Returns:
+            Nombre de contributions et de jours de commits oubliés
+        """
+        cutoff = before or (date.today() - timedelta(days=self.retention_days)).isoformat()
+        removed = 0
+        with self._lock:
+            if self._frozen_before is None or cutoff > self._frozen_before:
+                self._frozen_before = cutoff
+                self._dirty = True
+            for known in self._contributions.values():
+                stale = [key for key, contributions in known.items() if not self._open_part(contributions)]
+                for key in stale:
+                    del known[key]
+                removed += len(stale)
+            for days in self._commit_days.values():
+                stale = [day for day in days if self._is_frozen(day)]
+                for day in stale:
+                    del days[day]
+                removed += len(stale)
+            self._commit_days = {project: days for project, days in self._commit_days.items() if days}
+            if removed:
+                self._dirty = True
+        return removed
+
+    def save(self) -> None:
+        """Fige les jours hors rétention puis écrit le store sur disque s'il a été modifié."""
+        self.prune()
+        with self._lock:
+            if not self._dirty:
+                return
+            folder = os.path.dirname(self.store_file)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.store_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    "buckets": self._buckets,
+                    "contributions": self._contributions,
+                    "commit_days": self._commit_days,
+                    "frozen_before": self._frozen_before,
+                }, f, separators=(",", ":"))
+            self._dirty = False
+
+    # -----------------
+    # Requêtes
+    # -----------------
+    def _daily(
+        self, metric: str, start_date: str, end_date: str, project_ids: Optional[Iterable[Any]]
+    ) -> Dict[str, Tuple[int, float]]:
+        """Retourne {jour: (nombre, somme)} d'une métrique sur la période, tous projets confondus."""
+        projects = self._buckets.keys() if project_ids is None else [str(p) for p in project_ids]
+        daily: Dict[str, list] = {}
+        for project_id in projects:
+            for day, (count, total) in self._buckets.get(project_id, {}).get(metric, {}).items():
+                if start_date <= day <= end_date:
+                    bucket = daily.setdefault(day, [0, 0])
+                    bucket[0] += count
+                    bucket[1] += total
+        return {day: (count, total) for day, (count, total) in sorted(daily.items())}
+
+    def _totals(self, metric: str, start_date: str, end_date: str,
+                project_ids: Optional[Iterable[Any]]) -> Tuple[int, float]:
+        """Retourne (nombre, somme) d'une métrique sur la période."""
+        daily = self._daily(metric, start_date, end_date, project_ids).values()
+        return sum(count for count, _ in daily), sum(total for _, total in daily)
+
+    def rolling_stats(
+        self,
+        start_date: str,
+        end_date: str,
+        project_ids: Optional[Iterable[Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Calcule les statistiques d'une période à partir des compartiments journaliers.
+
+        Chaque élément est daté par son événement : création pour les commits,
+        MRs, issues et pipelines, fusion pour le temps jusqu'à la fusion et
+        fermeture pour le temps jusqu'à la fermeture.
+
+        Args:
+            start_date: Date de début au format YYYY-MM-DD (incluse)
+            end_date: Date de fin au format YYYY-MM-DD (incluse)
+            project_ids: Projets à agréger (par défaut: tous les projets connus)
+
+        Returns:
+            Dictionnaire par famille (commits, merge_requests, issues, pipelines)
+        """
+        with self._lock:
+            commits = self._daily('commits', start_date, end_date, project_ids)
+            created_mrs, _ = self._totals('merge_requests_created', start_date, end_date, project_ids)
+            merged_mrs, merge_hours = self._totals('merge_requests_merged', start_date, end_date, project_ids)
+            created_issues, _ = self._totals('issues_created', start_date, end_date, project_ids)
+            closed_issues, close_hours = self._totals('issues_closed', start_date, end_date, project_ids)
+            pipelines = {
+                status: self._daily(f'pipelines_{status}', start_date, end_date, project_ids)
+                for status in ('success', 'failed', 'other')
+            }
+
+        days_count = (datetime.strptime(end_date, '%Y-%m-%d') -
+                      datetime.strptime(start_date, '%Y-%m-%d')).days + 1
+        total_commits = sum(count for count, _ in commits.values())
+
+        status_distribution = {
+            status: sum(count for count, _ in daily.values()) for status, daily in pipelines.items()
+        }
+        completed = status_distribution['success'] + status_distribution['failed']
+        completed_duration = sum(
+            total for status in ('success', 'failed') for _, total in pipelines[status].values()
+        )
+
+        # Regrouper par semaine (lundi) à partir des compartiments journaliers
+        weekly_distribution: Dict[str, Dict[str, int]] = {}
+        for status, daily in pipelines.items():
+            for day, (count, _) in daily.items():
+                day_dt = datetime.strptime(day, '%Y-%m-%d')
+                week_start = (day_dt - timedelta(days=day_dt.weekday())).strftime('%Y-%m-%d')
+                week = weekly_distribution.setdefault(
+                    week_start, {'total': 0, 'success': 0, 'failed': 0, 'other': 0}
+                )
+                week['total'] += count
+                week[status] += count
+
+        return {
+            'start_date': start_date,
+            'end_date': end_date,
+            'commits': {
+                'total_commits': total_commits,
+                'avg_commits_per_day': total_commits / days_count if days_count > 0 else 0,
+                'daily_activity': {day: count for day, (count, _) in commits.items()},
+            },
+            'merge_requests': {
+                'created_mrs': created_mrs,
+                'merged_mrs': merged_mrs,
+                'avg_time_to_merge': merge_hours / merged_mrs if merged_mrs > 0 else 0,
+            },
+            'issues': {
+                'created_issues': created_issues,
+                'closed_issues': closed_issues,
+                'avg_time_to_close': close_hours / closed_issues if closed_issues > 0 else 0,
+            },
+            'pipelines': {
+                'total_pipelines': sum(status_distribution.values()),
+                'status_distribution': status_distribution,
+                'success_rate': (status_distribution['success'] / completed) * 100 if completed > 0 else 0,
+                'avg_duration': completed_duration / completed if completed > 0 else 0,
+                'weekly_distribution': dict(sorted(weekly_distribution.items())),
+            },
+        }
@@ -8,6 +8,9 @@ métriques de pull requests, cycle de vie des issues, etc.
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.core.constants import STATS_BACKENDS
+from src.extractors.gitlab import vectorized_stats
+from src.extractors.gitlab.extraction_engine import GitLabExtractionEngine
 from src.extractors.gitlab.gitlab_client_improved import GitLabClient
 from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
 
@@ -22,16 +25,117 @@ class GitLabStatsExtractor:
     - Métriques de review (durée moyenne, taux d'approbation)
     - Métriques de cycle de vie des issues (temps de résolution)
     - Métriques de pipeline (taux de succès, durée)
+
+    Deux moteurs de calcul produisent des résultats identiques : "python"
+    (boucles élément par élément) et "pandas" (calcul vectorisé des issues et
+    des pipelines, voir vectorized_stats), à privilégier pour les projets
+    volumineux. Les statistiques de commits et de merge requests ne font
+    qu'un passage de lecture par élément, que la vectorisation n'accélère
+    pas : elles sont calculées par les boucles avec les deux moteurs.
     """
     
-    def __init__(self, projects_gateway: GitLabProjectsGateway):
+    def __init__(self, projects_gateway: GitLabProjectsGateway, backend: str = "python"):
         """
         Initialise l'extracteur avec une passerelle de projets GitLab.
         
         Args:
             projects_gateway: Passerelle permettant l'accès aux projets GitLab.
+            backend: Moteur de calcul des statistiques ("python" ou "pandas").
+
+        Raises:
+            ValueError: Si le moteur de calcul n'est pas supporté.
         """
+        if backend not in STATS_BACKENDS:
+            raise ValueError(f"Moteur de statistiques non supporté: {backend}. Moteurs supportés: {list(STATS_BACKENDS)}")
         self.gateway = projects_gateway
+        self.backend = backend
+
+    @staticmethod
+    def _default_period(start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, str]:
+        """Complète la période : fin à aujourd'hui et début 30 jours avant la fin par défaut."""
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        if not start_date:
+            start_date_obj = datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=30)
+            start_date = start_date_obj.strftime('%Y-%m-%d')
+        return start_date, end_date
+
+    def _compute_stats(
+        self, resource: str, items: List[Dict[str, Any]], start_date: str, end_date: str
+    ) -> Dict[str, Any]:
+        """Calcule une famille de statistiques avec le moteur configuré."""
+        pandas = self.backend == "pandas"
+        if resource == 'commits':
+            return self._commit_stats(items, start_date, end_date)
+        compute = {
+            'merge_requests': self._merge_request_stats,
+            'issues': vectorized_stats.issue_stats if pandas else self._issue_stats,
+            'pipelines': vectorized_stats.pipeline_stats if pandas else self._pipeline_stats,
+        }[resource]
+        return compute(items)
+
+    def get_portfolio_stats(
+        self,
+        project_ids: List[int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        engine: Optional[GitLabExtractionEngine] = None,
+    ) -> Dict[str, Any]:
+        """
+        Calcule les quatre familles de statistiques pour un ensemble de projets.
+
+        Les commits, merge requests, issues et pipelines de chaque projet sont
+        récupérés une seule fois, en parallèle via le moteur d'extraction,
+        avec les mêmes filtres que les méthodes unitaires. Toutes les
+        statistiques sont ensuite calculées à partir de ces données en mémoire.
+
+        Args:
+            project_ids: IDs des projets GitLab
+            start_date: Date de début au format YYYY-MM-DD (par défaut: 30 jours avant la fin)
+            end_date: Date de fin au format YYYY-MM-DD (par défaut: aujourd'hui)
+            engine: Moteur d'extraction à utiliser (par défaut: moteur créé sur la passerelle)
+
+        Returns:
+            Dictionnaire contenant:
+            - start_date / end_date: Période analysée
+            - projects: {project_id: {commits, merge_requests, issues, pipelines}},
+              chaque entrée ayant le format de la méthode unitaire correspondante
+            - global: Les quatre familles calculées sur l'ensemble des projets
+        """
+        start_date, end_date = self._default_period(start_date, end_date)
+        params_by_resource = {
+            'commits': {'since': start_date, 'until': end_date},
+            'merge_requests': {'created_after': start_date, 'created_before': end_date},
+            'issues': {'created_after': start_date, 'created_before': end_date},
+            'pipelines': {'updated_after': start_date, 'updated_before': end_date},
+        }
+        resources = list(params_by_resource)
+        projects = [{'id': project_id} for project_id in dict.fromkeys(project_ids)]
+
+        engine = engine or GitLabExtractionEngine(self.gateway)
+        data = engine.fetch_resources(projects, resources, params_by_resource)
+
+        portfolio = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'projects': {},
+            'global': {},
+        }
+        for project in projects:
+            project_data = data.get(project['id'], {})
+            portfolio['projects'][project['id']] = {
+                resource: self._compute_stats(resource, project_data.get(resource, []), start_date, end_date)
+                for resource in resources
+            }
+
+        # Agrégat global : les moyennes et répartitions sont recalculées sur l'ensemble
+        # des éléments plutôt que moyennées entre projets
+        for resource in resources:
+            items = [item for project in projects for item in data.get(project['id'], {}).get(resource, [])]
+            portfolio['global'][resource] = self._compute_stats(resource, items, start_date, end_date)
+        portfolio['global']['total_projects'] = len(projects)
+
+        return portfolio
     
     def get_commit_stats(
         self,
@@ -60,11 +164,7 @@ class GitLabStatsExtractor:
             - lines_changed: Estimation des lignes modifiées
         """
         # Définir les dates par défaut si non spécifiées
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        if not start_date:
-            start_date_obj = datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=30)
-            start_date = start_date_obj.strftime('%Y-%m-%d')
+        start_date, end_date = self._default_period(start_date, end_date)
         
         # Paramètres de filtrage pour les commits
         params = {
@@ -84,7 +184,12 @@ class GitLabStatsExtractor:
                 commit for commit in commits 
                 if commit.get('author_email', '').lower() == author_email.lower()
             ]
-        
+
+        return self._commit_stats(commits, start_date, end_date)
+
+    @staticmethod
+    def _commit_stats(commits: List[Dict[str, Any]], start_date: str, end_date: str) -> Dict[str, Any]:
+        """Calcule les statistiques de commits élément par élément (moteur "python")."""
         # Initialiser les statistiques
         stats = {
             'total_commits': len(commits),
@@ -168,7 +273,12 @@ class GitLabStatsExtractor:
         
         # Récupérer les merge requests
         mrs = self.gateway.get_project_merge_requests(project_id, params=params)
-        
+
+        return self._merge_request_stats(mrs)
+
+    @staticmethod
+    def _merge_request_stats(mrs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Calcule les statistiques de merge requests élément par élément (moteur "python")."""
         # Initialiser les statistiques
         stats = {
             'total_mrs': len(mrs),
@@ -291,7 +401,14 @@ class GitLabStatsExtractor:
         
         # Récupérer les issues
         issues = self.gateway.get_project_issues(project_id, params=params)
-        
+
+        if self.backend == "pandas":
+            return vectorized_stats.issue_stats(issues)
+        return self._issue_stats(issues)
+
+    @staticmethod
+    def _issue_stats(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Calcule les statistiques d'issues élément par élément (moteur "python")."""
         # Initialiser les statistiques
         stats = {
             'total_issues': len(issues),
@@ -424,7 +541,14 @@ class GitLabStatsExtractor:
         
         # Récupérer les pipelines
         pipelines = self.gateway.get_project_pipelines(project_id, params=params)
-        
+
+        if self.backend == "pandas":
+            return vectorized_stats.pipeline_stats(pipelines)
+        return self._pipeline_stats(pipelines)
+
+    @staticmethod
+    def _pipeline_stats(pipelines: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Calcule les statistiques de pipelines élément par élément (moteur "python")."""
         # Initialiser les statistiques
         stats = {
             'total_pipelines': len(pipelines),
@@ -0,0 +1,96 @@
+"""
+Module contenant le cache persistant des emails d'utilisateurs GitLab.
+
+La résolution d'un email manquant coûte jusqu'à deux requêtes par utilisateur
+('/users/:id?with_email' puis '/users/:id/emails'). Le cache conserve le
+résultat par ID d'utilisateur et 'updated_at' : un utilisateur dont la fiche
+n'a pas changé n'est jamais résolu une seconde fois.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.constants import DEFAULT_GITLAB_USER_EMAIL_CACHE_FILE
+
+
+class GitLabUserEmailCache:
+    """
+    Cache persistant (fichier JSON) des emails résolus par utilisateur.
+
+    Chaque entrée associe l'ID de l'utilisateur à la version de sa fiche
+    ('updated_at') et à l'email résolu, y compris un résultat vide afin de ne
+    pas relancer une résolution vouée à l'échec.
+    """
+
+    def __init__(self, cache_file: str = DEFAULT_GITLAB_USER_EMAIL_CACHE_FILE) -> None:
+        """
+        Initialise le cache et charge les entrées existantes.
+
+        Args:
+            cache_file: Chemin du fichier JSON de cache
+        """
+        self._logger = logging.getLogger(__name__)
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Charge le fichier de cache, ou retourne un cache vide s'il est absent ou illisible."""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Cache d'emails illisible ({self.cache_file}), ignoré: {e}")
+            return {}
+
+    def lookup(self, user: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Recherche l'email d'un utilisateur dont la fiche n'a pas changé.
+
+        Args:
+            user: Utilisateur GitLab (dictionnaire avec 'id' et 'updated_at')
+
+        Returns:
+            Tuple (trouvé, email) ; l'email peut être None si la résolution
+            précédente n'avait rien donné
+        """
+        entry = self._entries.get(str(user.get("id")))
+        if entry is None or entry.get("updated_at") != user.get("updated_at"):
+            return False, None
+        return True, entry.get("email")
+
+    def store(self, user: Dict[str, Any], email: Optional[str]) -> None:
+        """
+        Enregistre le résultat de la résolution d'email d'un utilisateur.
+
+        Args:
+            user: Utilisateur GitLab
+            email: Email résolu, ou None
+        """
+        with self._lock:
+            self._entries[str(user.get("id"))] = {
+                "updated_at": user.get("updated_at"),
+                "email": email,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Écrit le cache sur disque s'il a été modifié."""
+        with self._lock:
+            if not self._dirty:
+                return
+            folder = os.path.dirname(self.cache_file)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2, ensure_ascii=False)
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
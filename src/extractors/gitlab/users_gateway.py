@@ -1,9 +1,13 @@
 """
 Module contenant la passerelle pour l'accès aux utilisateurs GitLab.
 """
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.core.constants import DEFAULT_GITLAB_EMAIL_WORKERS
+from src.core.exceptions import APIRateLimitError
 from src.extractors.gitlab.gitlab_client_improved import GitLabClient
+from src.extractors.gitlab.user_email_cache import GitLabUserEmailCache
 
 
 class GitLabUsersGateway:
@@ -32,17 +36,24 @@ class GitLabUsersGateway:
             # Utilisez la méthode http_get de l'objet _gitlab_client
             response = self.client._gitlab_client.http_get(endpoint, params=params or {})
             return response if isinstance(response, list) else []
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.client._logger.error(f"Erreur lors de la récupération des membres du groupe {group_id}: {e}")
             return []
 
-    def get_all_users(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def get_all_users(self, params: Optional[Dict[str, Any]] = None,
+                      email_cache: Optional[GitLabUserEmailCache] = None,
+                      max_workers: int = DEFAULT_GITLAB_EMAIL_WORKERS) -> List[Dict[str, Any]]:
         """
-        Récupère tous les utilisateurs internes de l'instance GitLab (pagination gérée).
+        Récupère tous les utilisateurs internes de l'instance GitLab (pagination keyset gérée).
         Note: l'attribut 'email' n'est renvoyé par GitLab que pour un admin et avec 'with_email=true'.
+        Les emails manquants sont complétés après le listing par enrich_user_emails.
 
         Args:
             params: Paramètres de filtrage optionnels.
+            email_cache: Cache persistant des emails résolus (optionnel).
+            max_workers: Nombre de résolutions d'email simultanées.
 
         Returns:
             Liste de dictionnaires représentant les utilisateurs internes.
@@ -57,32 +68,76 @@ class GitLabUsersGateway:
                 params["with_email"] = True  # booléen
             endpoint = "/users"
             all_users = []
-            page = 1
-            while True:
-                params["page"] = page
-                response = self.client._gitlab_client.http_get(endpoint, params=params)
-                if not response or not isinstance(response, list):
-                    break
-
-                # Enrichissement: compléter les emails manquants
-                for u in response:
-                    if not (u.get("email") or u.get("public_email")):
-                        resolved = self._fetch_user_email(u.get("id"))
-                        if resolved:
-                            u["email"] = resolved
-
+            # Pagination keyset (tri par id) avec repli automatique sur l'offset
+            for response in self.client.iter_http_pages(endpoint, params=params, resource_type="users"):
                 all_users.extend(response)
-                if len(response) < params["per_page"]:
-                    break
-                page += 1
-            return all_users
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.client._logger.error(f"Erreur lors de la récupération des utilisateurs: {e}")
             return []
 
+        # Enrichissement: compléter les emails manquants (étape séparée, concurrente)
+        self.enrich_user_emails(all_users, email_cache=email_cache, max_workers=max_workers)
+        return all_users
+
+    def enrich_user_emails(self, users: List[Dict[str, Any]],
+                           email_cache: Optional[GitLabUserEmailCache] = None,
+                           max_workers: int = DEFAULT_GITLAB_EMAIL_WORKERS) -> int:
+        """
+        Complète l'email des utilisateurs qui n'en exposent aucun.
+
+        Les utilisateurs présents dans le cache avec le même 'updated_at' sont
+        complétés sans requête ; les autres sont résolus en parallèle puis
+        enregistrés dans le cache, qui est sauvegardé en fin d'étape.
+
+        Args:
+            users: Utilisateurs à compléter (modifiés en place).
+            email_cache: Cache persistant des emails résolus (optionnel).
+            max_workers: Nombre de résolutions d'email simultanées.
+
+        Returns:
+            Nombre d'utilisateurs résolus via l'API (les échecs de requête
+            ne sont pas mis en cache et seront retentés).
+        """
+        to_resolve = []
+        for u in users:
+            if u.get("email") or u.get("public_email"):
+                continue
+            if email_cache is not None:
+                found, cached_email = email_cache.lookup(u)
+                if found:
+                    if cached_email:
+                        u["email"] = cached_email
+                    continue
+            to_resolve.append(u)
+
+        resolved_count = 0
+        if to_resolve:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                lookups = list(executor.map(lambda u: self._fetch_user_email(u.get("id")), to_resolve))
+            for u, (resolved, email) in zip(to_resolve, lookups):
+                if not resolved:
+                    # Échec de la requête : non mis en cache, retenté à la prochaine exécution
+                    continue
+                resolved_count += 1
+                if email:
+                    u["email"] = email
+                if email_cache is not None:
+                    email_cache.store(u, email)
+
+        if email_cache is not None:
+            email_cache.save()
+        self.client._logger.info(
+            f"Emails utilisateurs: {resolved_count} résolus via l'API, "
+            f"{len(to_resolve) - resolved_count} en échec, "
+            f"{sum(1 for u in users if not (u.get('email') or u.get('public_email')))} sans email"
+        )
+        return resolved_count
+
     def get_all_groups(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
-        Récupère tous les groupes de l'instance GitLab (pagination gérée).
+        Récupère tous les groupes de l'instance GitLab (pagination keyset gérée).
 
         Args:
             params: Paramètres de filtrage optionnels.
@@ -97,49 +152,57 @@ class GitLabUsersGateway:
             params["per_page"] = 100
             endpoint = "/groups"
             all_groups = []
-            page = 1
-            while True:
-                params["page"] = page
-                response = self.client._gitlab_client.http_get(endpoint, params=params)
-                if not response or not isinstance(response, list):
-                    break
+            # Pagination keyset (tri par nom) avec repli automatique sur l'offset
+            for response in self.client.iter_http_pages(endpoint, params=params, resource_type="groups"):
                 all_groups.extend(response)
-                if len(response) < params["per_page"]:
-                    break
-                page += 1
             return all_groups
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.client._logger.error(f"Erreur lors de la récupération des groupes: {e}")
             return []
 
-    def _fetch_user_email(self, user_id: Optional[int]) -> Optional[str]:
+    def _fetch_user_email(self, user_id: Optional[int]) -> Tuple[bool, Optional[str]]:
         """
         Tente de récupérer l'email d'un utilisateur via des endpoints admins.
         Ordre:
           1) GET /users/:id?with_email=true
           2) GET /users/:id/emails (prend 'primary' si disponible, sinon le premier)
+
+        Returns:
+            Tuple (résolu, email) : 'résolu' vaut False si aucune requête n'a
+            permis de conclure (erreur HTTP, timeout, droits insuffisants), et
+            True avec un email None si l'utilisateur n'a réellement aucun email
+
+        Raises:
+            APIRateLimitError: Si le budget de requêtes est épuisé
         """
         if not user_id:
-            return None
+            return True, None
         try:
             # 1) Détail utilisateur avec 'with_email=true'
             detail = self.client._gitlab_client.http_get(f"/users/{user_id}", params={"with_email": True})
             if isinstance(detail, dict):
                 if detail.get("email"):
-                    return detail["email"]
+                    return True, detail["email"]
                 # parfois 'public_email' peut suffire
                 if detail.get("public_email"):
-                    return detail["public_email"]
+                    return True, detail["public_email"]
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.client._logger.debug(f"Impossible de récupérer /users/{user_id} (with_email): {e}")
 
         try:
-            # 2) Liste des emails de l'utilisateur
+            # 2) Liste des emails de l'utilisateur (fait foi, même vide)
             emails = self.client._gitlab_client.http_get(f"/users/{user_id}/emails", params={"per_page": 100})
-            if isinstance(emails, list) and emails:
-                primary = next((em for em in emails if em.get("primary")), None)
-                return (primary or emails[0]).get("email")
+        except APIRateLimitError:
+            raise
         except Exception as e:
             self.client._logger.debug(f"Impossible de récupérer /users/{user_id}/emails: {e}")
+            return False, None
 
-        return None
+        if isinstance(emails, list) and emails:
+            primary = next((em for em in emails if em.get("primary")), None)
+            return True, (primary or emails[0]).get("email")
+        return True, None
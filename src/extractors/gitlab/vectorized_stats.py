@@ -0,0 +1,223 @@
+"""
+Module contenant le calcul vectorisé (pandas / numpy) des statistiques de projets GitLab.
+
+Chaque fonction reçoit la liste brute des objets renvoyés par la passerelle
+et produit exactement le même dictionnaire que la méthode correspondante de
+GitLabStatsExtractor en moteur "python" : mêmes clés, mêmes types Python,
+même ordre des entrées (tri décroissant stable, égalités dans l'ordre
+d'apparition) et mêmes sommes flottantes.
+
+Seules les statistiques d'issues et de pipelines sont vectorisées : celles
+de commits et de merge requests se réduisent à un passage de lecture par
+élément, dont la boucle Python est déjà le coût minimal.
+
+Les objets sont chargés colonne par colonne : chaque champ utile (y compris
+les champs imbriqués comme 'author.username') est lu une seule fois par une
+compréhension de liste, sans construire de DataFrame ni aplatir les objets
+entiers (json_normalize), dont le coût dépasse celui de la boucle Python.
+Dates, sommes et regroupements hebdomadaires sont ensuite calculés
+par numpy, les comptages par pandas.
+"""
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Mots-clés de priorité, par niveau, dans l'ordre d'évaluation des labels
+PRIORITY_KEYWORDS = (
+    ("critical", ("critical",)),
+    ("high", ("high", "important")),
+    ("medium", ("medium", "normal")),
+    ("low", ("low", "minor")),
+)
+
+# Statuts de pipeline comptés individuellement (les autres sont regroupés dans 'other')
+PIPELINE_STATUSES = ("success", "failed", "canceled", "running", "pending", "skipped")
+
+
+def _values(records: List[Dict[str, Any]], key: str, default: Any) -> List[Any]:
+    """Lit une colonne en reproduisant 'dict.get(clé, défaut)'."""
+    return [record.get(key, default) for record in records]
+
+
+def _nested_values(records: List[Dict[str, Any]], key: str, subkey: str, default: Any) -> List[Any]:
+    """Lit un champ imbriqué en reproduisant 'dict.get(clé, {}).get(sous-clé, défaut)'."""
+    return [record.get(key, {}).get(subkey, default) for record in records]
+
+
+def _counts(values: Iterable[Any]) -> pd.Series:
+    """Compte les occurrences dans l'ordre de première apparition."""
+    return pd.Series(list(values), dtype=object).value_counts(sort=False, dropna=False)
+
+
+def _ranked_counts(values: Iterable[Any]) -> Dict[Any, int]:
+    """
+    Compte les occurrences et les trie par fréquence décroissante.
+
+    Args:
+        values: Valeurs à compter
+
+    Returns:
+        Dictionnaire {valeur: occurrences}, les égalités restant dans l'ordre
+        de première apparition
+    """
+    counts = _counts(values).sort_values(ascending=False, kind="stable")
+    return {key: int(count) for key, count in counts.items()}
+
+
+def _ordered_sum(values: Sequence[Any]) -> Any:
+    """Somme dans l'ordre des éléments, comme sum() : résultat flottant identique au moteur "python"."""
+    if len(values) == 0:
+        return 0
+    return np.cumsum(np.asarray(values))[-1].item()
+
+
+def _parse_datetimes(values: List[str]) -> np.ndarray:
+    """
+    Convertit des dates ISO 8601 en datetime64 (microsecondes, UTC).
+
+    Les dates UTC de l'API ('...Z') sont converties par numpy ; les autres
+    (décalage horaire explicite) par datetime.fromisoformat.
+    """
+    naive = [value[:-1] for value in values if value[-1:] == 'Z']
+    if len(naive) == len(values):
+        return np.array(naive, dtype='datetime64[us]')
+    utc = []
+    for value in values:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        utc.append(parsed)
+    return np.array(utc, dtype='datetime64[us]')
+
+
+def _hours_between(start: List[str], end: List[str]) -> np.ndarray:
+    """Retourne les durées en heures entre deux colonnes de dates ISO 8601."""
+    if not start:
+        return np.empty(0)
+    microseconds = (_parse_datetimes(end) - _parse_datetimes(start)).astype(np.int64)
+    # Mêmes opérations flottantes que timedelta.total_seconds() / 3600
+    return microseconds / 10**6 / 3600
+
+
+def issue_stats(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Calcule les statistiques d'issues.
+
+    Args:
+        issues: Issues du projet
+
+    Returns:
+        Dictionnaire identique à GitLabStatsExtractor.get_issue_stats
+    """
+    states = _counts(_values(issues, 'state', ''))
+    closed_count = int(states.get('closed', 0))
+
+    timed = [
+        (issue['created_at'], issue['closed_at']) for issue in issues
+        if issue.get('state', '') == 'closed' and issue.get('created_at') and issue.get('closed_at')
+    ]
+    total_time_to_close = _ordered_sum(_hours_between([c for c, _ in timed], [e for _, e in timed]))
+
+    # Une ligne par couple (issue, label) ; 'owners' donne la position de l'issue
+    label_lists = _values(issues, 'labels', [])
+    labels = list(chain.from_iterable(label_lists))
+    owners = np.repeat(np.arange(len(issues)), [len(issue_labels) for issue_labels in label_lists])
+
+    # Les labels distincts sont peu nombreux : niveau de priorité et correspondance
+    # exacte à un mot-clé sont évalués une fois par label distinct puis propagés
+    codes, distinct = pd.factorize(pd.Series(labels, dtype=object))
+    lowered = pd.Series(distinct, dtype=object).str.lower()
+
+    # Chaque label compte pour le premier niveau de priorité dont il contient un mot-clé
+    levels = [level for level, _ in PRIORITY_KEYWORDS]
+    conditions = [
+        lowered.str.contains('|'.join(keywords), regex=True).to_numpy(dtype=bool)
+        for _, keywords in PRIORITY_KEYWORDS
+    ]
+    distinct_levels = np.select(conditions, list(range(len(levels))), default=len(levels))
+    level_counts = np.bincount(distinct_levels.take(codes), minlength=len(levels) + 1)
+
+    # Sans priorité : aucun label n'est exactement un mot-clé
+    keywords = [keyword for _, level_keywords in PRIORITY_KEYWORDS for keyword in level_keywords]
+    is_keyword = lowered.isin(keywords).to_numpy(dtype=bool).take(codes)
+    prioritized = np.bincount(owners[is_keyword], minlength=len(issues)) > 0
+    no_priority = len(issues) - int(prioritized.sum())
+
+    assignees = [
+        assignee for assignee in _nested_values(issues, 'assignee', 'username', 'Unassigned')
+        if assignee != 'Unassigned'
+    ]
+
+    priority_distribution = {level: int(count) for level, count in zip(levels, level_counts)}
+    priority_distribution['no_priority'] = no_priority
+
+    return {
+        'total_issues': len(issues),
+        'open_issues': int(states.get('opened', 0)),
+        'closed_issues': closed_count,
+        'avg_time_to_close': total_time_to_close / closed_count if closed_count > 0 else 0,
+        'issues_by_label': _ranked_counts(labels),
+        'issues_by_author': _ranked_counts(_nested_values(issues, 'author', 'username', 'Unknown')),
+        'issues_by_assignee': _ranked_counts(assignees),
+        'priority_distribution': priority_distribution,
+    }
+
+
+def pipeline_stats(pipelines: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Calcule les statistiques de pipelines.
+
+    Args:
+        pipelines: Pipelines du projet
+
+    Returns:
+        Dictionnaire identique à GitLabStatsExtractor.get_pipeline_stats
+    """
+    statuses = _values(pipelines, 'status', 'other')
+    status_counts = _counts(statuses)
+    status_distribution = {name: int(status_counts.get(name, 0)) for name in PIPELINE_STATUSES}
+    status_distribution['other'] = len(pipelines) - sum(status_distribution.values())
+
+    # Pipelines terminés (succès ou échec), durées non nulles sommées dans l'ordre
+    completed_count = status_distribution['success'] + status_distribution['failed']
+    total_duration = _ordered_sum([
+        pipeline['duration'] for pipeline, status in zip(pipelines, statuses)
+        if status in ('success', 'failed') and pipeline.get('duration')
+    ])
+
+    # Semaine calendaire (lundi) de la date locale de création :
+    # colonne semaine * 3 + catégorie (succès, échec, autre) comptée par bincount
+    dated = [
+        (created_at[:10], status) for created_at, status in zip(_values(pipelines, 'created_at', None), statuses)
+        if created_at
+    ]
+    weekly_distribution = {}
+    if dated:
+        days = np.array([day for day, _ in dated], dtype='datetime64[D]')
+        # Le 1970-01-01 (jour 0) est un jeudi : jour de la semaine = (jour + 3) % 7
+        week_start = days - (days.astype(np.int64) + 3) % 7
+        weeks, week_codes = np.unique(week_start, return_inverse=True)
+        category = {'success': 0, 'failed': 1}
+        categories = np.array([category.get(status, 2) for _, status in dated])
+        weekly = np.bincount(week_codes * 3 + categories, minlength=len(weeks) * 3).reshape(-1, 3)
+        weekly_distribution = {
+            week: {
+                'total': int(success + failed + other),
+                'success': int(success),
+                'failed': int(failed),
+                'other': int(other),
+            }
+            for week, (success, failed, other) in zip(np.datetime_as_string(weeks, unit='D').tolist(), weekly)
+        }
+
+    return {
+        'total_pipelines': len(pipelines),
+        'status_distribution': status_distribution,
+        'success_rate': (status_distribution['success'] / completed_count) * 100 if completed_count > 0 else 0,
+        'avg_duration': total_duration / completed_count if completed_count > 0 else 0,
+        'pipelines_by_ref': _ranked_counts(_values(pipelines, 'ref', 'Unknown')),
+        'weekly_distribution': weekly_distribution,
+    }
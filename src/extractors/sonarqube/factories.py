@@ -13,8 +13,17 @@ from src.extractors.base_extractor import BaseExtractor
 from src.core.exceptions import ExtractionError
 
 from src.core.config import ConfigManager
+from src.core.constants import (
+    DEFAULT_SONARQUBE_MAX_WORKERS,
+    SONARQUBE_COVERAGE_METRICS,
+    SONARQUBE_QUALITY_GATE_METRICS,
+    SONARQUBE_QUALITY_METRICS,
+)
+from src.extractors.sonarqube.issues_harvester import SonarQubeIssuesHarvester
+from src.extractors.sonarqube.parallel import map_projects
 from src.extractors.sonarqube.sonarqube_client import SonarQubeClient
 from src.extractors.sonarqube.projects_gateway import SonarQubeProjectsGateway
+from src.extractors.sonarqube.snapshot_store import SonarQubeSnapshotStore
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +42,7 @@ class SonarQubeClientFactory:
         password: Optional[str] = None,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
     ) -> SonarQubeClient:
         """
         Créer une instance de SonarQubeClient à partir de la configuration.
@@ -45,6 +55,8 @@ class SonarQubeClientFactory:
             password: Mot de passe SonarQube (optionnel, remplace la config)
             timeout: Délai d'attente en secondes (optionnel, remplace la config)
             max_retries: Nombre maximal de tentatives (optionnel, remplace la config)
+            pool_maxsize: Taille du pool de connexions (optionnel, remplace la config ;
+                par défaut le nombre de workers 'max_workers' de la config)
             
         Returns:
             SonarQubeClient: Instance configurée du client SonarQube
@@ -60,6 +72,7 @@ class SonarQubeClientFactory:
         final_password = password or config.get("password")
         final_timeout = timeout or config.get("timeout", 30)
         final_max_retries = max_retries or config.get("max_retries", 3)
+        final_pool_maxsize = pool_maxsize or config.get("pool_maxsize") or config.get("max_workers")
         
         if not final_api_url:
             raise ValueError("L'URL de l'API SonarQube n'est pas définie")
@@ -70,6 +83,9 @@ class SonarQubeClientFactory:
             "timeout": final_timeout,
             "max_retries": final_max_retries,
         }
+        if final_pool_maxsize:
+            # Une connexion par worker de l'extraction concurrente
+            client_params["pool_maxsize"] = int(final_pool_maxsize)
         
         # Privilégier l'authentification par token si disponible
         if final_token:
@@ -90,33 +106,50 @@ class SonarQubeGatewayFactory:
     """
     
     @staticmethod
-    def create_projects_gateway(client: Optional[SonarQubeClient] = None) -> SonarQubeProjectsGateway:
+    def create_projects_gateway(
+        client: Optional[SonarQubeClient] = None,
+        harvest_issues: bool = True,
+        max_workers: int = 1,
+    ) -> SonarQubeProjectsGateway:
         """
         Créer une instance de SonarQubeProjectsGateway.
         
         Args:
             client: Instance de SonarQubeClient (optionnel, créé automatiquement si non fourni)
+            harvest_issues: Si True, les issues sont récupérées par tranches de dates
+                au-delà de la fenêtre de 10 000 résultats d'api/issues/search
+            max_workers: Nombre maximal de tranches d'issues interrogées simultanément
             
         Returns:
             SonarQubeProjectsGateway: Instance de la passerelle de projets SonarQube
         """
         if client is None:
             client = SonarQubeClientFactory.create_client()
+
+        harvester = SonarQubeIssuesHarvester(client, max_workers=max_workers) if harvest_issues else None
             
         logger.info("Création d'une passerelle de projets SonarQube")
-        return SonarQubeProjectsGateway(client)
+        return SonarQubeProjectsGateway(client, issues_harvester=harvester)
 
 class SonarQubeExtractor(BaseExtractor):
     """
     Extracteur SonarQube basé sur BaseExtractor.
     Orchestration de l'extraction des projets, métriques, issues, branches, etc.
+
+    Les projets sont extraits en parallèle par 'max_workers' threads (config,
+    DEFAULT_SONARQUBE_MAX_WORKERS par défaut) partageant la session du client,
+    dont le pool de connexions est dimensionné en conséquence. Avec
+    max_workers=1, l'extraction est séquentielle.
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
         super().__init__(config)
+        self.max_workers = max(1, int(config.get("max_workers", DEFAULT_SONARQUBE_MAX_WORKERS)))
         try:
             self.client = SonarQubeClientFactory.create_client(config=config)
-            self.projects = SonarQubeGatewayFactory.create_projects_gateway(self.client)
+            self.projects = SonarQubeGatewayFactory.create_projects_gateway(
+                self.client, max_workers=self.max_workers
+            )
         except Exception as e:
             raise ExtractionError(f"Erreur d'initialisation SonarQubeExtractor: {e}")
 
@@ -144,40 +177,65 @@ class SonarQubeExtractor(BaseExtractor):
         include_quality_gate: bool = True,
         include_activity: bool = False,
         branch: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        snapshot_store: Optional[SonarQubeSnapshotStore] = None,
     ) -> List[Dict[str, Any]]:
         """
         Extraction "full" par projet: détails, métriques (qualité + couverture), issues, branches, quality gate, activité CE.
+
+        Les projets sont extraits en parallèle (max_workers, par défaut celui de
+        l'extracteur) ; les résultats restent dans l'ordre des projets.
+
+        Avec un snapshot_store, l'extraction est incrémentielle : un projet dont
+        le 'lastAnalysisDate' (projects/search) n'a pas changé depuis la
+        précédente extraction avec les mêmes options reprend l'extraction
+        conservée ; seuls les projets analysés depuis sont interrogés, puis
+        enregistrés dans le store (à sauvegarder par l'appelant). Les
+        changements sans nouvelle analyse (transition manuelle d'une issue)
+        ne sont pris en compte qu'à la prochaine analyse du projet.
         """
         if not self.is_connected and not self.connect():
             raise ExtractionError("Non connecté à SonarQube.")
 
         # Métriques intéressantes par défaut
-        quality_metrics = [
-            "bugs","reliability_rating","vulnerabilities","security_rating","security_hotspots",
-            "security_hotspots_reviewed","code_smells","sqale_index","sqale_debt_ratio",
-            "sqale_rating",
-            "duplicated_lines_density","duplicated_blocks",
-            "cognitive_complexity","complexity",
-        ]
-        coverage_metrics = [
-            "coverage","line_coverage","branch_coverage","uncovered_lines","lines_to_cover",
-            "uncovered_conditions","conditions_to_cover","tests","test_success_density",
-            "test_failures","test_errors","skipped_tests","test_execution_time",
-        ]
-        all_metrics = quality_metrics + coverage_metrics
-
-        projects = self.projects.get_projects(organization=organization, project_keys=project_keys)
-        results: List[Dict[str, Any]] = []
-
-        for comp in projects:
-            proj_key = comp.get("key") or comp.get("project", {}).get("key")
-            if not proj_key:
-                continue
-
+        all_metrics = SONARQUBE_QUALITY_METRICS + SONARQUBE_COVERAGE_METRICS
+
+        projects = self._keyed_projects(
+            self.projects.get_projects(organization=organization, project_keys=project_keys)
+        )
+
+        options = {
+            "include_issues": include_issues,
+            "include_branches": include_branches,
+            "include_quality_gate": include_quality_gate,
+            "include_activity": include_activity,
+            "branch": branch,
+        }
+        reused: Dict[str, Dict[str, Any]] = {}
+        if snapshot_store is not None:
+            for comp in projects:
+                proj_key = self._project_key(comp)
+                snapshot = snapshot_store.get(proj_key, comp.get("lastAnalysisDate"), options)
+                if snapshot is not None:
+                    # Les détails du projet (nom, visibilité...) restent ceux du listing courant
+                    reused[proj_key] = {**snapshot, "project": comp}
+            logger.info(f"{len(reused)} projets SonarQube non réanalysés, extraction précédente réutilisée")
+        to_extract = [comp for comp in projects if self._project_key(comp) not in reused]
+
+        # Mesures globales des projets à extraire en quelques requêtes groupées (measures/search),
+        # avec le statut de Quality Gate qui évite un appel par projet
+        gate_metrics = SONARQUBE_QUALITY_GATE_METRICS if include_quality_gate else []
+        measures = self.projects.get_projects_metrics(
+            [self._project_key(comp) for comp in to_extract], all_metrics + gate_metrics, branch=branch
+        ) if to_extract else {}
+
+        def extract_project(comp: Dict[str, Any]) -> Dict[str, Any]:
+            proj_key = self._project_key(comp)
             item: Dict[str, Any] = {"project": comp}
 
             # Mesures globales du projet
-            item["measures"] = self.projects.get_project_metrics(proj_key, all_metrics, branch=branch)
+            project_measures = measures.get(proj_key, {"component": {"key": proj_key, "measures": []}})
+            item["measures"] = self._without_metrics(project_measures, gate_metrics)
 
             # Issues du projet (optionnel)
             if include_issues:
@@ -186,21 +244,51 @@ class SonarQubeExtractor(BaseExtractor):
                     branch=branch,
                 )
 
-            # Branches (optionnel)
-            if include_branches:
-                item["branches"] = self.projects.get_project_branches(proj_key)
-
-            # Quality Gate (optionnel)
+            # Branches et Quality Gate (optionnels) : le statut est repris des mesures
+            # ou de la liste des branches avant d'interroger qualitygates/project_status
             if include_quality_gate:
-                item["quality_gate"] = self.projects.get_quality_gate_status(proj_key, branch=branch)
+                combined = self.projects.get_project_branches_and_quality_gate(
+                    proj_key, branch=branch, measures=project_measures, include_branches=include_branches
+                )
+                if include_branches:
+                    item["branches"] = combined["branches"]
+                item["quality_gate"] = combined["quality_gate"]
+            elif include_branches:
+                item["branches"] = self.projects.get_project_branches(proj_key)
 
             # Activité CE (optionnel)
             if include_activity:
                 item["ce_activity"] = self.projects.get_compute_engine_activity(proj_key, branch=branch, only_current=False)
 
-            results.append(item)
+            return item
+
+        extracted = map_projects(extract_project, to_extract, max_workers or self.max_workers)
+        if snapshot_store is None:
+            return extracted
 
-        return results
+        for comp, item in zip(to_extract, extracted):
+            snapshot_store.store(self._project_key(comp), comp.get("lastAnalysisDate"), options, item)
+        extracted_by_key = {self._project_key(comp): item for comp, item in zip(to_extract, extracted)}
+        return [reused.get(self._project_key(comp)) or extracted_by_key[self._project_key(comp)] for comp in projects]
+
+    @staticmethod
+    def _without_metrics(project_measures: Dict[str, Any], metrics: List[str]) -> Dict[str, Any]:
+        """Retire des mesures d'un projet les métriques données (format 'measures/component')."""
+        if not metrics:
+            return project_measures
+        component = dict(project_measures.get("component", {}))
+        component["measures"] = [m for m in component.get("measures", []) if m.get("metric") not in metrics]
+        return {**project_measures, "component": component}
+
+    @staticmethod
+    def _project_key(comp: Dict[str, Any]) -> Optional[str]:
+        """Retourne la clé d'un projet de projects/search."""
+        return comp.get("key") or comp.get("project", {}).get("key")
+
+    @classmethod
+    def _keyed_projects(cls, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Retourne les projets dont la clé est connue (les autres sont ignorés)."""
+        return [comp for comp in projects if cls._project_key(comp)]
 
     def extract_incremental(
         self,
@@ -210,6 +298,7 @@ class SonarQubeExtractor(BaseExtractor):
         branch: Optional[str] = None,
         include_history_metrics: bool = True,
         include_new_issues: bool = True,
+        max_workers: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Extraction incrémentielle:
@@ -220,18 +309,14 @@ class SonarQubeExtractor(BaseExtractor):
             raise ExtractionError("Non connecté à SonarQube.")
 
         projects = self.projects.get_projects(project_keys=project_keys)
-        results: List[Dict[str, Any]] = []
 
         # Métriques par défaut pour l'historique
         history_metrics = [
             "bugs","vulnerabilities","code_smells","coverage","duplicated_lines_density"
         ]
 
-        for comp in projects:
+        def extract_project(comp: Dict[str, Any]) -> Dict[str, Any]:
             proj_key = comp.get("key") or comp.get("project", {}).get("key")
-            if not proj_key:
-                continue
-
             inc: Dict[str, Any] = {"project": {"key": proj_key, "name": comp.get("name")}}
 
             if include_history_metrics:
@@ -257,6 +342,6 @@ class SonarQubeExtractor(BaseExtractor):
                     branch=branch,
                 )
 
-            results.append(inc)
+            return inc
 
-        return results
+        return map_projects(extract_project, self._keyed_projects(projects), max_workers or self.max_workers)
@@ -0,0 +1,200 @@
+"""
+Module contenant la récupération exhaustive des issues SonarQube.
+
+api/issues/search refuse de paginer au-delà de 10 000 résultats : une requête
+plus large est tronquée. Le moissonneur découpe donc la requête en tranches
+de dates de création (createdAfter inclus, createdBefore exclu), récursivement
+jusqu'à ce que chaque tranche tienne dans la fenêtre ; une tranche réduite à
+une seconde est ensuite découpée par sévérité puis par type. Les tranches
+sont interrogées en parallèle et les issues fusionnées sans doublon (clé).
+"""
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.constants import (
+    SONARQUBE_ISSUE_SEVERITIES,
+    SONARQUBE_ISSUE_TYPES,
+    SONARQUBE_ISSUES_PAGE_SIZE,
+    SONARQUBE_ISSUES_SEARCH_WINDOW,
+)
+from src.extractors.sonarqube.parallel import map_projects
+from src.extractors.sonarqube.sonarqube_client import SonarQubeClient
+
+logger = logging.getLogger(__name__)
+
+ISSUES_ENDPOINT = "issues/search"
+
+# Format de date accepté par createdAfter/createdBefore
+SONARQUBE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# Découpages appliqués à une tranche d'une seconde, dans l'ordre
+FACET_SPLITS = (
+    ("severities", SONARQUBE_ISSUE_SEVERITIES),
+    ("types", SONARQUBE_ISSUE_TYPES),
+)
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Convertit une date SonarQube (YYYY-MM-DD ou date-heure ISO 8601) en date-heure UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _format_datetime(value: datetime) -> str:
+    """Formate une date-heure pour createdAfter/createdBefore."""
+    return value.strftime(SONARQUBE_DATETIME_FORMAT)
+
+
+class SonarQubeIssuesHarvester:
+    """
+    Récupère toutes les issues d'une recherche, au-delà de la fenêtre de 10 000 résultats.
+    """
+
+    def __init__(
+        self,
+        client: SonarQubeClient,
+        max_workers: int = 1,
+        window: int = SONARQUBE_ISSUES_SEARCH_WINDOW,
+        page_size: int = SONARQUBE_ISSUES_PAGE_SIZE,
+    ) -> None:
+        """
+        Initialise le moissonneur.
+
+        Args:
+            client: Instance de SonarQubeClient pour les requêtes API
+            max_workers: Nombre maximal de tranches interrogées simultanément
+            window: Nombre maximal de résultats accessibles par pagination
+            page_size: Taille des pages demandées (paramètre 'ps', 500 au plus)
+        """
+        self.client = client
+        self.max_workers = max(1, int(max_workers))
+        self.window = window
+        self.page_size = page_size
+
+    def harvest(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Récupère toutes les issues correspondant aux paramètres de recherche.
+
+        Args:
+            params: Paramètres de api/issues/search (componentKeys, types, createdAfter, ...)
+
+        Returns:
+            Issues dédoublonnées par clé, par tranche de création croissante
+        """
+        base = {key: value for key, value in params.items() if key not in ("p", "ps")}
+        pending = [(base, self._page(base, 1))]
+        ready: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
+        # Découpage niveau par niveau : les premières pages des sous-tranches
+        # servent à la fois de comptage et de première page de résultats
+        while pending:
+            children = []
+            for slice_params, first_page in pending:
+                total = self._total(first_page)
+                if total <= self.window:
+                    ready.append((slice_params, first_page))
+                    continue
+                parts = self._split(slice_params)
+                if parts:
+                    children.extend(parts)
+                else:
+                    logger.warning(
+                        f"Issue slice {slice_params} still matches {total} issues, "
+                        f"only the first {self.window} are retrieved"
+                    )
+                    ready.append((slice_params, first_page))
+            if children:
+                logger.info(f"Splitting issue search into {len(children)} slices")
+            first_pages = map_projects(lambda part: self._page(part, 1), children, self.max_workers)
+            pending = list(zip(children, first_pages))
+
+        slices = map_projects(lambda item: self._collect(*item), ready, self.max_workers)
+
+        issues: List[Dict[str, Any]] = []
+        seen = set()
+        for slice_issues in slices:
+            for issue in slice_issues:
+                key = issue.get("key")
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                issues.append(issue)
+        return issues
+
+    # -----------------
+    # Pagination
+    # -----------------
+    def _page(self, params: Dict[str, Any], page: int) -> Dict[str, Any]:
+        """Récupère une page de résultats d'une tranche."""
+        response = self.client.get(ISSUES_ENDPOINT, params={**params, "p": page, "ps": self.page_size})
+        return response if isinstance(response, dict) else {"issues": response or []}
+
+    @staticmethod
+    def _total(response: Dict[str, Any]) -> int:
+        """Retourne le nombre total de résultats annoncé par une page."""
+        paging = response.get("paging") or {}
+        return int(paging.get("total", response.get("total", len(response.get("issues", [])))))
+
+    def _collect(self, params: Dict[str, Any], first_page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Récupère toutes les issues d'une tranche à partir de sa première page."""
+        issues = list(first_page.get("issues", []))
+        reachable = min(self._total(first_page), self.window)
+        for page in range(2, math.ceil(reachable / self.page_size) + 1):
+            issues.extend(self._page(params, page).get("issues", []))
+        return issues
+
+    # -----------------
+    # Découpage
+    # -----------------
+    def _split(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Découpe une tranche trop large.
+
+        Args:
+            params: Paramètres de la tranche
+
+        Returns:
+            Sous-tranches (deux moitiés de la période, ou une par sévérité / type
+            pour une période d'une seconde), liste vide si la tranche est indivisible
+        """
+        start, end = self._bounds(params)
+        if start is not None and end - start > timedelta(seconds=1):
+            middle = start + timedelta(seconds=(end - start).total_seconds() // 2)
+            return [
+                {**params, "createdAfter": _format_datetime(start), "createdBefore": _format_datetime(middle)},
+                {**params, "createdAfter": _format_datetime(middle), "createdBefore": _format_datetime(end)},
+            ]
+
+        for field, all_values in FACET_SPLITS:
+            values = params[field].split(",") if params.get(field) else list(all_values)
+            if len(values) > 1:
+                return [{**params, field: value} for value in values]
+        return []
+
+    def _bounds(self, params: Dict[str, Any]) -> Tuple[Optional[datetime], datetime]:
+        """
+        Détermine la période de création couverte par une tranche.
+
+        Sans 'createdAfter', la date de création de la plus ancienne issue est
+        demandée à l'API ; sans 'createdBefore', la période s'arrête maintenant.
+        """
+        if params.get("createdBefore"):
+            end = _parse_datetime(params["createdBefore"])
+        else:
+            end = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(seconds=1)
+
+        if params.get("createdAfter"):
+            return _parse_datetime(params["createdAfter"]), end
+
+        oldest = self.client.get(
+            ISSUES_ENDPOINT, params={**params, "s": "CREATION_DATE", "asc": "true", "p": 1, "ps": 1}
+        )
+        oldest_issues = oldest.get("issues", []) if isinstance(oldest, dict) else []
+        if not oldest_issues or not oldest_issues[0].get("creationDate"):
+            return None, end
+        return _parse_datetime(oldest_issues[0]["creationDate"]), end
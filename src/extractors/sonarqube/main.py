@@ -7,33 +7,27 @@ from typing import Any, Dict, List, Optional
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 
 from dotenv import load_dotenv
+from src.core.constants import (
+    DEFAULT_SONARQUBE_MAX_WORKERS,
+    DEFAULT_SONARQUBE_SNAPSHOT_DIR,
+    SONARQUBE_COVERAGE_METRICS,
+    SONARQUBE_QUALITY_GATE_METRICS,
+    SONARQUBE_QUALITY_METRICS,
+)
+from src.core.utils.payload_preview import log_payload
 from src.utils import save_json  # Utilitaire de sauvegarde JSON
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Ajout: patcher dynamiquement src.core.exceptions pour fournir ConnectionError si absent
-def _ensure_exceptions_patch() -> None:
-    try:
-        import importlib
-        exc = importlib.import_module("src.core.exceptions")
-        if not hasattr(exc, "ConnectionError"):
-            import builtins
-            setattr(exc, "ConnectionError", builtins.ConnectionError)
-            logger.warning("Patched src.core.exceptions.ConnectionError -> builtins.ConnectionError")
-    except Exception as e:
-        logger.debug(f"Exceptions patch skipped: {e}")
-
-# Exécuter le patch AVANT d'importer les modules SonarQube
-_ensure_exceptions_patch()
-
-# Importer ensuite les modules SonarQube
 from src.extractors.sonarqube.factories import (
     SonarQubeClientFactory,
     SonarQubeGatewayFactory,
     SonarQubeExtractor,
 )
-from src.extractors.sonarqube.projects_gateway import SonarQubeProjectsGateway
+from src.extractors.sonarqube.parallel import map_projects
+from src.extractors.sonarqube.projects_gateway import SonarQubeProjectsGateway, quality_gate_from_measures
+from src.extractors.sonarqube.snapshot_store import SonarQubeSnapshotStore
 
 
 def fetch_projects(projects_gateway: SonarQubeProjectsGateway,
@@ -149,64 +143,107 @@ def test_projects_gateway_methods(projects_gateway: SonarQubeProjectsGateway,
 def fetch_all_projects_resources(projects_gateway: SonarQubeProjectsGateway,
                                  project_keys: Optional[List[str]] = None,
                                  organization: Optional[str] = None,
-                                 branch: Optional[str] = None) -> Dict[str, Any]:
+                                 branch: Optional[str] = None,
+                                 max_workers: int = 1) -> Dict[str, Any]:
     """
     Récupère pour chaque projet quelques ressources (mesures, issues, branches, quality gate, CE).
+
+    Les mesures de qualité et de couverture de tous les projets, ainsi que
+    leur statut de Quality Gate, sont lues en quelques requêtes groupées
+    (measures/search) ; les autres ressources sont
+    récupérées par projet, en parallèle par 'max_workers' threads. Le
+    dictionnaire retourné suit l'ordre des projets.
     """
     projects = projects_gateway.get_projects(organization=organization, project_keys=project_keys)
     print(f"[INFO] Projets extraits: {len(projects)}")
 
-    all_data: Dict[str, Any] = {}
-    for i, comp in enumerate(projects, start=1):
+    keyed = []
+    for comp in projects:
         proj_key = comp.get("key") or comp.get("project", {}).get("key")
-        proj_name = comp.get("name") or proj_key
         if not proj_key:
             continue
-        print(f"[{i}] {proj_name} (key: {proj_key})")
+        keyed.append((proj_key, comp))
+    log_payload(logger, "Projets à extraire", [comp for _, comp in keyed])
 
-        entry: Dict[str, Any] = {"project": comp}
-        try:
-            # Remplacer 'maintainability_rating' par 'sqale_rating'
-            entry["quality_measures"] = projects_gateway.get_project_quality_metrics(
-                proj_key, branch=branch,
-                metrics=[
-                    "bugs", "reliability_rating", "vulnerabilities", "security_rating",
-                    "security_hotspots", "security_hotspots_reviewed", "code_smells",
-                    "sqale_index", "sqale_debt_ratio", "sqale_rating",  # <-- ici
-                    "duplicated_lines_density", "duplicated_blocks", "cognitive_complexity", "complexity"
-                ]
-            )
-        except Exception as e:
-            entry["quality_measures"] = {"error": str(e)}
+    try:
+        measures = projects_gateway.get_projects_metrics(
+            [proj_key for proj_key, _ in keyed],
+            SONARQUBE_QUALITY_METRICS + SONARQUBE_COVERAGE_METRICS + SONARQUBE_QUALITY_GATE_METRICS,
+            branch=branch,
+        )
+    except Exception as e:
+        measures = {"error": str(e)}
 
-        try:
-            entry["coverage_measures"] = projects_gateway.get_project_code_coverage(proj_key, branch=branch)
-        except Exception as e:
-            entry["coverage_measures"] = {"error": str(e)}
+    entries = map_projects(
+        lambda project: _fetch_project_resources(projects_gateway, project[0], project[1], branch, measures),
+        keyed,
+        max_workers,
+    )
+    return {proj_key: entry for (proj_key, _), entry in zip(keyed, entries)}
 
-        try:
-            entry["issues"] = projects_gateway.get_project_issues(proj_key, branch=branch)
-        except Exception as e:
-            entry["issues"] = {"error": str(e)}
 
-        try:
-            entry["branches"] = projects_gateway.get_project_branches(proj_key)
-        except Exception as e:
-            entry["branches"] = {"error": str(e)}
+def _split_measures(project_measures: Dict[str, Any], metrics: List[str]) -> Dict[str, Any]:
+    """
+    Extrait d'une réponse au format 'measures/component' les mesures des métriques demandées.
+    """
+    component = dict(project_measures.get("component", {}))
+    component["measures"] = [m for m in component.get("measures", []) if m.get("metric") in metrics]
+    return {**project_measures, "component": component}
 
-        try:
-            entry["quality_gate"] = projects_gateway.get_quality_gate_status(proj_key, branch=branch)
-        except Exception as e:
-            entry["quality_gate"] = {"error": str(e)}
 
+def _fetch_project_resources(projects_gateway: SonarQubeProjectsGateway,
+                             proj_key: str,
+                             comp: Dict[str, Any],
+                             branch: Optional[str] = None,
+                             measures: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Récupère les ressources d'un projet ; chaque erreur est consignée dans l'entrée.
+
+    'measures' contient les mesures déjà lues pour tous les projets
+    (get_projects_metrics), ou {"error": ...} si cette lecture a échoué.
+    """
+    entry: Dict[str, Any] = {"project": comp}
+    measures = measures or {}
+    if "error" in measures:
+        entry["quality_measures"] = {"error": measures["error"]}
+        entry["coverage_measures"] = {"error": measures["error"]}
+    elif proj_key not in measures:
+        error = {"error": f"Project with key '{proj_key}' not found"}
+        entry["quality_measures"] = error
+        entry["coverage_measures"] = dict(error)
+    else:
+        entry["quality_measures"] = _split_measures(measures[proj_key], SONARQUBE_QUALITY_METRICS)
+        entry["coverage_measures"] = _split_measures(measures[proj_key], SONARQUBE_COVERAGE_METRICS)
+
+    try:
+        entry["issues"] = projects_gateway.get_project_issues(proj_key, branch=branch)
+    except Exception as e:
+        entry["issues"] = {"error": str(e)}
+
+    # Branches et statut de Quality Gate en un appel (statut repris des mesures ou des branches)
+    project_measures = None if "error" in measures else measures.get(proj_key)
+    try:
+        combined = projects_gateway.get_project_branches_and_quality_gate(
+            proj_key, branch=branch, measures=project_measures
+        )
+        entry["branches"] = combined["branches"]
+        entry["quality_gate"] = combined["quality_gate"]
+    except Exception as e:
+        entry["branches"] = {"error": str(e)}
         try:
-            entry["ce_activity"] = projects_gateway.get_compute_engine_activity(proj_key, branch=branch, only_current=False)
+            entry["quality_gate"] = (
+                quality_gate_from_measures(project_measures)
+                or projects_gateway.get_quality_gate_status(proj_key, branch=branch)
+            )
         except Exception as e:
-            entry["ce_activity"] = {"error": str(e)}
+            entry["quality_gate"] = {"error": str(e)}
 
-        all_data[proj_key] = entry
+    try:
+        entry["ce_activity"] = projects_gateway.get_compute_engine_activity(proj_key, branch=branch, only_current=False)
+    except Exception as e:
+        entry["ce_activity"] = {"error": str(e)}
 
-    return all_data
+    return entry
 
 
 def main():
@@ -229,6 +266,8 @@ def main():
         "password": password,
         "timeout": int(os.getenv("SONARQUBE_TIMEOUT", "20")),
         "max_retries": int(os.getenv("SONARQUBE_MAX_RETRIES", "3")),
+        # Projets extraits simultanément ; le pool de connexions du client est aligné dessus
+        "max_workers": int(os.getenv("SONARQUBE_MAX_WORKERS", DEFAULT_SONARQUBE_MAX_WORKERS)),
     }
 
     # Création client/gateway/extractor
@@ -240,7 +279,9 @@ def main():
     except Exception as e:
         print(f"[WARN] Échec test connexion: {e}")
 
-    projects_gateway = SonarQubeGatewayFactory.create_projects_gateway(client)
+    projects_gateway = SonarQubeGatewayFactory.create_projects_gateway(
+        client, max_workers=config["max_workers"]
+    )
     extractor = SonarQubeExtractor(config=config)
 
     # 1) Récupération des projets
@@ -266,11 +307,20 @@ def main():
 
     # 3) Extraction "full" par projet via gateway (mesures, issues, branches, quality gate, CE)
     print("\n🗃️ Extraction des ressources par projet (gateway)...")
-    all_resources = fetch_all_projects_resources(projects_gateway, project_keys=project_keys, organization=organization, branch=branch)
+    all_resources = fetch_all_projects_resources(
+        projects_gateway, project_keys=project_keys, organization=organization, branch=branch,
+        max_workers=config["max_workers"]
+    )
     save_json(all_resources, "sonarqube_projects_resources_full.json")
 
-    # 4) Extraction "full" via Extractor (orchestration)
+    # 4) Extraction "full" via Extractor (orchestration) ; en mode incrémentiel,
+    # seuls les projets analysés depuis la précédente exécution sont interrogés
     print("\n📦 Extraction via SonarQubeExtractor...")
+    snapshot_store = None
+    if os.getenv("SONARQUBE_INCREMENTAL", "true").lower() in ("1", "true", "yes"):
+        snapshot_store = SonarQubeSnapshotStore(
+            os.getenv("SONARQUBE_SNAPSHOT_DIR", DEFAULT_SONARQUBE_SNAPSHOT_DIR)
+        )
     full_extract = extractor.extract(
         organization=organization,
         project_keys=project_keys,
@@ -279,8 +329,11 @@ def main():
         include_quality_gate=True,
         include_activity=True,
         branch=branch,
+        snapshot_store=snapshot_store,
         # metrics=["bugs", ..., "sqale_rating", ...]  # si extract() accepte ce paramètre
     )
+    if snapshot_store is not None:
+        snapshot_store.save()
     save_json(full_extract, "sonarqube_full_extract.json")
 
     # 5) Extraction incrémentielle (optionnelle si SONARQUBE_FROM_DATE défini)
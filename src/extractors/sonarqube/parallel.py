@@ -0,0 +1,38 @@
+"""
+Module contenant l'exécution concurrente des extractions SonarQube par projet.
+
+Les requêtes d'un projet (mesures, issues, branches, quality gate, activité
+CE) restent séquentielles ; ce sont les projets qui sont répartis sur un pool
+de threads borné partageant la session HTTP du SonarQubeClient.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_projects(func: Callable[[T], R], projects: Iterable[T], max_workers: int = 1) -> List[R]:
+    """
+    Applique une extraction à chaque projet, en parallèle si max_workers > 1.
+
+    Args:
+        func: Extraction d'un projet
+        projects: Projets à traiter
+        max_workers: Nombre maximal de projets extraits simultanément
+
+    Returns:
+        Résultats dans l'ordre des projets fournis
+
+    Raises:
+        Exception: La première erreur levée par une extraction (ordre des projets)
+    """
+    projects = list(projects)
+    if max_workers <= 1 or len(projects) <= 1:
+        return [func(project) for project in projects]
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(projects)))
+    try:
+        return list(executor.map(func, projects))
+    finally:
+        # Après une erreur, les projets non démarrés ne sont pas extraits
+        executor.shutdown(wait=True, cancel_futures=True)
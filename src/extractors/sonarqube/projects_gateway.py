@@ -5,15 +5,80 @@ Ce module fournit une passerelle (gateway) pour accéder aux projets
 SonarQube et à leurs métriques associées.
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
+from src.core.constants import SONARQUBE_MEASURES_SEARCH_MAX_PROJECTS
+from src.extractors.sonarqube.issues_harvester import SonarQubeIssuesHarvester
 from src.extractors.sonarqube.sonarqube_client import SonarQubeClient
 from src.core.exceptions import ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
+def quality_gate_from_measures(project_measures: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Reconstruit un statut de Quality Gate à partir des mesures d'un projet.
+
+    Les métriques 'alert_status' et 'quality_gate_details' (voir
+    SONARQUBE_QUALITY_GATE_METRICS) portent le statut et le détail des
+    conditions ; elles sont lues pour 100 projets à la fois par measures/search.
+
+    Args:
+        project_measures: Mesures au format de 'measures/component'
+
+    Returns:
+        Statut au format de 'qualitygates/project_status', ou None si les
+        mesures n'en contiennent pas
+    """
+    measures = {
+        m.get("metric"): m.get("value")
+        for m in ((project_measures or {}).get("component") or {}).get("measures", [])
+    }
+    details: Dict[str, Any] = {}
+    if measures.get("quality_gate_details"):
+        try:
+            details = json.loads(measures["quality_gate_details"])
+        except ValueError:
+            logger.warning("Unreadable quality_gate_details measure, ignored")
+    status = details.get("level") or measures.get("alert_status")
+    if not status:
+        return None
+    project_status: Dict[str, Any] = {"status": status}
+    if details.get("conditions") is not None:
+        project_status["conditions"] = [
+            {
+                "status": condition.get("level"),
+                "metricKey": condition.get("metric"),
+                "comparator": condition.get("op"),
+                "errorThreshold": condition.get("error"),
+                "actualValue": condition.get("actual"),
+            }
+            for condition in details["conditions"]
+        ]
+    return {"projectStatus": project_status}
+
+
+def quality_gate_from_branches(branches: List[Dict[str, Any]], branch: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Reconstruit un statut de Quality Gate à partir de la liste des branches.
+
+    Args:
+        branches: Réponse de 'project_branches/list'
+        branch: Branche visée (par défaut, la branche principale)
+
+    Returns:
+        Statut (sans détail des conditions) au format de
+        'qualitygates/project_status', ou None si la branche n'a pas de statut
+    """
+    for item in branches:
+        if (item.get("name") == branch) if branch else item.get("isMain"):
+            status = (item.get("status") or {}).get("qualityGateStatus")
+            return {"projectStatus": {"status": status}} if status else None
+    return None
+
+
 class SonarQubeProjectsGateway:
     """
     Passerelle pour interagir avec les projets SonarQube et leurs métriques.
@@ -22,14 +87,21 @@ class SonarQubeProjectsGateway:
     en utilisant le SonarQubeClient pour les requêtes API.
     """
     
-    def __init__(self, sonarqube_client: SonarQubeClient) -> None:
+    def __init__(
+        self,
+        sonarqube_client: SonarQubeClient,
+        issues_harvester: Optional[SonarQubeIssuesHarvester] = None,
+    ) -> None:
         """
         Initialiser la passerelle de projets SonarQube.
         
         Args:
             sonarqube_client: Instance de SonarQubeClient pour les requêtes API
+            issues_harvester: Moissonneur des issues au-delà de la fenêtre de
+                10 000 résultats (optionnel ; sans lui, la recherche est tronquée)
         """
         self.client = sonarqube_client
+        self.issues_harvester = issues_harvester
         logger.info("SonarQubeProjectsGateway initialized")
         
     def get_projects(
@@ -140,6 +212,59 @@ class SonarQubeProjectsGateway:
         except ResourceNotFoundError:
             logger.error(f"Project with key '{project_key}' not found")
             raise ResourceNotFoundError(f"Project with key '{project_key}' not found")
+
+    def get_projects_metrics(
+        self,
+        project_keys: List[str],
+        metrics: List[str],
+        branch: Optional[str] = None,
+        batch_size: int = SONARQUBE_MEASURES_SEARCH_MAX_PROJECTS,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupérer les métriques de plusieurs projets en quelques requêtes.
+
+        Les clés sont envoyées par lots à 'measures/search' (au plus
+        'batch_size' projets par appel) et la réponse est redistribuée par
+        projet au format de 'measures/component'. Cet endpoint ne connaît que
+        la branche principale : si une branche est demandée, les métriques
+        sont lues projet par projet via get_project_metrics.
+
+        Args:
+            project_keys: Clés des projets SonarQube
+            metrics: Liste des métriques à récupérer
+            branch: Nom de la branche (optionnel)
+            batch_size: Nombre de projets par requête (limite de l'API: 100)
+
+        Returns:
+            Dictionnaire {clé de projet: {"component": {"key", "measures": [...]}}} ;
+            les projets inconnus (branche demandée) sont absents du résultat
+        """
+        if branch:
+            results = {}
+            for project_key in project_keys:
+                try:
+                    results[project_key] = self.get_project_metrics(project_key, metrics, branch=branch)
+                except ResourceNotFoundError:
+                    logger.warning(f"No measures for project '{project_key}' on branch '{branch}'")
+            return results
+
+        results = {key: {"component": {"key": key, "measures": []}} for key in project_keys}
+        batch_size = max(1, min(int(batch_size), SONARQUBE_MEASURES_SEARCH_MAX_PROJECTS))
+        for start in range(0, len(project_keys), batch_size):
+            batch = project_keys[start:start + batch_size]
+            params = {
+                "projectKeys": ",".join(batch),
+                "metricKeys": ",".join(metrics),
+            }
+            logger.info(f"Fetching metrics for {len(batch)} projects with measures/search")
+            response = self.client.get("measures/search", params=params)
+            for measure in response.get("measures", []) if isinstance(response, dict) else []:
+                entry = results.get(measure.get("component"))
+                if entry is not None:
+                    entry["component"]["measures"].append(
+                        {k: v for k, v in measure.items() if k != "component"}
+                    )
+        return results
             
     def get_project_issues(
         self,
@@ -190,6 +315,9 @@ class SonarQubeProjectsGateway:
             params["branch"] = branch
             
         logger.info(f"Fetching issues for project {project_key} with parameters: {params}")
+
+        if self.issues_harvester is not None:
+            return self.issues_harvester.harvest(params)
         
         response = self.client.get(endpoint, params=params, paginate=True)
         # Si response est une liste, cela signifie que la pagination a été gérée
@@ -325,6 +453,38 @@ class SonarQubeProjectsGateway:
         resp = self.client.get(endpoint, params=params)
         return resp.get("branches", []) if isinstance(resp, dict) else resp
 
+    def get_project_branches_and_quality_gate(
+        self,
+        project_key: str,
+        branch: Optional[str] = None,
+        measures: Optional[Dict[str, Any]] = None,
+        include_branches: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Récupérer les branches et le statut de Quality Gate d'un projet.
+
+        Le statut est repris, par ordre de préférence, des mesures déjà lues
+        (quality_gate_from_measures, conditions comprises), puis de la liste
+        des branches (quality_gate_from_branches) ; 'qualitygates/project_status'
+        n'est interrogé que si aucune des deux ne le fournit.
+
+        Args:
+            project_key: Clé du projet SonarQube
+            branch: Nom de la branche (optionnel)
+            measures: Mesures du projet au format de 'measures/component' (optionnel)
+            include_branches: Si False, la liste des branches n'est pas demandée
+
+        Returns:
+            Dictionnaire {"branches": [...] ou None, "quality_gate": {...}}
+        """
+        quality_gate = quality_gate_from_measures(measures)
+        branches = self.get_project_branches(project_key) if include_branches else None
+        if quality_gate is None and branches:
+            quality_gate = quality_gate_from_branches(branches, branch)
+        if quality_gate is None:
+            quality_gate = self.get_quality_gate_status(project_key, branch=branch)
+        return {"branches": branches, "quality_gate": quality_gate}
+
     def get_project_pull_requests(self, project_key: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Récupérer la liste des Pull Requests d'un projet (si SCM pris en charge).
@@ -389,6 +549,39 @@ class SonarQubeProjectsGateway:
         """
         Récupérer les mesures pour l'arborescence des composants d'un projet.
         Retourne une liste de composants avec leurs mesures.
+
+        Pour les gros projets, préférer iter_measures_component_tree qui ne
+        conserve pas tous les composants en mémoire.
+        """
+        return list(self.iter_measures_component_tree(
+            project_key, metrics, branch=branch, qualifiers=qualifiers, strategy=strategy, page_size=page_size
+        ))
+
+    def iter_measures_component_tree(
+        self,
+        project_key: str,
+        metrics: List[str],
+        branch: Optional[str] = None,
+        qualifiers: Optional[List[str]] = None,
+        strategy: str = "leaves",
+        page_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourir les mesures de l'arborescence des composants d'un projet.
+
+        Les composants sont produits au fil des pages, la page suivante étant
+        récupérée en arrière-plan (SonarQubeClient.iter_items).
+
+        Args:
+            project_key: Clé du projet SonarQube
+            metrics: Liste des métriques à récupérer
+            branch: Nom de la branche (optionnel)
+            qualifiers: Qualificatifs des composants (ex: ["FIL", "UTS", "DIR"])
+            strategy: Stratégie de parcours (children, leaves, all)
+            page_size: Nombre de composants par page (500 au plus)
+
+        Yields:
+            Chaque composant avec ses mesures
         """
         endpoint = "measures/component_tree"
         params: Dict[str, Any] = {
@@ -402,7 +595,4 @@ class SonarQubeProjectsGateway:
         if qualifiers:
             params["qualifiers"] = ",".join(qualifiers)
         logger.info(f"Fetching component tree measures for project {project_key} with params: {params}")
-        # Cet endpoint est paginé -> paginate=True pour tout récupérer
-        resp = self.client.get(endpoint, params=params, paginate=True)
-        # Quand paginé, le client renvoie directement la liste d'items (composants)
-        return resp if isinstance(resp, list) else resp.get("components", [])
+        yield from self.client.iter_items(endpoint, params=params, items_key="components")
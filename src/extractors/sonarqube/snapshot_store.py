@@ -0,0 +1,151 @@
+"""
+Module contenant le store persistant des extractions SonarQube par projet.
+
+Les mesures, issues, branches et quality gates d'un projet ne changent
+qu'à l'issue d'une nouvelle analyse. Le store conserve, pour chaque projet,
+la dernière extraction et la date d'analyse ('lastAnalysisDate' de
+projects/search) à laquelle elle correspond : tant que cette date ne change
+pas, l'extraction précédente est réutilisée au lieu d'interroger l'API.
+
+Chaque extraction est écrite dans son propre fichier dès qu'elle est
+enregistrée ; l'index (watermarks par projet) n'est écrit que par save().
+Un index non sauvegardé conduit simplement à réextraire les projets.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from src.core.constants import DEFAULT_SONARQUBE_SNAPSHOT_DIR
+
+INDEX_FILE = "index.json"
+
+
+class SonarQubeSnapshotStore:
+    """
+    Store persistant (dossier de fichiers JSON) des extractions de projets.
+
+    L'index associe à chaque clé de projet :
+    - last_analysis_date: watermark d'analyse de l'extraction conservée
+    - options: options d'extraction (issues, branches, branche, ...) utilisées
+    - file: nom du fichier contenant l'extraction
+    """
+
+    def __init__(self, store_dir: str = DEFAULT_SONARQUBE_SNAPSHOT_DIR) -> None:
+        """
+        Initialise le store et charge l'index existant.
+
+        Args:
+            store_dir: Dossier du store
+        """
+        self._logger = logging.getLogger(__name__)
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    @property
+    def index_file(self) -> str:
+        """Chemin du fichier d'index."""
+        return os.path.join(self.store_dir, INDEX_FILE)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Charge l'index, ou retourne un index vide s'il est absent ou illisible."""
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Index des extractions illisible ({self.index_file}), ignoré: {e}")
+            return {}
+
+    @staticmethod
+    def _snapshot_file(project_key: str) -> str:
+        """Nom du fichier d'extraction d'un projet (les clés SonarQube contiennent ':' ou '/')."""
+        return hashlib.sha1(project_key.encode("utf-8")).hexdigest() + ".json"
+
+    def watermark(self, project_key: str) -> Optional[str]:
+        """
+        Retourne la date d'analyse de l'extraction conservée d'un projet.
+
+        Args:
+            project_key: Clé du projet SonarQube
+
+        Returns:
+            'lastAnalysisDate' de l'extraction conservée, ou None si le projet est inconnu
+        """
+        entry = self._index.get(project_key)
+        return entry.get("last_analysis_date") if entry else None
+
+    def get(
+        self, project_key: str, last_analysis_date: Optional[str], options: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retourne l'extraction conservée d'un projet si elle est toujours à jour.
+
+        Args:
+            project_key: Clé du projet SonarQube
+            last_analysis_date: 'lastAnalysisDate' actuel du projet
+            options: Options de l'extraction demandée
+
+        Returns:
+            Extraction précédente, ou None si le projet a été analysé depuis,
+            si les options diffèrent ou si l'extraction est illisible
+        """
+        entry = self._index.get(project_key)
+        if entry is None or entry.get("last_analysis_date") != last_analysis_date:
+            return None
+        if entry.get("options") != options:
+            return None
+        path = os.path.join(self.store_dir, entry["file"])
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Extraction conservée illisible pour {project_key} ({path}), ignorée: {e}")
+            return None
+
+    def store(
+        self,
+        project_key: str,
+        last_analysis_date: Optional[str],
+        options: Dict[str, Any],
+        snapshot: Dict[str, Any],
+    ) -> None:
+        """
+        Enregistre l'extraction d'un projet et son watermark d'analyse.
+
+        Args:
+            project_key: Clé du projet SonarQube
+            last_analysis_date: 'lastAnalysisDate' du projet lors de l'extraction
+            options: Options de l'extraction
+            snapshot: Extraction du projet
+        """
+        file_name = self._snapshot_file(project_key)
+        os.makedirs(self.store_dir, exist_ok=True)
+        with open(os.path.join(self.store_dir, file_name), "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        with self._lock:
+            self._index[project_key] = {
+                "last_analysis_date": last_analysis_date,
+                "options": options,
+                "file": file_name,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Écrit l'index sur disque s'il a été modifié."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump(self._index, f, separators=(",", ":"))
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._index)
@@ -7,16 +7,17 @@ en gérant l'authentification, la pagination et la gestion des erreurs.
 
 import logging
 import base64
-from typing import Any, Dict, Generator, List, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, Iterator, List, Optional, Union, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util.retry import Retry
 
 from src.core.exceptions import (
     APIAuthenticationError,
+    APIConnectionError,
     APIRateLimitError,
-    ConnectionError,
     ResourceNotFoundError,
 )
 
@@ -40,6 +41,7 @@ class SonarQubeClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_backoff_factor: float = 0.3,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
     ) -> None:
         """
         Initialiser le client SonarQube avec les paramètres de connexion.
@@ -52,6 +54,8 @@ class SonarQubeClient:
             timeout: Délai d'attente maximum pour les requêtes en secondes
             max_retries: Nombre maximum de tentatives pour les requêtes en échec
             retry_backoff_factor: Facteur de délai exponentiel entre les tentatives
+            pool_maxsize: Nombre de connexions conservées par hôte, à aligner sur le
+                nombre de workers de l'extraction concurrente
         """
         self.api_url = api_url.rstrip("/")
         self.timeout = timeout
@@ -64,7 +68,8 @@ class SonarQubeClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PUT", "DELETE"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Une connexion réutilisable par worker : au-delà, urllib3 ouvre puis jette des connexions
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=max(1, int(pool_maxsize)))
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -100,7 +105,7 @@ class SonarQubeClient:
 
         Raises:
             APIAuthenticationError: Si l'authentification échoue
-            ConnectionError: Si la connexion échoue pour d'autres raisons
+            APIConnectionError: Si la connexion échoue pour d'autres raisons
         """
         try:
             # Utilisation du endpoint /system/status qui est léger et disponible pour tous les utilisateurs authentifiés
@@ -117,7 +122,7 @@ class SonarQubeClient:
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to connect to SonarQube API: {str(e)}")
-            raise ConnectionError(f"Could not connect to SonarQube API: {str(e)}")
+            raise APIConnectionError(f"Could not connect to SonarQube API: {str(e)}")
 
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None, paginate: bool = False
@@ -137,7 +142,7 @@ class SonarQubeClient:
             APIAuthenticationError: Si l'authentification échoue
             APIRateLimitError: Si la limite de taux d'API est atteinte
             ResourceNotFoundError: Si la ressource demandée n'est pas trouvée
-            ConnectionError: Pour les autres erreurs de connexion
+            APIConnectionError: Pour les autres erreurs de connexion
         """
         if paginate:
             result = list(self._paginated_get(endpoint, params or {}))
@@ -145,79 +150,149 @@ class SonarQubeClient:
         
         return self._make_request("GET", endpoint, params)
 
-    def _paginated_get(
-        self, endpoint: str, params: Dict[str, Any]
-    ) -> Generator[Dict[str, Any], None, None]:
+    def iter_pages(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None, prefetch: bool = True
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
-        Générateur pour récupérer toutes les pages d'une ressource paginée.
+        Parcourir page par page une ressource paginée.
+
+        Dès qu'une page est reçue et qu'une suivante existe, celle-ci est
+        demandée en arrière-plan pendant que l'appelant traite la page
+        courante : au plus deux pages sont en mémoire à un instant donné.
 
         Args:
             endpoint: Point de terminaison de l'API
-            params: Paramètres de la requête
+            params: Paramètres de la requête (non modifiés)
+            prefetch: Si True, la page suivante est récupérée en arrière-plan
 
         Yields:
-            Chaque élément individuel de toutes les pages de réponse
+            Chaque réponse de page, telle que renvoyée par l'API
+
+        Raises:
+            APIAuthenticationError, APIRateLimitError, ResourceNotFoundError,
+            APIConnectionError: Erreurs de la requête d'une page, levées au moment
+                où cette page est consommée
         """
+        params = dict(params or {})
         # Paramètres de pagination SonarQube (peut varier selon l'endpoint)
         # Certains endpoints utilisent p/ps (page/page size) d'autres utilisent pageIndex/pageSize
         if "ps" not in params and "pageSize" not in params:
             # Utiliser ps par défaut, qui est le plus courant
             params["ps"] = 100  # Maximiser le nombre d'éléments par page
-        
-        page = 1
-        has_more = True
-        
-        while has_more:
-            # Ajuster les paramètres de page en fonction de l'endpoint
-            if "pageIndex" in params or any(key.startswith("pageIndex") for key in params):
-                params["pageIndex"] = page
-            else:
-                params["p"] = page
-                
-            response_data = self._make_request("GET", endpoint, params)
-            
-            # SonarQube peut retourner les résultats dans différentes structures
-            # Vérifier les différents formats de pagination courants
-            if "paging" in response_data:
-                # Format standard avec un objet paging
-                paging = response_data.get("paging", {})
-                total = paging.get("total", 0)
-                page_size = paging.get("pageSize", 100)
-                current_page = paging.get("pageIndex", page)
-                
-                # Déterminer la clé qui contient les données (components, issues, etc.)
-                # Trouver la clé qui contient la liste de résultats
-                result_keys = [k for k, v in response_data.items() if isinstance(v, list) and k != "paging"]
-                if result_keys:
-                    result_key = result_keys[0]
-                    items = response_data.get(result_key, [])
-                    
-                    for item in items:
-                        yield item
-                    
-                    # Vérifier s'il y a d'autres pages
-                    has_more = (current_page * page_size) < total
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = 1
+            response_data = self._get_page(endpoint, params, page)
+            while True:
+                has_more = self._has_next_page(response_data, params, page)
+                next_page = None
+                if has_more and executor is not None:
+                    logger.debug(f"Prefetching page {page + 1} for endpoint {endpoint}")
+                    next_page = executor.submit(self._get_page, endpoint, params, page + 1)
+
+                yield response_data
+
+                if not has_more:
+                    return
+                page += 1
+                if next_page is not None:
+                    response_data = next_page.result()
                 else:
-                    # Pas de données trouvées dans un format reconnaissable
-                    has_more = False
-            elif isinstance(response_data, list):
+                    logger.debug(f"Fetching page {page} for endpoint {endpoint}")
+                    response_data = self._get_page(endpoint, params, page)
+        finally:
+            if executor is not None:
+                # Parcours abandonné : la page préchargée éventuelle est ignorée
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        items_key: Optional[str] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourir élément par élément une ressource paginée.
+
+        Args:
+            endpoint: Point de terminaison de l'API
+            params: Paramètres de la requête (non modifiés)
+            items_key: Clé de la liste des éléments dans chaque page (par défaut,
+                la première liste de la réponse)
+            prefetch: Si True, la page suivante est récupérée en arrière-plan
+
+        Yields:
+            Chaque élément individuel de toutes les pages de réponse
+        """
+        for response_data in self.iter_pages(endpoint, params, prefetch=prefetch):
+            if isinstance(response_data, list):
                 # Certains endpoints retournent directement une liste
-                if not response_data:
-                    has_more = False
-                
-                for item in response_data:
-                    yield item
-                
-                # Pour les endpoints qui retournent une liste sans info de pagination
-                # On suppose qu'il n'y a plus de pages si on reçoit moins que la taille demandée
-                has_more = len(response_data) >= params.get("ps", params.get("pageSize", 100))
+                yield from response_data
+            elif "paging" in response_data:
+                yield from self._page_items(response_data, items_key)
             else:
                 # Format non reconnu ou non paginé
                 yield response_data
-                has_more = False
-            
-            page += 1
-            logger.debug(f"Fetching page {page} for endpoint {endpoint}")
+
+    def _paginated_get(
+        self, endpoint: str, params: Dict[str, Any]
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Générateur pour récupérer toutes les pages d'une ressource paginée.
+
+        Args:
+            endpoint: Point de terminaison de l'API
+            params: Paramètres de la requête
+
+        Yields:
+            Chaque élément individuel de toutes les pages de réponse
+        """
+        # Les pages sont toutes matérialisées par get() : pas de préchargement
+        yield from self.iter_items(endpoint, params, prefetch=False)
+
+    def _get_page(
+        self, endpoint: str, params: Dict[str, Any], page: int
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Récupérer une page d'une ressource paginée."""
+        page_params = dict(params)
+        # Ajuster les paramètres de page en fonction de l'endpoint
+        if any(key.startswith("pageIndex") for key in params):
+            page_params["pageIndex"] = page
+        else:
+            page_params["p"] = page
+        return self._make_request("GET", endpoint, page_params)
+
+    @staticmethod
+    def _page_items(response_data: Dict[str, Any], items_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Extraire la liste des éléments (components, issues, etc.) d'une page."""
+        if items_key is not None:
+            return response_data.get(items_key, [])
+        # Trouver la clé qui contient la liste de résultats
+        result_keys = [k for k, v in response_data.items() if isinstance(v, list) and k != "paging"]
+        return response_data.get(result_keys[0], []) if result_keys else []
+
+    @staticmethod
+    def _has_next_page(
+        response_data: Union[Dict[str, Any], List[Dict[str, Any]]], params: Dict[str, Any], page: int
+    ) -> bool:
+        """Indiquer si une page suivante existe après la page 'page'."""
+        # SonarQube peut retourner les résultats dans différentes structures
+        if isinstance(response_data, list):
+            # Pour les endpoints qui retournent une liste sans info de pagination
+            # On suppose qu'il n'y a plus de pages si on reçoit moins que la taille demandée
+            return bool(response_data) and len(response_data) >= params.get("ps", params.get("pageSize", 100))
+        if "paging" not in response_data:
+            return False
+        paging = response_data.get("paging", {})
+        if not SonarQubeClient._page_items(response_data):
+            # Pas de données trouvées dans un format reconnaissable
+            return False
+        total = paging.get("total", 0)
+        page_size = paging.get("pageSize", 100)
+        current_page = paging.get("pageIndex", page)
+        return (current_page * page_size) < total
 
     def _make_request(
         self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, data: Any = None
@@ -238,7 +313,7 @@ class SonarQubeClient:
             APIAuthenticationError: Si l'authentification échoue
             APIRateLimitError: Si la limite de taux d'API est atteinte
             ResourceNotFoundError: Si la ressource demandée n'est pas trouvée
-            ConnectionError: Pour les autres erreurs de connexion
+            APIConnectionError: Pour les autres erreurs de connexion
         """
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
         
@@ -273,7 +348,7 @@ class SonarQubeClient:
                 if response.status_code == 404:
                     raise ResourceNotFoundError(f"Resource not found: {url}. Details: {detail}")
                 else:
-                    raise ConnectionError(f"Bad request to SonarQube API: {detail}")
+                    raise APIConnectionError(f"Bad request to SonarQube API: {detail}")
             elif response.status_code == 429:
                 raise APIRateLimitError("SonarQube API rate limit exceeded. Please try again later.")
             
@@ -287,4 +362,4 @@ class SonarQubeClient:
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making request to SonarQube API: {str(e)}")
-            raise ConnectionError(f"Error connecting to SonarQube API: {str(e)}")
+            raise APIConnectionError(f"Error connecting to SonarQube API: {str(e)}")
@@ -7,6 +7,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 from src.loaders.database.db_connection import get_db_connection  # adapte si nécessaire
+from src.core.utils.payload_preview import PayloadPreview
 
 def load_branches(json_path="data/transformers/branches_transformed.json"):
     """Charge et insère les branches depuis un fichier JSON vers la base de données."""
@@ -42,7 +43,7 @@ def load_branches(json_path="data/transformers/branches_transformed.json"):
         success_count = 0
         for branch in branches:
             if not all(k in branch for k in ("name", "commit_id", "created_at")):
-                print(f"[⚠️] Branche ignorée : clé(s) manquante(s) dans {branch}")
+                print(f"[⚠️] Branche ignorée : clé(s) manquante(s) dans {PayloadPreview(branch)}")
                 continue
 
             try:
@@ -7,6 +7,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 from src.loaders.database.db_connection import get_db_connection  # Chemin à adapter si besoin
+from src.core.utils.payload_preview import PayloadPreview
 
 def load_commits(json_path="data/transformers/commits_transformed.json"):
     """Charge et insère les commits depuis un fichier JSON vers la base de données."""
@@ -44,7 +45,7 @@ def load_commits(json_path="data/transformers/commits_transformed.json"):
         success_count = 0
         for commit in commits:
             if not all(k in commit for k in ("id", "short_id", "created_at", "message")):
-                print(f"[⚠️] Commit ignoré : clé(s) manquante(s) dans {commit}")
+                print(f"[⚠️] Commit ignoré : clé(s) manquante(s) dans {PayloadPreview(commit)}")
                 continue
 
             try:
@@ -8,6 +8,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 from src.loaders.database.db_connection import get_db_connection  # adapte le chemin si besoin
+from src.core.utils.payload_preview import PayloadPreview
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -100,7 +101,7 @@ def load_events(json_path="data/transformers/events_transformed.json", check_ove
                 continue
 
             if not all(k in event for k in ("id", "created_at", "action_name")):
-                print(f"[⚠️] Événement ignoré : clé(s) manquante(s) dans {event}")
+                print(f"[⚠️] Événement ignoré : clé(s) manquante(s) dans {PayloadPreview(event)}")
                 continue
 
             try:
@@ -7,6 +7,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 from src.loaders.database.db_connection import get_db_connection  # Assure-toi que le chemin est correct
+from src.core.utils.payload_preview import PayloadPreview
 
 def load_issues(json_path="data/transformers/issues_transformed.json"):
     """Charge et insère les issues depuis un fichier JSON vers la base de données."""
@@ -56,7 +57,7 @@ def load_issues(json_path="data/transformers/issues_transformed.json"):
         success_count = 0
         for issue in issues:
             if not all(k in issue for k in ("id", "title", "created_at")):
-                print(f"[⚠️] Issue ignorée : clé(s) manquante(s) dans {issue}")
+                print(f"[⚠️] Issue ignorée : clé(s) manquante(s) dans {PayloadPreview(issue)}")
                 continue
 
             try:
@@ -6,6 +6,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 from src.loaders.database.db_connection import get_db_connection
+from src.core.utils.payload_preview import PayloadPreview
 
 def load_projects(json_path="data/transformers/projects_transformed.json"):
     if not os.path.isabs(json_path):
@@ -48,7 +49,7 @@ def load_projects(json_path="data/transformers/projects_transformed.json"):
 
         for project in projects:
             if not all(k in project for k in ("id", "name", "created_at", "web_url")):
-                print(f"[⚠️] Projet ignoré : clé(s) manquante(s) dans {project}")
+                print(f"[⚠️] Projet ignoré : clé(s) manquante(s) dans {PayloadPreview(project)}")
                 continue
 
             cursor.execute(insert_query, project)
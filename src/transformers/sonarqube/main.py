@@ -1,7 +1,11 @@
 import os
 import json
+import logging
 from datetime import datetime
 
+from src.core.utils.payload_preview import log_payload
+from src.transformers.sonarqube.partitioned_history import PartitionedHistoryStore
+
 # ========================
 # Configuration des chemins
 # ========================
@@ -13,6 +17,13 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR = os.path.abspath(os.path.join(BASE_DIR, "../../../data/output/sonarqube"))
 OUTPUT_DIR = os.path.abspath(os.path.join(BASE_DIR, "../../../data/transformes/sonarqube"))
 
+# Historique des métriques : une partition JSON Lines par date_id et un manifeste
+HISTORY_DIR = os.path.join(OUTPUT_DIR, "fact_project_metrics_history")
+# Ancien historique (fichier JSON unique), importé une fois dans l'historique partitionné
+LEGACY_HISTORY_FILE = os.path.join(OUTPUT_DIR, "fact_project_metrics_history.json")
+
+logger = logging.getLogger(__name__)
+
 # ========================
 # Fonctions utilitaires
 # ========================
@@ -40,21 +51,18 @@ def write_json(data, filename):
         json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"[INFO] Fichier écrit : {filepath}")
 
-def append_json_history(data, filename):
-    """Ajoute les nouvelles données à un fichier d'historique JSON."""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    history = []
-    if os.path.exists(filepath):
-        with open(filepath, "r", encoding="utf-8") as f:
-            try:
-                history = json.load(f)
-            except json.JSONDecodeError:
-                print(f"[AVERTISSEMENT] Historique corrompu, réinitialisation.")
-    history.extend(data)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
-    print(f"[INFO] Historique mis à jour : {filepath}")
+def append_history(data, history_dir=HISTORY_DIR, legacy_file=LEGACY_HISTORY_FILE):
+    """Ajoute les nouvelles données à l'historique partitionné par date_id."""
+    store = PartitionedHistoryStore(history_dir)
+    if os.path.exists(legacy_file):
+        try:
+            imported = store.import_json_history(legacy_file)
+            print(f"[INFO] Ancien historique importé ({imported} lignes) : {legacy_file}")
+        except json.JSONDecodeError:
+            os.replace(legacy_file, f"{legacy_file}.corrupted")
+            print(f"[AVERTISSEMENT] Ancien historique corrompu, mis de côté : {legacy_file}.corrupted")
+    written = store.append(data)
+    print(f"[INFO] Historique mis à jour ({written} lignes ajoutées) : {history_dir}")
 
 # ========================
 # Fonctions de transformation
@@ -83,58 +91,109 @@ def transform_projects(data):
             })
     return projects
 
-def extract_metric(measures, metric_name):
-    for m in measures:
-        if m.get("metric") == metric_name:
-            return m.get("value", "0")
-    return "0"
+# Colonnes de métriques de fact_project_metrics et métrique SonarQube correspondante
+METRIC_COLUMNS = (
+    ("n_bugs", "bugs"),
+    ("n_vulnerabilities", "vulnerabilities"),
+    ("n_code_smells", "code_smells"),
+    ("n_hotspots", "security_hotspots"),
+    ("n_duplicated_lines", "duplicated_lines_density"),
+    ("coverage", "coverage"),
+    ("complexity", "complexity"),
+    ("n_lines_of_code", "lines_to_cover"),
+)
 
-def transform_metrics(data):
-    """Transforme les données brutes en métriques projets au format attendu."""
-    metrics = []
+# Blocs de mesures d'un projet : 'measures' (SonarQubeExtractor.extract) ou
+# 'quality_measures' / 'coverage_measures' (fetch_all_projects_resources)
+MEASURE_BLOCKS = ("measures", "quality_measures", "coverage_measures")
+
+
+def iter_project_items(data):
+    """
+    Parcourt les projets des fichiers bruts sans explorer les autres sous-arbres.
+
+    Les listes de projets de l'extracteur sont parcourues en premier, puis
+    les dictionnaires {clé de projet: ressources} de la passerelle.
+    """
+    gateway_items = []
+    for raw in data:
+        if isinstance(raw, list):
+            for item in raw:
+                if isinstance(item, dict) and isinstance(item.get("project"), dict):
+                    yield item
+        elif isinstance(raw, dict):
+            if isinstance(raw.get("project"), dict):
+                yield raw
+            else:
+                gateway_items.extend(
+                    item for item in raw.values()
+                    if isinstance(item, dict) and isinstance(item.get("project"), dict)
+                )
+    yield from gateway_items
+
+
+def measure_index(item):
+    """
+    Indexe une fois les mesures d'un projet par métrique.
+
+    Returns:
+        Dictionnaire {métrique: valeur} (première valeur rencontrée), ou None
+        si le projet n'a aucun bloc de mesures exploitable
+    """
+    index = None
+    for block in MEASURE_BLOCKS:
+        component = item.get(block, {}).get("component") if isinstance(item.get(block), dict) else None
+        if not isinstance(component, dict) or "measures" not in component:
+            continue
+        index = {} if index is None else index
+        for m in component["measures"]:
+            index.setdefault(m.get("metric"), m.get("value", "0"))
+    return index
+
+
+def transform_metrics_columns(data):
+    """
+    Transforme les données brutes en métriques projets, colonne par colonne.
+
+    Un projet présent dans plusieurs fichiers n'est retenu qu'une fois par
+    branche (sortie de l'extracteur en priorité).
+
+    Returns:
+        Dictionnaire {colonne: liste des valeurs}, une valeur par projet
+    """
     extraction_date = int(datetime.now().strftime("%Y%m%d"))
+    columns = {
+        name: [] for name in
+        ["project_key", "date_id", "branch_name"] + [name for name, _ in METRIC_COLUMNS] + ["extraction_date"]
+    }
+    seen = set()
 
-    def process_project(item):
-        # Vérifie la présence des mesures SonarQube
-        if (
-            isinstance(item, dict)
-            and "project" in item
-            and "measures" in item
-            and "component" in item["measures"]
-            and "measures" in item["measures"]["component"]
-        ):
-            project_key = item["project"].get("key")
-            branch_name = "main"
-            if "branches" in item and isinstance(item["branches"], list) and item["branches"]:
-                branch_name = item["branches"][0].get("name", "main")
-            measures = item["measures"]["component"]["measures"]
-            metrics.append({
-                "project_key": project_key,
-                "date_id": extraction_date,
-                "branch_name": branch_name,
-                "n_bugs": extract_metric(measures, "bugs"),
-                "n_vulnerabilities": extract_metric(measures, "vulnerabilities"),
-                "n_code_smells": extract_metric(measures, "code_smells"),
-                "n_hotspots": extract_metric(measures, "security_hotspots"),
-                "n_duplicated_lines": extract_metric(measures, "duplicated_lines_density"),
-                "coverage": extract_metric(measures, "coverage"),
-                "complexity": extract_metric(measures, "complexity"),
-                "n_lines_of_code": extract_metric(measures, "lines_to_cover"),
-                "extraction_date": extraction_date
-            })
+    for item in iter_project_items(data):
+        index = measure_index(item)
+        if index is None:
+            continue
+        project_key = item["project"].get("key")
+        branch_name = "main"
+        if "branches" in item and isinstance(item["branches"], list) and item["branches"]:
+            branch_name = item["branches"][0].get("name", "main")
+        if (project_key, branch_name) in seen:
+            continue
+        seen.add((project_key, branch_name))
 
-    # Parcours récursif pour trouver tous les projets
-    def recursive_search(obj):
-        if isinstance(obj, dict):
-            process_project(obj)
-            for v in obj.values():
-                recursive_search(v)
-        elif isinstance(obj, list):
-            for elem in obj:
-                recursive_search(elem)
+        columns["project_key"].append(project_key)
+        columns["date_id"].append(extraction_date)
+        columns["branch_name"].append(branch_name)
+        for name, metric in METRIC_COLUMNS:
+            columns[name].append(index.get(metric, "0"))
+        columns["extraction_date"].append(extraction_date)
+    return columns
 
-    recursive_search(data)
-    return metrics
+
+def transform_metrics(data):
+    """Transforme les données brutes en métriques projets au format attendu."""
+    columns = transform_metrics_columns(data)
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
 
 def transform_issues(data):
     """Transforme les données brutes en issues."""
@@ -184,12 +243,14 @@ def transform_projects_simple(data):
 # ========================
 
 def main():
+    # Les aperçus des données ne sont construits qu'avec LOG_LEVEL=DEBUG
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
     print(f"[INFO] Lecture des fichiers depuis : {INPUT_DIR}")
     print(f"[INFO] Les fichiers transformés seront enregistrés dans : {OUTPUT_DIR}")
 
     # Charger les données brutes
     raw_data = load_json_files(INPUT_DIR)
-    print(f"[DEBUG] Données brutes chargées : {json.dumps(raw_data, indent=2, ensure_ascii=False)}")
+    log_payload(logger, "Données brutes chargées", raw_data)
 
     # Écrire la liste simple des projets
     projects_simple = transform_projects_simple(raw_data)
@@ -198,11 +259,11 @@ def main():
     # Écrire les métriques du jour
     today_str = datetime.now().strftime("%Y%m%d")
     metrics_today = transform_metrics(raw_data)
-    print(f"[DEBUG] Métriques transformées : {json.dumps(metrics_today, indent=2, ensure_ascii=False)}")
+    log_payload(logger, "Métriques transformées", metrics_today)
     write_json(metrics_today, f"fact_project_metrics_{today_str}.json")
 
     # Mettre à jour l'historique des métriques
-    append_json_history(metrics_today, "fact_project_metrics_history.json")
+    append_history(metrics_today)
 
 if __name__ == "__main__":
     main()
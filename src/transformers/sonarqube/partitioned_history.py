@@ -0,0 +1,193 @@
+"""
+Module contenant l'historique partitionné des métriques projets SonarQube.
+
+L'historique n'est plus un unique fichier JSON relu puis réécrit en entier à
+chaque exécution : chaque 'date_id' a son propre fichier JSON Lines, auquel
+seules les nouvelles lignes sont ajoutées. Un manifeste recense les
+partitions (fichier, nombre de lignes) afin que les lecteurs ne chargent que
+les partitions de la période demandée.
+"""
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _row_key(row: Dict[str, Any]) -> str:
+    """Sérialisation canonique d'une ligne (écriture et dédoublonnage)."""
+    return json.dumps(row, sort_keys=True, ensure_ascii=False)
+
+
+class PartitionedHistoryStore:
+    """
+    Historique append-only partitionné par date (un fichier JSON Lines par date_id).
+
+    Structure du manifeste :
+    - partition_key: colonne de partitionnement
+    - partitions: {date_id: {"file": nom du fichier, "rows": nombre de lignes, "updated_at": date ISO}}
+    """
+
+    def __init__(self, history_dir: str, partition_key: str = "date_id") -> None:
+        """
+        Initialise le store et charge le manifeste existant.
+
+        Args:
+            history_dir: Dossier de l'historique
+            partition_key: Colonne des lignes servant de clé de partition
+        """
+        self.history_dir = history_dir
+        self.partition_key = partition_key
+        self._partitions: Dict[str, Dict[str, Any]] = self._load_manifest()
+
+    @property
+    def manifest_file(self) -> str:
+        """Chemin du manifeste."""
+        return os.path.join(self.history_dir, MANIFEST_FILE)
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Charge le manifeste, ou retourne un manifeste vide s'il est absent ou illisible."""
+        if not os.path.exists(self.manifest_file):
+            return {}
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            return manifest.get("partitions", {}) if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            print(f"[AVERTISSEMENT] Manifeste d'historique illisible, reconstruit : {self.manifest_file}")
+            return self._rebuild_manifest()
+
+    def _rebuild_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Reconstruit le manifeste à partir des fichiers de partition présents."""
+        partitions = {}
+        for fname in sorted(os.listdir(self.history_dir)):
+            if fname.startswith(f"{self.partition_key}=") and fname.endswith(".jsonl"):
+                partition = fname[len(self.partition_key) + 1:-len(".jsonl")]
+                partitions[partition] = {
+                    "file": fname,
+                    "rows": sum(1 for _ in self._read_file(fname)),
+                    "updated_at": None,
+                }
+        return partitions
+
+    def _save_manifest(self) -> None:
+        """Écrit le manifeste (remplacement atomique du fichier)."""
+        tmp_file = f"{self.manifest_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"partition_key": self.partition_key, "partitions": dict(sorted(self._partitions.items()))},
+                f, indent=2, ensure_ascii=False,
+            )
+        os.replace(tmp_file, self.manifest_file)
+
+    def _read_file(self, fname: str) -> Iterator[Dict[str, Any]]:
+        """Lit les lignes d'un fichier de partition."""
+        with open(os.path.join(self.history_dir, fname), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    # -----------------
+    # Écriture
+    # -----------------
+    def append(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Ajoute des lignes à l'historique.
+
+        Seule la partition de chaque date concernée est ouverte, en ajout ; une
+        ligne identique à une ligne déjà présente dans sa partition (nouvelle
+        exécution le même jour sans changement) n'est pas réécrite.
+
+        Args:
+            rows: Lignes à ajouter (chacune porte la clé de partition)
+
+        Returns:
+            Nombre de lignes écrites
+        """
+        by_partition: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_partition.setdefault(str(row[self.partition_key]), []).append(row)
+        if not by_partition:
+            return 0
+
+        os.makedirs(self.history_dir, exist_ok=True)
+        written = 0
+        for partition, partition_rows in by_partition.items():
+            entry = self._partitions.get(partition)
+            fname = entry["file"] if entry else f"{self.partition_key}={partition}.jsonl"
+            known = set()
+            if entry and os.path.exists(os.path.join(self.history_dir, fname)):
+                known = {_row_key(row) for row in self._read_file(fname)}
+
+            lines = []
+            for row in partition_rows:
+                line = _row_key(row)
+                if line not in known:
+                    known.add(line)
+                    lines.append(line)
+            if not lines:
+                continue
+            with open(os.path.join(self.history_dir, fname), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self._partitions[partition] = {
+                "file": fname,
+                "rows": (entry["rows"] if entry else 0) + len(lines),
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            written += len(lines)
+
+        if written:
+            self._save_manifest()
+        return written
+
+    def import_json_history(self, legacy_file: str) -> int:
+        """
+        Importe un historique au format JSON unique (ancien append_json_history).
+
+        Le fichier importé est renommé en '<fichier>.migrated'.
+
+        Args:
+            legacy_file: Chemin de l'ancien fichier d'historique
+
+        Returns:
+            Nombre de lignes importées
+        """
+        with open(legacy_file, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        written = self.append(row for row in rows if self.partition_key in row)
+        os.replace(legacy_file, f"{legacy_file}.migrated")
+        return written
+
+    # -----------------
+    # Lecture
+    # -----------------
+    def partitions(self, start: Optional[Any] = None, end: Optional[Any] = None) -> List[str]:
+        """
+        Retourne les partitions de la période, d'après le manifeste.
+
+        Args:
+            start: Première date_id incluse (optionnel)
+            end: Dernière date_id incluse (optionnel)
+
+        Returns:
+            Clés de partition triées
+        """
+        return [
+            partition for partition in sorted(self._partitions)
+            if (start is None or partition >= str(start)) and (end is None or partition <= str(end))
+        ]
+
+    def read(self, start: Optional[Any] = None, end: Optional[Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lit les lignes de l'historique sur une période, sans ouvrir les autres partitions.
+
+        Args:
+            start: Première date_id incluse (optionnel)
+            end: Dernière date_id incluse (optionnel)
+
+        Yields:
+            Lignes de l'historique, par date croissante
+        """
+        for partition in self.partitions(start, end):
+            yield from self._read_file(self._partitions[partition]["file"])
@@ -8,6 +8,64 @@ def save_json(data, filename, folder="data/output"):
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"[✅] Données sauvegardées dans : {path}")
+def save_json_stream(items, filename, folder="data/output"):
+    """
+    Écrit un itérable d'éléments dans un tableau JSON au fil de l'eau, sans le
+    matérialiser en mémoire (à utiliser avec les itérateurs iter_project_*).
+    Retourne le nombre d'éléments écrits.
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, filename)
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for item in items:
+            f.write(",\n" if count else "\n")
+            f.write(json.dumps(item, ensure_ascii=False))
+            count += 1
+        f.write("\n]" if count else "]")
+    print(f"[✅] {count} éléments sauvegardés en flux dans : {path}")
+    return count
+def _write_json_stream_value(f, value):
+    """
+    Écrit une valeur JSON ; les itérateurs (générateurs, etc.) sont écrits
+    comme des tableaux, élément par élément.
+    """
+    if isinstance(value, dict):
+        f.write("{")
+        for index, (key, item) in enumerate(value.items()):
+            f.write(", " if index else "")
+            f.write(json.dumps(str(key), ensure_ascii=False) + ": ")
+            _write_json_stream_value(f, item)
+        f.write("}")
+    elif isinstance(value, (str, bytes, list, tuple)) or not hasattr(value, "__iter__"):
+        f.write(json.dumps(value, ensure_ascii=False))
+    else:
+        f.write("[")
+        for index, item in enumerate(value):
+            f.write(",\n" if index else "\n")
+            f.write(json.dumps(item, ensure_ascii=False))
+        f.write("]")
+def save_json_object_stream(entries, filename, folder="data/output"):
+    """
+    Écrit un objet JSON {clé: valeur} au fil de l'eau à partir d'un itérable de
+    couples (clé, valeur). Les itérateurs présents dans les valeurs sont écrits
+    comme des tableaux sans être matérialisés en mémoire.
+    Retourne le nombre de clés écrites.
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, filename)
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for key, value in entries:
+            f.write(",\n" if count else "\n")
+            f.write(json.dumps(str(key), ensure_ascii=False) + ": ")
+            _write_json_stream_value(f, value)
+            count += 1
+        f.write("\n}" if count else "}")
+    print(f"[✅] {count} entrées sauvegardées en flux dans : {path}")
+    return count
 def get_last_extraction_date(resource: str) -> str:
     if not os.path.exists(STATE_FILE):
         return None
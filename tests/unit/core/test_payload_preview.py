@@ -0,0 +1,75 @@
+"""
+Module de tests unitaires pour PayloadPreview et log_payload.
+
+Ce module vérifie que les aperçus sont bornés et que la charge utile n'est
+sérialisée que si le niveau du message est actif.
+"""
+import logging
+
+import pytest
+
+from src.core.utils.payload_preview import PayloadPreview, log_payload
+
+
+class ExplodingPayload(list):
+    """Liste dont tout accès au contenu échoue (vérifie l'absence de sérialisation)."""
+
+    def __getitem__(self, index):
+        raise AssertionError("la charge utile a été lue")
+
+
+class TestPayloadPreview:
+    """Tests pour les aperçus de charges utiles."""
+
+    def test_preview_is_sampled_and_truncated(self):
+        """Tester l'échantillon, les clés et la troncature de l'aperçu."""
+        rows = [{"project_key": f"p{i}", "n_bugs": "x" * 200} for i in range(1000)]
+
+        text = str(PayloadPreview(rows, max_items=2, max_chars=100))
+
+        assert text.startswith("list[1000] keys=['n_bugs', 'project_key'] sample=")
+        assert '"p1"' not in text
+        assert "car.)" in text
+        assert len(text) < 250
+
+    def test_dict_preview_lists_keys(self):
+        """Tester l'aperçu d'un dictionnaire."""
+        summary = PayloadPreview({"alpha": {"issues": []}, "beta": {}}, max_items=1).summary()
+
+        assert summary == {"size": "dict[2]", "keys": ["alpha", "beta"], "sample": {"alpha": {"issues": []}}}
+
+    def test_sampled_values_are_bounded_before_serialization(self):
+        """Tester que chaque valeur échantillonnée est réduite (profondeur, éléments, textes)."""
+        row = {
+            "description": "x" * 10000,
+            "measures": [{"metric": f"m{i}", "history": list(range(10000))} for i in range(1000)],
+        }
+
+        sample = PayloadPreview([row], max_items=2, max_depth=3, max_value_chars=10).summary()["sample"]
+
+        assert sample == [{
+            "description": "xxxxxxxxxx... (+9990 car.)",
+            "measures": [
+                {"metric": "m0", "history": "<list[10000]>"},
+                {"metric": "m1", "history": "<list[10000]>"},
+                "... (+998 éléments)",
+            ],
+        }]
+
+    def test_log_payload_is_lazy_when_level_disabled(self, caplog):
+        """Tester qu'aucune lecture n'a lieu lorsque DEBUG n'est pas actif."""
+        logger = logging.getLogger("tests.payload_preview")
+        caplog.set_level(logging.INFO, logger="tests.payload_preview")
+
+        log_payload(logger, "Données brutes", ExplodingPayload([1, 2, 3]))
+
+        assert caplog.records == []
+
+    def test_log_payload_emits_preview_at_debug(self, caplog):
+        """Tester l'émission de l'aperçu lorsque DEBUG est actif."""
+        logger = logging.getLogger("tests.payload_preview")
+        caplog.set_level(logging.DEBUG, logger="tests.payload_preview")
+
+        log_payload(logger, "Métriques", [{"project_key": "alpha"}])
+
+        assert caplog.messages == ['Métriques: list[1] keys=[\'project_key\'] sample=[{"project_key": "alpha"}]']
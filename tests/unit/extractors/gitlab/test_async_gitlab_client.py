@@ -0,0 +1,182 @@
+"""
+Module de tests unitaires pour AsyncGitLabClient et AsyncGitLabExtractionEngine.
+
+Les requêtes sont servies par un serveur aiohttp local qui simule la
+pagination de l'API GitLab (en-tête 'Link').
+"""
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core.exceptions import APIRateLimitError
+from src.extractors.gitlab.async_gitlab_client import AsyncGitLabClient
+from src.extractors.gitlab.commit_stats_store import GitLabCommitStatsStore
+from src.extractors.gitlab.extraction_engine import AsyncGitLabExtractionEngine
+
+
+def _gitlab_app(calls):
+    """Construit une application simulant quelques endpoints GitLab paginés."""
+
+    async def commits(request):
+        calls.append(dict(request.query))
+        page = int(request.query.get("page", 1))
+        headers = {}
+        if page == 1:
+            next_url = request.url.update_query({"page": 2})
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        pid = request.match_info["pid"]
+        return web.json_response([{"id": f"{pid}-c{page}"}], headers=headers)
+
+    async def projects(request):
+        calls.append(dict(request.query))
+        if request.query.get("pagination") == "keyset":
+            return web.json_response({"message": "405 Method Not Allowed"}, status=405)
+        return web.json_response([{"id": 1}, {"id": 2}])
+
+    async def commit_detail(request):
+        calls.append({"sha": request.match_info["sha"]})
+        return web.json_response(
+            {"id": request.match_info["sha"], "stats": {"additions": 3, "deletions": 1, "total": 4}}
+        )
+
+    async def members(request):
+        calls.append(dict(request.query))
+        return web.json_response({"message": "429 Too Many Requests"}, status=429, headers={"Retry-After": "0"})
+
+    app = web.Application()
+    app.router.add_get("/api/v4/projects/{pid}/repository/commits", commits)
+    app.router.add_get("/api/v4/projects/{pid}/repository/commits/{sha}", commit_detail)
+    app.router.add_get("/api/v4/projects/{pid}/members", members)
+    app.router.add_get("/api/v4/projects", projects)
+    return app
+
+
+class TestAsyncGitLabClient:
+    """Tests pour le client GitLab asynchrone."""
+
+    @pytest.fixture
+    def calls(self):
+        """Fixture collectant les paramètres reçus par le serveur."""
+        return []
+
+    def _run_with_server(self, calls, scenario, commit_stats_store=None, **config):
+        """Démarre le serveur local, exécute le scénario puis arrête le serveur."""
+        async def runner():
+            server = TestServer(_gitlab_app(calls))
+            await server.start_server()
+            try:
+                client = AsyncGitLabClient(
+                    {"api_url": str(server.make_url("/api/v4")), "private_token": "glpat-test", **config},
+                    max_concurrency=4,
+                    commit_stats_store=commit_stats_store,
+                )
+                async with client:
+                    return await scenario(client), client
+            finally:
+                await server.close()
+        return asyncio.run(runner())
+
+    def test_commits_follow_link_header(self, calls):
+        """Tester le suivi de l'en-tête 'Link' sans demande systématique de with_stats."""
+        commits, client = self._run_with_server(calls, lambda c: c.get_project_commits(7))
+
+        assert commits == [{"id": "7-c1"}, {"id": "7-c2"}]
+        assert "with_stats" not in calls[0]
+        assert client.request_count == 2
+
+    def test_commit_stats_come_from_store(self, calls, tmp_path):
+        """Tester que seules les statistiques des SHA inconnus du store sont demandées."""
+        store = GitLabCommitStatsStore(str(tmp_path / "commit_stats.json"))
+        store.store("7-c1", {"additions": 10, "deletions": 2, "total": 12})
+
+        commits, _ = self._run_with_server(calls, lambda c: c.get_project_commits(7), commit_stats_store=store)
+
+        assert [commit["stats"]["total"] for commit in commits] == [12, 4]
+        assert [call["sha"] for call in calls if "sha" in call] == ["7-c2"]
+        assert store.get("7-c2") == {"additions": 3, "deletions": 1, "total": 4}
+
+    def test_projects_fall_back_to_offset(self, calls):
+        """Tester le repli sur l'offset lorsque keyset est refusée."""
+        projects, _ = self._run_with_server(calls, lambda c: c.get_projects())
+
+        assert [p["id"] for p in projects] == [1, 2]
+        assert calls[0]["pagination"] == "keyset"
+        assert "pagination" not in calls[1]
+
+    def test_rate_limit_is_raised_once_retries_are_exhausted(self, calls):
+        """Tester qu'un 429 persistant lève APIRateLimitError au lieu d'une liste vide."""
+        with pytest.raises(APIRateLimitError):
+            self._run_with_server(calls, lambda c: c.get_project_members(7), max_retries=1)
+
+        assert len(calls) == 2
+
+    def test_missing_configuration(self):
+        """Tester le rejet d'une configuration incomplète."""
+        with pytest.raises(ValueError):
+            AsyncGitLabClient({"api_url": "https://gitlab.example.com"})
+
+
+class FakeAsyncClient:
+    """Client asynchrone minimal pour tester le moteur."""
+
+    max_concurrency = 8
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.closed = False
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def get_project_commits(self, project_id, params=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01 * (4 - project_id))
+        self.in_flight -= 1
+        return [{"id": f"c{project_id}", "params": params}]
+
+    async def get_project_members(self, project_id):
+        return [{"id": project_id}]
+
+
+class TestAsyncGitLabExtractionEngine:
+    """Tests pour le moteur d'extraction asynchrone."""
+
+    def test_fetch_resources_in_one_loop(self):
+        """Tester la fusion déterministe et la réutilisation de la boucle."""
+        client = FakeAsyncClient()
+        engine = AsyncGitLabExtractionEngine(client)
+        projects = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        result = engine.fetch_resources(projects, ["commits", "members"])
+        second = engine.fetch_resource(projects, "commits", params={"since": "2024-01-01"})
+        engine.close()
+
+        assert list(result) == [1, 2, 3]
+        assert result[2] == {"commits": [{"id": "c2", "params": None}], "members": [{"id": 2}]}
+        assert second[3][0]["params"] == {"since": "2024-01-01"}
+        assert client.closed
+
+    def test_resource_concurrency_is_bounded(self):
+        """Tester la limite de concurrence par ressource."""
+        client = FakeAsyncClient()
+        engine = AsyncGitLabExtractionEngine(client, resource_concurrency={"commits": 1})
+
+        engine.fetch_resource([{"id": 1}, {"id": 2}, {"id": 3}], "commits")
+        engine.close()
+
+        assert client.peak == 1
+
+    def test_unsupported_resource(self):
+        """Tester le rejet d'une ressource non supportée."""
+        engine = AsyncGitLabExtractionEngine(FakeAsyncClient())
+
+        with pytest.raises(ValueError):
+            engine.fetch_resources([{"id": 1}], ["tags"])
+        engine.close()
@@ -0,0 +1,99 @@
+"""
+Module de tests unitaires pour GitLabCommitStatsStore et l'ajout des statistiques de commits.
+
+Ce module vérifie que GitLab n'est sollicité avec 'with_stats' que pour les
+commits dont le SHA est inconnu du store.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.extractors.gitlab.commit_stats_store import GitLabCommitStatsStore
+from src.extractors.gitlab.gitlab_client_improved import GitLabClient
+from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+
+
+def _commit(sha, minute, stats=False):
+    """Construit un commit GitLab simulé."""
+    commit = {"id": sha, "committed_date": f"2024-06-10T12:{minute:02d}:00+00:00"}
+    if stats:
+        commit["stats"] = {"additions": minute, "deletions": 1, "total": minute + 1}
+    return commit
+
+
+class TestGitLabCommitStatsStore:
+    """Tests pour le store de statistiques et GitLabProjectsGateway."""
+
+    @pytest.fixture
+    def store_file(self, tmp_path):
+        """Fixture fournissant un chemin de store temporaire."""
+        return str(tmp_path / "commit_stats.json")
+
+    @pytest.fixture
+    def mock_client(self):
+        """Fixture pour créer un mock de GitLabClient."""
+        return MagicMock(spec=GitLabClient)
+
+    def test_store_is_persisted(self, store_file):
+        """Tester la persistance des statistiques par SHA."""
+        store = GitLabCommitStatsStore(store_file)
+        store.store("abc", {"additions": 3, "deletions": 2, "total": 5})
+        store.save()
+
+        reloaded = GitLabCommitStatsStore(store_file)
+
+        assert reloaded.get("abc") == {"additions": 3, "deletions": 2, "total": 5}
+        assert reloaded.get("def") is None
+
+    def test_without_store_stats_are_not_requested(self, mock_client):
+        """Tester que 'with_stats' n'est plus imposé par défaut."""
+        mock_client.get_project_commits.return_value = [_commit("a", 1)]
+        gateway = GitLabProjectsGateway(mock_client)
+
+        gateway.get_project_commits(42)
+
+        mock_client.get_project_commits.assert_called_once_with(42, {})
+
+    def test_known_shas_are_served_from_store(self, mock_client, store_file):
+        """Tester qu'aucune requête de statistiques n'est émise pour des SHA connus."""
+        store = GitLabCommitStatsStore(store_file)
+        store.store("a", {"additions": 4, "deletions": 0, "total": 4})
+        mock_client.get_project_commits.return_value = [_commit("a", 1)]
+        gateway = GitLabProjectsGateway(mock_client, commit_stats_store=store)
+
+        commits = gateway.get_project_commits(42)
+
+        assert commits[0]["stats"] == {"additions": 4, "deletions": 0, "total": 4}
+        mock_client.iter_project_commits.assert_not_called()
+        mock_client.get_project_commit.assert_not_called()
+
+    def test_few_unknown_shas_are_read_one_by_one(self, mock_client, store_file):
+        """Tester la lecture unitaire des statistiques de quelques nouveaux commits."""
+        mock_client.get_project_commits.return_value = [_commit("new", 5)]
+        mock_client.get_project_commit.return_value = _commit("new", 5, stats=True)
+        store = GitLabCommitStatsStore(store_file)
+        gateway = GitLabProjectsGateway(mock_client, commit_stats_store=store)
+
+        commits = gateway.get_project_commits(42)
+
+        assert commits[0]["stats"]["additions"] == 5
+        mock_client.get_project_commit.assert_called_once_with(42, "new")
+        assert store.get("new") is not None
+
+    def test_many_unknown_shas_use_one_ranged_listing(self, mock_client, store_file):
+        """Tester la relecture groupée avec 'with_stats' limitée à la plage des commits inconnus."""
+        listed = [_commit(f"s{m}", m) for m in range(10, 0, -1)]
+        mock_client.iter_project_commits.side_effect = [
+            iter(listed),
+            iter([_commit(f"s{m}", m, stats=True) for m in range(10, 0, -1)]),
+        ]
+        gateway = GitLabProjectsGateway(mock_client, commit_stats_store=GitLabCommitStatsStore(store_file))
+
+        commits = list(gateway.iter_project_commits(42, {"per_page": 100}))
+
+        assert all(c["stats"]["total"] == int(c["id"][1:]) + 1 for c in commits)
+        ranged_params = mock_client.iter_project_commits.call_args_list[1].args[1]
+        assert ranged_params["with_stats"] is True
+        assert ranged_params["since"] == "2024-06-10T12:01:00+00:00"
+        assert ranged_params["until"] == "2024-06-10T12:10:00+00:00"
+        mock_client.get_project_commit.assert_not_called()
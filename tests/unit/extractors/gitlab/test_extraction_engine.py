@@ -0,0 +1,151 @@
+"""
+Module de tests unitaires pour GitLabExtractionEngine.
+
+Ce module contient les tests du moteur d'extraction concurrente qui répartit
+les appels de GitLabProjectsGateway sur un pool de workers borné.
+"""
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import APIRateLimitError
+from src.extractors.gitlab.extraction_engine import GitLabExtractionEngine
+from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+from src.utils import save_json_object_stream
+
+
+class TestGitLabExtractionEngine:
+    """Tests pour la classe GitLabExtractionEngine."""
+
+    @pytest.fixture
+    def projects(self):
+        """Fixture fournissant une liste de projets."""
+        return [{"id": pid, "name": f"Projet {pid}"} for pid in (3, 1, 2)]
+
+    @pytest.fixture
+    def mock_gateway(self):
+        """Fixture pour créer un mock de GitLabProjectsGateway."""
+        gateway = MagicMock(spec=GitLabProjectsGateway)
+        gateway.client = MagicMock(is_connected=True)
+
+        def slow_commits(project_id, params=None):
+            # Les premiers projets terminent en dernier
+            time.sleep(0.01 * project_id)
+            return [{"id": f"c{project_id}"}]
+
+        gateway.get_project_commits.side_effect = slow_commits
+        gateway.get_project_members.side_effect = lambda project_id: [{"id": project_id}]
+        return gateway
+
+    def test_fetch_resources_merges_same_shape(self, mock_gateway, projects):
+        """Tester que les résultats sont fusionnés par projet et par ressource."""
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=4)
+
+        result = engine.fetch_resources(projects, ["commits", "members"])
+
+        assert result[1] == {"commits": [{"id": "c1"}], "members": [{"id": 1}]}
+        assert mock_gateway.get_project_commits.call_count == 3
+        mock_gateway.get_project_members.assert_any_call(2)
+
+    def test_deterministic_order_follows_projects(self, mock_gateway, projects):
+        """Tester que l'ordre déterministe suit l'ordre des projets fournis."""
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=4, deterministic=True)
+
+        result = engine.fetch_resource(projects, "commits")
+
+        assert list(result.keys()) == [3, 1, 2]
+
+    def test_params_are_forwarded(self, mock_gateway, projects):
+        """Tester la transmission des paramètres d'appel à la passerelle."""
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=2)
+
+        engine.fetch_resource(projects[:1], "commits", params={"since": "2024-01-01"})
+
+        mock_gateway.get_project_commits.assert_called_once_with(3, params={"since": "2024-01-01"})
+
+    def test_resource_concurrency_is_bounded(self, mock_gateway, projects):
+        """Tester que la limite de concurrence par ressource est respectée."""
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def tracked_pipelines(project_id, params=None):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.02)
+            with lock:
+                state["current"] -= 1
+            return []
+
+        mock_gateway.get_project_pipelines.side_effect = tracked_pipelines
+        engine = GitLabExtractionEngine(
+            mock_gateway, max_workers=8, resource_concurrency={"pipelines": 1}
+        )
+
+        engine.fetch_resource(projects * 2, "pipelines")
+
+        assert state["peak"] == 1
+
+    def test_errors_yield_empty_list(self, mock_gateway, projects):
+        """Tester qu'une erreur sur un projet n'interrompt pas l'extraction."""
+        mock_gateway.get_project_issues.side_effect = RuntimeError("boom")
+        engine = GitLabExtractionEngine(mock_gateway)
+
+        result = engine.fetch_resource(projects, "issues")
+
+        assert result == {3: [], 1: [], 2: []}
+
+    def test_unsupported_resource(self, mock_gateway, projects):
+        """Tester le rejet d'une ressource non supportée."""
+        engine = GitLabExtractionEngine(mock_gateway)
+
+        with pytest.raises(ValueError):
+            engine.fetch_resources(projects, ["tags"])
+
+    def test_rate_limit_error_fails_the_step(self, mock_gateway, projects):
+        """Tester qu'une limite de débit interrompt l'étape au lieu de retourner des listes vides."""
+        mock_gateway.get_project_branches.side_effect = APIRateLimitError("limite atteinte")
+        engine = GitLabExtractionEngine(mock_gateway)
+
+        with pytest.raises(APIRateLimitError):
+            engine.fetch_resource(projects, "branches")
+
+    def test_stream_resource_spools_in_project_order(self, mock_gateway, projects):
+        """Tester que l'extraction en flux restitue les projets dans l'ordre fourni."""
+        mock_gateway.iter_project_commits.side_effect = lambda project_id: iter(
+            [{"id": f"c{project_id}-{n}"} for n in range(project_id)]
+        )
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=4)
+
+        streamed = [(pid, count, list(items)) for pid, count, items in engine.stream_resource(projects, "commits")]
+
+        assert [pid for pid, _, _ in streamed] == [3, 1, 2]
+        assert streamed[1] == (1, 1, [{"id": "c1-0"}])
+        assert streamed[0][1] == 3
+
+    def test_stream_resource_drops_partial_project(self, mock_gateway, projects):
+        """Tester qu'une erreur en cours de parcours ne laisse pas de liste tronquée."""
+        def failing_commits(project_id):
+            yield {"id": f"c{project_id}"}
+            if project_id == 1:
+                raise RuntimeError("page 2 indisponible")
+
+        mock_gateway.iter_project_commits.side_effect = failing_commits
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=2)
+
+        streamed = {pid: list(items) for pid, _, items in engine.stream_resource(projects, "commits")}
+
+        assert streamed == {3: [{"id": "c3"}], 1: [], 2: [{"id": "c2"}]}
+
+    def test_stream_resource_writes_valid_json(self, mock_gateway, projects, tmp_path):
+        """Tester l'écriture en flux d'un export {projet: [éléments]} relisible."""
+        mock_gateway.iter_project_commits.side_effect = lambda project_id: iter([{"id": project_id}])
+        engine = GitLabExtractionEngine(mock_gateway)
+        entries = ((pid, {"commits": items}) for pid, _, items in engine.stream_resource(projects, "commits"))
+
+        assert save_json_object_stream(entries, "commits.json", folder=str(tmp_path)) == 3
+        with open(tmp_path / "commits.json", encoding="utf-8") as f:
+            assert json.load(f) == {"3": {"commits": [{"id": 3}]}, "1": {"commits": [{"id": 1}]}, "2": {"commits": [{"id": 2}]}}
@@ -4,9 +4,10 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from unittest.mock import patch, MagicMock
-from gitlab.exceptions import GitlabAuthenticationError, GitlabConnectionError
+from gitlab.exceptions import GitlabAuthenticationError, GitlabConnectionError, GitlabHttpError, GitlabListError
 
 # Ajoute le chemin absolu du projet
+from src.core.exceptions import APIRateLimitError
 from src.extractors.gitlab.gitlab_client_improved import GitLabClient
 # Charger les variables d'environnement
 load_dotenv()
@@ -180,4 +181,152 @@ def test_real_connection(gitlab_config):
 
         # Test extraction d'une ressource générique (ex: projects)
         generic_projects = client.extract_gitlab_resource("projects")
-        print("extract_gitlab_resource('projects') result:", generic_projects[:2])
\ No newline at end of file
+        print("extract_gitlab_resource('projects') result:", generic_projects[:2])
+
+
+def _page_response(items, next_url=None):
+    """Construit une réponse HTTP paginée simulée."""
+    response = MagicMock()
+    response.json.return_value = items
+    response.links = {"next": {"url": next_url}} if next_url else {}
+    response.headers = {}
+    return response
+
+
+class TestGitLabClientPagination:
+    """Tests de la pagination, des itérateurs et des handles de projet de GitLabClient."""
+
+    @pytest.fixture
+    def connected_client(self):
+        """Client dont la connexion python-gitlab est remplacée par un mock."""
+        client = GitLabClient({"api_url": "https://gitlab.example.com", "private_token": "glpat-test"})
+        client._gitlab_client = MagicMock()
+        client._connection_status = True
+        return client
+
+    def test_iter_project_commits_streams_dicts(self, connected_client):
+        """Teste que l'itérateur convertit les objets au fil de l'eau avec iterator=True."""
+        commits = [MagicMock(attributes={"id": f"sha{i}"}) for i in range(3)]
+        project = connected_client._gitlab_client.projects.get.return_value
+        project.commits.list.return_value = iter(commits)
+
+        iterator = connected_client.iter_project_commits(42, {"since": "2024-01-01"})
+        project.commits.list.assert_not_called()  # évaluation paresseuse
+
+        assert next(iterator) == {"id": "sha0"}
+        assert [c["id"] for c in iterator] == ["sha1", "sha2"]
+        project.commits.list.assert_called_once_with(iterator=True, since="2024-01-01", per_page=100)
+
+    def test_iter_project_merge_requests_raises_mid_stream_error(self, connected_client):
+        """Teste qu'une erreur sur une page suivante est propagée après les premiers éléments."""
+        def failing_pages(**kwargs):
+            yield MagicMock(attributes={"iid": 1})
+            raise GitlabListError("API down")
+
+        project = connected_client._gitlab_client.projects.get.return_value
+        project.mergerequests.list.side_effect = failing_pages
+
+        iterator = connected_client.iter_project_merge_requests(42)
+        assert next(iterator) == {"iid": 1}
+        with pytest.raises(GitlabListError):
+            next(iterator)
+
+    def test_extract_projects_uses_keyset_pagination(self, connected_client):
+        """Teste que le listing des projets demande la pagination keyset."""
+        connected_client._gitlab_client.projects.list.return_value = [MagicMock(attributes={"id": 1})]
+
+        projects = connected_client.extract_gitlab_resource("projects", additional_parameters={"archived": "false"})
+
+        assert projects == [{"id": 1}]
+        connected_client._gitlab_client.projects.list.assert_called_once_with(
+            get_all=True, archived="false", pagination="keyset", order_by="id", sort="asc"
+        )
+
+    def test_extract_resource_falls_back_to_offset(self, connected_client):
+        """Teste le repli sur la pagination offset lorsque keyset est refusée."""
+        manager = connected_client._gitlab_client.groups
+        manager.list.side_effect = [GitlabListError("405 Method Not Allowed"), [MagicMock(attributes={"id": 7})]]
+
+        groups = connected_client.extract_gitlab_resource("groups")
+
+        assert groups == [{"id": 7}]
+        manager.list.assert_called_with(get_all=True)
+
+    def test_incompatible_ordering_uses_offset(self, connected_client):
+        """Teste qu'un tri incompatible avec keyset conserve la pagination offset."""
+        connected_client.extract_gitlab_resource("projects", additional_parameters={"order_by": "name"})
+
+        connected_client._gitlab_client.projects.list.assert_called_once_with(get_all=True, order_by="name")
+
+    def test_iter_http_pages_follows_link_header(self, connected_client):
+        """Teste que les pages keyset sont parcourues via l'en-tête 'Link'."""
+        next_url = "https://gitlab.example.com/api/v4/users?id_after=2&pagination=keyset"
+        http_request = connected_client._gitlab_client.http_request
+        http_request.side_effect = [_page_response([{"id": 1}, {"id": 2}], next_url), _page_response([{"id": 3}])]
+
+        pages = list(connected_client.iter_http_pages("/users", {"per_page": 2}, resource_type="users"))
+
+        assert pages == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        http_request.assert_any_call(
+            "get", "/users", query_data={"per_page": 2, "order_by": "id", "sort": "asc", "pagination": "keyset"}
+        )
+        http_request.assert_called_with("get", next_url, query_data={})
+
+    def test_iter_http_pages_falls_back_to_offset(self, connected_client):
+        """Teste le repli sur l'offset quand la première page keyset échoue."""
+        offset_page = _page_response([{"id": 1}])
+        offset_page.headers = {"X-Next-Page": "2"}
+        http_request = connected_client._gitlab_client.http_request
+        http_request.side_effect = [GitlabHttpError("405"), offset_page, _page_response([])]
+
+        pages = list(connected_client.iter_http_pages("/groups", resource_type="groups"))
+
+        assert pages == [[{"id": 1}]]
+        http_request.assert_called_with("get", "/groups", query_data={"per_page": 100, "page": 2})
+
+    def test_project_resources_use_lazy_project_handle(self, connected_client):
+        """Teste que les sous-ressources n'entraînent pas de GET préalable du projet."""
+        project = connected_client._gitlab_client.projects.get.return_value
+        project.pipelines.list.return_value = [MagicMock(attributes={"id": 5})]
+
+        pipelines = connected_client.get_project_pipelines(42)
+
+        assert pipelines == [{"id": 5}]
+        connected_client._gitlab_client.projects.get.assert_called_once_with(42, lazy=True)
+        assert connected_client.get_request_statistics()["avoided_project_lookups"] == 1
+
+    def test_request_counter_hook(self, connected_client):
+        """Teste le comptage des réponses HTTP par le hook de session."""
+        for _ in range(3):
+            connected_client._count_http_response(MagicMock())
+
+        assert connected_client.get_request_statistics()["http_requests"] == 3
+
+    def test_project_getters_propagate_rate_limit_error(self, connected_client):
+        """Teste qu'une limite de débit n'est pas convertie en liste vide."""
+        project = connected_client._gitlab_client.projects.get.return_value
+        project.issues.list.side_effect = APIRateLimitError("limite atteinte")
+
+        with pytest.raises(APIRateLimitError):
+            connected_client.get_project_issues(42)
+
+    def test_commit_count_from_project_statistics(self, connected_client):
+        """Teste le comptage des commits via 'statistics.commit_count', sans lister les commits."""
+        project = MagicMock(attributes={"id": 42, "statistics": {"commit_count": 1234}})
+        connected_client._gitlab_client.projects.get.return_value = project
+
+        assert connected_client.get_project_commit_count(42) == 1234
+        connected_client._gitlab_client.projects.get.assert_called_once_with(42, statistics=True)
+        project.commits.list.assert_not_called()
+
+    def test_commit_count_falls_back_to_total_header(self, connected_client):
+        """Teste le repli sur l'en-tête 'X-Total' quand les statistiques sont inaccessibles."""
+        connected_client._gitlab_client.projects.get.return_value = MagicMock(attributes={"id": 42})
+        page = _page_response([{"id": "sha"}])
+        page.headers = {"X-Total": "87"}
+        connected_client._gitlab_client.http_request.return_value = page
+
+        assert connected_client.get_project_commit_count(42) == 87
+        connected_client._gitlab_client.http_request.assert_called_once_with(
+            "get", "/projects/42/repository/commits", query_data={"per_page": 1}
+        )
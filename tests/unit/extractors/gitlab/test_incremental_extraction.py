@@ -0,0 +1,152 @@
+"""
+Module de tests unitaires pour l'extraction incrémentielle GitLab.
+
+Ce module couvre le dédoublonnage de la fenêtre de recouvrement et
+l'extraction en une passe.
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.extractors.gitlab import main as gitlab_main
+from src.extractors.gitlab.extraction_engine import GitLabExtractionEngine
+from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+from src.extractors.gitlab.stats_accumulator import GitLabStatsAccumulator
+
+
+class TestOverlapDeduplication:
+    """Tests pour le dédoublonnage de la fenêtre de recouvrement."""
+
+    @pytest.fixture(autouse=True)
+    def workdir(self, tmp_path, monkeypatch):
+        """Fixture isolant les fichiers d'état dans un répertoire temporaire."""
+        monkeypatch.chdir(tmp_path)
+
+    @staticmethod
+    def _date(item):
+        return item.get("created_at")
+
+    @staticmethod
+    def _run(resource, items, last_date, date_getter):
+        """Sélectionne le delta d'une exécution puis enregistre son watermark."""
+        delta = gitlab_main.IncrementalDelta(resource, last_date, date_getter)
+        selected = [item for item in items if delta.keep(item)]
+        delta.commit()
+        return selected, delta.max_date
+
+    def test_late_item_in_overlap_is_recovered(self):
+        """Tester qu'un élément daté juste avant le watermark et jamais livré est conservé."""
+        first_run = [{"id": "a", "created_at": "2024-06-10T11:58:00Z"},
+                     {"id": "b", "created_at": "2024-06-10T12:00:00Z"}]
+        _, watermark = self._run("commits", first_run, None, self._date)
+
+        second_run = first_run + [{"id": "late", "created_at": "2024-06-10T11:55:00Z"},
+                                  {"id": "c", "created_at": "2024-06-10T12:30:00Z"}]
+        selected, max_date = self._run("commits", second_run, watermark, self._date)
+
+        assert watermark == "2024-06-10T12:00:00Z"
+        assert [item["id"] for item in selected] == ["late", "c"]
+        assert max_date == "2024-06-10T12:30:00Z"
+
+    def test_updated_item_is_delivered_again(self):
+        """Tester qu'un élément modifié de nouveau (nouvelle date) n'est pas écarté."""
+        updated_at = lambda item: item.get("updated_at")
+        _, watermark = self._run("issues", [{"id": 7, "updated_at": "2024-06-10T12:00:00Z"}], None, updated_at)
+
+        selected, _ = self._run("issues", [{"id": 7, "updated_at": "2024-06-10T12:04:00Z"}], watermark, updated_at)
+
+        assert len(selected) == 1
+
+    def test_items_before_overlap_are_ignored(self):
+        """Tester que les éléments antérieurs à la fenêtre de recouvrement sont écartés."""
+        selected, _ = self._run(
+            "commits", [{"id": "old", "created_at": "2024-06-10T11:00:00Z"}], "2024-06-10T12:00:00Z", self._date
+        )
+
+        assert selected == []
+
+
+class TestSinglePassExtraction:
+    """Tests pour le plan d'extraction en une passe."""
+
+    @pytest.fixture(autouse=True)
+    def workdir(self, tmp_path, monkeypatch):
+        """Fixture isolant les exports et fichiers d'état dans un répertoire temporaire."""
+        monkeypatch.chdir(tmp_path)
+
+    @pytest.fixture
+    def projects(self):
+        """Fixture fournissant deux projets."""
+        return [{"id": 1, "name": "api"}, {"id": 2, "name": "web"}]
+
+    @pytest.fixture
+    def mock_gateway(self):
+        """Fixture pour créer un mock de GitLabProjectsGateway servant des commits."""
+        gateway = MagicMock(spec=GitLabProjectsGateway)
+        gateway.client = MagicMock(is_connected=True)
+        commits = {
+            1: [{"id": "a", "created_at": "2024-06-10T12:30:00Z"}, {"id": "b", "created_at": "2024-06-01T08:00:00Z"}],
+            2: [{"id": "c", "created_at": "2024-06-09T10:00:00Z"}],
+        }
+        gateway.iter_project_commits.side_effect = lambda project_id: iter(commits[project_id])
+        return gateway
+
+    @staticmethod
+    def _read(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_full_incremental_and_counts_from_one_fetch(self, mock_gateway, projects):
+        """Tester que l'export full, le delta et les comptes proviennent d'un seul parcours."""
+        gitlab_main.set_last_extraction_date("commits", "2024-06-10T00:00:00Z")
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=2)
+
+        counts = gitlab_main.extract_resource_single_pass(
+            mock_gateway, projects, "commits", gitlab_main.EXTRACTION_PLAN["commits"], engine=engine
+        )
+
+        assert counts == {"api": 2, "web": 1}
+        assert mock_gateway.iter_project_commits.call_count == 2
+        full = self._read("data/output/projects_commits_full.json")
+        assert full["1"]["project"] == {"id": 1, "name": "api"}
+        assert [c["id"] for c in full["1"]["commits"]] == ["a", "b"]
+        incremental = self._read("data/output/projects_commits_incremental.json")
+        assert incremental == {"1": [{"id": "a", "created_at": "2024-06-10T12:30:00Z"}], "2": []}
+        assert gitlab_main.get_last_extraction_date("commits") == "2024-06-10T12:30:00Z"
+
+    def test_rerun_does_not_deliver_overlap_again(self, mock_gateway, projects):
+        """Tester qu'une seconde exécution ne relivre pas les éléments de la fenêtre de recouvrement."""
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=2)
+        spec = gitlab_main.EXTRACTION_PLAN["commits"]
+
+        gitlab_main.extract_resource_single_pass(mock_gateway, projects, "commits", spec, engine=engine)
+        gitlab_main.extract_resource_single_pass(mock_gateway, projects, "commits", spec, engine=engine)
+
+        incremental = self._read("data/output/projects_commits_incremental.json")
+        assert incremental == {"1": [], "2": []}
+
+    def test_resource_without_incremental_writes_full_only(self, mock_gateway, projects):
+        """Tester qu'une ressource sans delta (membres) n'écrit que l'export full par nom de projet."""
+        mock_gateway.iter_project_members.side_effect = lambda project_id: iter([{"id": project_id * 10}])
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=2)
+
+        gitlab_main.extract_resource_single_pass(
+            mock_gateway, projects, "members", gitlab_main.EXTRACTION_PLAN["members"], engine=engine
+        )
+
+        assert self._read("data/output/projects_members_full.json") == {"api": [{"id": 10}], "web": [{"id": 20}]}
+
+    def test_delta_feeds_stats_accumulator(self, mock_gateway, projects):
+        """Tester que seul le delta incrémentiel alimente les accumulateurs de statistiques."""
+        gitlab_main.set_last_extraction_date("commits", "2024-06-10T00:00:00Z")
+        engine = GitLabExtractionEngine(mock_gateway, max_workers=2)
+        accumulator = GitLabStatsAccumulator("data/accumulators.json")
+
+        gitlab_main.extract_resource_single_pass(
+            mock_gateway, projects, "commits", gitlab_main.EXTRACTION_PLAN["commits"],
+            engine=engine, accumulator=accumulator
+        )
+
+        commits = accumulator.rolling_stats("2024-06-01", "2024-06-30")["commits"]
+        assert commits["daily_activity"] == {"2024-06-10": 1}
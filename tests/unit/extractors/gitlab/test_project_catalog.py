@@ -0,0 +1,52 @@
+"""
+Module de tests unitaires pour GitLabProjectCatalog.
+
+Ce module contient les tests du catalogue de projets partagé par une
+exécution de l'extraction GitLab.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.extractors.gitlab.main import fetch_projects_commits_count
+from src.extractors.gitlab.project_catalog import GitLabProjectCatalog
+from src.extractors.gitlab.projects_gateway import GitLabProjectsGateway
+
+
+class TestGitLabProjectCatalog:
+    """Tests pour la classe GitLabProjectCatalog."""
+
+    @pytest.fixture
+    def mock_gateway(self):
+        """Fixture pour créer un mock de GitLabProjectsGateway."""
+        gateway = MagicMock(spec=GitLabProjectsGateway)
+        gateway.get_projects.return_value = [
+            {"id": 1, "name": "api"},
+            {"id": 2, "name": "web"},
+            {"id": 3, "name": "docs"},
+        ]
+        return gateway
+
+    def test_projects_are_listed_once(self, mock_gateway):
+        """Tester que le listing n'est effectué qu'une fois par exécution."""
+        catalog = GitLabProjectCatalog(mock_gateway, params={"membership": True})
+
+        catalog.get_projects()
+        catalog.get_projects()
+        assert len(catalog) == 3
+
+        mock_gateway.get_projects.assert_called_once_with(params={"membership": True})
+
+    def test_commit_count_uses_listing_statistics(self, mock_gateway):
+        """Tester que le comptage demande les statistiques au listing au lieu de lire chaque projet."""
+        mock_gateway.get_projects.return_value = [
+            {"id": 1, "name": "api", "statistics": {"commit_count": 12}},
+            {"id": 2, "name": "web"},
+        ]
+        mock_gateway.get_project_commit_count.return_value = 3
+
+        counts = fetch_projects_commits_count(mock_gateway, params={"membership": True})
+
+        mock_gateway.get_projects.assert_called_once_with(params={"membership": True, "statistics": True})
+        mock_gateway.get_project_commit_count.assert_called_once_with(2)
+        assert counts == {"api": 12, "web": 3}
@@ -0,0 +1,99 @@
+"""
+Module de tests unitaires pour RateLimitGovernor.
+
+Les tests utilisent une horloge simulée : les attentes avancent l'horloge au
+lieu de bloquer le thread.
+"""
+import threading
+
+import pytest
+
+from src.core.exceptions import APIRateLimitError
+from src.extractors.gitlab.rate_limit_governor import RateLimitGovernor
+
+
+class FakeClock:
+    """Horloge simulée dont sleep() avance le temps."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+
+class TestRateLimitGovernor:
+    """Tests pour la classe RateLimitGovernor."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fixture fournissant une horloge simulée."""
+        return FakeClock()
+
+    def _governor(self, clock, **kwargs):
+        return RateLimitGovernor(clock=clock, sleep=clock.sleep, **kwargs)
+
+    def test_burst_then_throttled_at_rate(self, clock):
+        """Tester que le débit est plafonné une fois la rafale consommée."""
+        governor = self._governor(clock, rate_per_second=10, burst=5)
+
+        for _ in range(15):
+            governor.acquire()
+
+        assert clock.slept == pytest.approx(1.0)
+
+    def test_rate_follows_server_budget(self, clock):
+        """Tester l'adaptation du débit aux en-têtes RateLimit-*."""
+        governor = self._governor(clock, rate_per_second=30, reserve=10)
+
+        governor.observe(200, {
+            "RateLimit-Limit": "600",
+            "RateLimit-Remaining": "110",
+            "RateLimit-Reset": str(int(clock.now + 50)),
+        })
+
+        budget = governor.budget()
+        assert budget["rate_per_second"] == pytest.approx(2.0)
+        assert budget["server_remaining"] == 110
+        assert budget["server_limit"] == 600
+
+    def test_retry_after_pauses_all_workers(self, clock):
+        """Tester qu'une réponse 429 suspend tous les workers."""
+        governor = self._governor(clock, rate_per_second=100, burst=100)
+
+        governor.observe(429, {"Retry-After": "7"})
+        governor.acquire()
+
+        assert clock.slept == pytest.approx(7.0)
+        assert governor.budget()["rate_limited_responses"] == 1
+
+    def test_excessive_wait_raises(self, clock):
+        """Tester la levée d'APIRateLimitError au-delà de l'attente maximale."""
+        governor = self._governor(clock, max_wait_seconds=30)
+
+        governor.observe(429, {"Retry-After": "3600"})
+
+        with pytest.raises(APIRateLimitError):
+            governor.acquire()
+
+    def test_tokens_are_shared_between_threads(self):
+        """Tester qu'un même jeton n'est jamais consommé deux fois."""
+        governor = RateLimitGovernor(rate_per_second=0.1, burst=20, sleep=lambda s: None, max_wait_seconds=None)
+        granted = []
+
+        def worker():
+            if governor.reserve_token() == 0:
+                granted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(50)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(granted) == 20
@@ -0,0 +1,163 @@
+"""
+Module de tests unitaires pour GitLabResponseCache.
+
+Ce module vérifie que les ressources éligibles sont redemandées avec des
+en-têtes conditionnels et que le corps en cache est réutilisé sur un 304,
+avec la session synchrone comme avec le client asynchrone.
+"""
+import asyncio
+import json
+
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from requests.adapters import BaseAdapter
+
+from src.core.exceptions import ExtractionError
+from src.extractors.gitlab.async_gitlab_client import AsyncGitLabClient
+from src.extractors.gitlab.rate_limit_governor import RateLimitedSession, RateLimitGovernor
+from src.extractors.gitlab.response_cache import GitLabResponseCache
+
+API_URL = "https://gitlab.example.com/api/v4"
+
+
+class FakeGitLabAdapter(BaseAdapter):
+    """Adaptateur requests répondant 304 quand 'If-None-Match' correspond à l'ETag."""
+
+    def __init__(self, body, etag='W/"v1"'):
+        super().__init__()
+        self.body = body
+        self.etag = etag
+        self.sent_headers = []
+
+    def send(self, request, **kwargs):
+        self.sent_headers.append(dict(request.headers))
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["ETag"] = self.etag
+        if request.headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response.headers["Link"] = f'<{API_URL}/groups?page=2>; rel="next"'
+            response._content = json.dumps(self.body).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+class TestGitLabResponseCache:
+    """Tests pour le cache des réponses conditionnelles."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture fournissant un cache dans un dossier temporaire."""
+        return GitLabResponseCache(str(tmp_path / "http_cache"))
+
+    def _session(self, cache, adapter):
+        session = RateLimitedSession(RateLimitGovernor(), cache)
+        session.mount("https://", adapter)
+        return session
+
+    def test_only_matching_get_requests_are_cacheable(self, cache):
+        """Tester la sélection des chemins éligibles au cache."""
+        assert cache.is_cacheable("get", f"{API_URL}/projects/12/members/all")
+        assert cache.is_cacheable("GET", f"{API_URL}/projects/group%2Fapp/repository/branches")
+        assert cache.is_cacheable("GET", f"{API_URL}/groups")
+        assert not cache.is_cacheable("GET", f"{API_URL}/projects/12/repository/commits")
+        assert not cache.is_cacheable("POST", f"{API_URL}/groups")
+
+    def test_not_modified_reuses_cached_body(self, cache):
+        """Tester qu'un 304 est remplacé par la réponse 200 mise en cache."""
+        adapter = FakeGitLabAdapter([{"id": 1, "name": "devops"}])
+        session = self._session(cache, adapter)
+
+        first = session.request("get", f"{API_URL}/groups", params={"per_page": 100})
+        second = session.request("get", f"{API_URL}/groups", params={"per_page": 100})
+
+        assert "If-None-Match" not in adapter.sent_headers[0]
+        assert adapter.sent_headers[1]["If-None-Match"] == 'W/"v1"'
+        assert second.status_code == 200
+        assert second.json() == first.json() == [{"id": 1, "name": "devops"}]
+        assert second.links["next"]["url"] == f"{API_URL}/groups?page=2"
+        stats = cache.statistics()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+        assert stats["bytes_saved"] == len(first.content)
+
+    def test_params_are_part_of_the_key(self, cache):
+        """Tester que des paramètres différents ne partagent pas d'entrée."""
+        adapter = FakeGitLabAdapter([{"id": 1}])
+        session = self._session(cache, adapter)
+
+        session.request("get", f"{API_URL}/groups", params={"page": 1})
+        session.request("get", f"{API_URL}/groups", params={"page": 2})
+
+        assert "If-None-Match" not in adapter.sent_headers[1]
+
+    def test_cache_persists_between_runs(self, cache, tmp_path):
+        """Tester que les entrées sont relues par un nouveau cache (exécution suivante)."""
+        self._session(cache, FakeGitLabAdapter([{"id": 3}])).request("get", f"{API_URL}/projects/3")
+
+        next_run = GitLabResponseCache(str(tmp_path / "http_cache"))
+        response = self._session(next_run, FakeGitLabAdapter([{"id": 3}])).request("get", f"{API_URL}/projects/3")
+
+        assert response.json() == [{"id": 3}]
+        assert next_run.statistics()["hits"] == 1
+
+    def test_async_client_replays_not_modified(self, cache):
+        """Tester la réutilisation du cache par le client asynchrone."""
+        calls = []
+
+        async def branches(request):
+            calls.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"b1"':
+                return web.Response(status=304, headers={"ETag": '"b1"'})
+            return web.json_response([{"name": "main"}], headers={"ETag": '"b1"'})
+
+        async def runner():
+            app = web.Application()
+            app.router.add_get("/api/v4/projects/{pid}/repository/branches", branches)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                client = AsyncGitLabClient(
+                    {"api_url": str(server.make_url("/api/v4")), "private_token": "glpat-test"},
+                    response_cache=cache,
+                )
+                async with client:
+                    return await client.get_project_branches(5), await client.get_project_branches(5)
+            finally:
+                await server.close()
+
+        first, second = asyncio.run(runner())
+
+        assert first == second == [{"name": "main"}]
+        assert calls == [None, '"b1"']
+        assert cache.statistics()["hits"] == 1
+
+    def test_async_client_raises_when_cached_entry_is_gone(self, cache):
+        """Tester qu'un 304 sans entrée en cache à la dernière tentative lève une erreur."""
+        async def branches(request):
+            return web.Response(status=304, headers={"ETag": '"b1"'})
+
+        async def runner():
+            app = web.Application()
+            app.router.add_get("/api/v4/projects/{pid}/repository/branches", branches)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                client = AsyncGitLabClient(
+                    {"api_url": str(server.make_url("/api/v4")), "private_token": "glpat-test", "max_retries": 1},
+                    response_cache=cache,
+                )
+                async with client:
+                    return await client.get_all("/projects/5/repository/branches")
+            finally:
+                await server.close()
+
+        with pytest.raises(ExtractionError):
+            asyncio.run(runner())
@@ -0,0 +1,147 @@
+"""
+Module de tests unitaires pour GitLabStatsAccumulator.
+
+Ce module vérifie que les accumulateurs journaliers sont alimentés de façon
+idempotente par les deltas incrémentiels et que les statistiques d'une
+période sont calculées sans relire l'historique brut.
+"""
+import json
+
+import pytest
+
+from src.extractors.gitlab.stats_accumulator import GitLabStatsAccumulator
+
+
+class TestGitLabStatsAccumulator:
+    """Tests pour le store d'accumulateurs de statistiques."""
+
+    @pytest.fixture
+    def store_file(self, tmp_path):
+        """Fixture fournissant un chemin de store temporaire."""
+        return str(tmp_path / "accumulators.json")
+
+    @pytest.fixture
+    def accumulator(self, store_file):
+        """Fixture fournissant un store alimenté avec deux projets."""
+        accumulator = GitLabStatsAccumulator(store_file)
+        accumulator.ingest("merge_requests", {
+            1: [
+                {"id": 10, "state": "merged", "created_at": "2024-06-03T10:00:00Z",
+                 "merged_at": "2024-06-03T14:00:00Z"},
+                {"id": 11, "state": "opened", "created_at": "2024-06-04T10:00:00Z"},
+            ],
+            2: [
+                {"id": 20, "state": "merged", "created_at": "2024-06-01T10:00:00Z",
+                 "merged_at": "2024-06-05T10:00:00Z"},
+            ],
+        })
+        accumulator.ingest("pipelines", {
+            1: [
+                {"id": 100, "status": "success", "created_at": "2024-06-03T10:00:00Z", "duration": 100},
+                {"id": 101, "status": "running", "created_at": "2024-06-11T10:00:00Z"},
+            ],
+        })
+        return accumulator
+
+    def test_rolling_stats_from_buckets(self, accumulator):
+        """Tester le calcul des statistiques d'une période à partir des compartiments."""
+        stats = accumulator.rolling_stats("2024-06-01", "2024-06-30")
+
+        assert stats["merge_requests"] == {"created_mrs": 3, "merged_mrs": 2, "avg_time_to_merge": 50.0}
+        assert stats["pipelines"]["status_distribution"] == {"success": 1, "failed": 0, "other": 1}
+        assert stats["pipelines"]["success_rate"] == 100.0
+        assert stats["pipelines"]["avg_duration"] == 100
+        assert stats["pipelines"]["weekly_distribution"] == {
+            "2024-06-03": {"total": 1, "success": 1, "failed": 0, "other": 0},
+            "2024-06-10": {"total": 1, "success": 0, "failed": 0, "other": 1},
+        }
+
+    def test_rolling_stats_by_window_and_project(self, accumulator):
+        """Tester le filtrage par période (date d'événement) et par projet."""
+        stats = accumulator.rolling_stats("2024-06-03", "2024-06-04", project_ids=[1])
+
+        assert stats["merge_requests"] == {"created_mrs": 2, "merged_mrs": 1, "avg_time_to_merge": 4.0}
+        assert stats["pipelines"]["total_pipelines"] == 1
+
+    def test_redelivered_item_replaces_its_contribution(self, accumulator):
+        """Tester qu'un élément relivré modifié remplace sa contribution précédente."""
+        changed = accumulator.ingest("pipelines", {
+            1: [
+                {"id": 100, "status": "success", "created_at": "2024-06-03T10:00:00Z", "duration": 100},
+                {"id": 101, "status": "failed", "created_at": "2024-06-11T10:00:00Z", "duration": 300},
+            ],
+        })
+
+        pipelines = accumulator.rolling_stats("2024-06-01", "2024-06-30")["pipelines"]
+        assert changed == 1
+        assert pipelines["status_distribution"] == {"success": 1, "failed": 1, "other": 0}
+        assert pipelines["avg_duration"] == 200
+
+    def test_accumulators_are_persisted(self, accumulator, store_file):
+        """Tester que les accumulateurs et les contributions sont relus à l'exécution suivante."""
+        accumulator.save()
+
+        reloaded = GitLabStatsAccumulator(store_file)
+        changed = reloaded.ingest("merge_requests", {
+            1: [{"id": 11, "state": "opened", "created_at": "2024-06-04T10:00:00Z"}],
+        })
+
+        assert changed == 0
+        assert reloaded.rolling_stats("2024-06-01", "2024-06-30") == accumulator.rolling_stats(
+            "2024-06-01", "2024-06-30"
+        )
+
+    def test_commits_daily_activity(self, store_file):
+        """Tester l'activité quotidienne des commits et les ressources ignorées."""
+        accumulator = GitLabStatsAccumulator(store_file)
+        accumulator.ingest("commits", {1: [
+            {"id": "a", "created_at": "2024-06-10T12:30:00Z"},
+            {"id": "b", "committed_date": "2024-06-10T08:00:00Z"},
+            {"id": "c", "created_at": "2024-06-12T08:00:00Z"},
+        ]})
+
+        assert accumulator.ingest("branches", {1: [{"id": "main"}]}) == 0
+        commits = accumulator.rolling_stats("2024-06-10", "2024-06-11")["commits"]
+        assert commits == {"total_commits": 2, "avg_commits_per_day": 1.0, "daily_activity": {"2024-06-10": 2}}
+
+    def test_redelivered_commits_are_counted_once_without_contributions(self, store_file):
+        """Tester le dédoublonnage des commits par jour, sans contribution mémorisée par commit."""
+        accumulator = GitLabStatsAccumulator(store_file, retention_days=100000)
+        commits = {1: [{"id": "a", "created_at": "2024-06-10T12:30:00Z"}]}
+
+        assert accumulator.ingest("commits", commits) == 1
+        assert accumulator.ingest("commits", commits) == 0
+        accumulator.save()
+
+        with open(store_file, encoding="utf-8") as f:
+            data = json.load(f)
+        assert "commits" not in data["contributions"]
+        assert data["commit_days"] == {"1": {"2024-06-10": ["a"]}}
+
+    def test_prune_forgets_frozen_items_without_recounting_them(self, accumulator):
+        """Tester qu'un élément oublié puis relivré ne modifie pas les jours figés."""
+        before = accumulator.rolling_stats("2024-06-01", "2024-06-30")
+
+        removed = accumulator.prune("2024-06-04")
+        changed = accumulator.ingest("merge_requests", {1: [
+            {"id": 10, "state": "merged", "created_at": "2024-06-03T10:00:00Z",
+             "merged_at": "2024-06-03T14:00:00Z"},
+        ]})
+
+        assert removed == 2
+        assert changed == 0
+        assert accumulator.rolling_stats("2024-06-01", "2024-06-30") == before
+
+    def test_late_transition_of_forgotten_item_counts_open_days_only(self, store_file):
+        """Tester qu'une issue fermée après l'oubli de sa création n'est comptée qu'à sa fermeture."""
+        accumulator = GitLabStatsAccumulator(store_file)
+        accumulator.ingest("issues", {1: [{"id": 5, "state": "opened", "created_at": "2024-06-01T10:00:00Z"}]})
+        accumulator.prune("2024-06-05")
+
+        accumulator.ingest("issues", {1: [
+            {"id": 5, "state": "closed", "created_at": "2024-06-01T10:00:00Z", "closed_at": "2024-06-10T10:00:00Z"},
+        ]})
+
+        issues = accumulator.rolling_stats("2024-06-01", "2024-06-30")["issues"]
+        assert (issues["created_issues"], issues["closed_issues"]) == (1, 1)
+        assert issues["avg_time_to_close"] == 216.0
@@ -336,3 +336,178 @@ class TestGitLabStatsExtractor:
         assert stats['pipelines_by_ref']['feature-branch'] == 1
         assert stats['pipelines_by_ref']['develop'] == 1
         assert len(stats['weekly_distribution']) > 0  # Au moins une semaine
+
+
+class TestStatsBackendParity:
+    """Tests de parité entre les moteurs de calcul "python" et "pandas"."""
+
+    COMMITS = [
+        {"author_name": "Dev 2", "author_email": "dev2@example.com", "created_at": "2023-06-16T09:15:00+02:00"},
+        {"author_name": "Dev 1", "author_email": "dev1@example.com", "created_at": "2023-06-15T10:00:00Z"},
+        {"author_email": "bot@example.com", "created_at": ""},
+        {"author_name": "Dev 1", "author_email": "dev1@example.com", "created_at": "2023-06-15T14:30:00Z"},
+        {"author_name": "Dev 3", "author_email": "dev3@example.com", "created_at": "2023-06-14T23:59:59Z"},
+    ]
+
+    MERGE_REQUESTS = [
+        {"state": "opened", "approvals_required": 1, "author": {"username": "dev2"}, "changes_count": 120,
+         "user_notes_count": 1},
+        {"state": "merged", "created_at": "2023-06-10T10:00:00Z", "merged_at": "2023-06-12T15:00:00.123Z",
+         "approvals_required": 2, "author": {"username": "dev1"}, "changes_count": 50, "user_notes_count": 3},
+        {"state": "merged", "created_at": "2023-06-11T10:00:00+02:00", "merged_at": None,
+         "author": {"username": "dev3"}, "changes_count": 999},
+        {"state": "closed", "approvals_required": 2, "author": {}, "changes_count": 2000, "user_notes_count": 5},
+        {"state": "merged", "created_at": "2023-06-01T08:00:00Z", "merged_at": "2023-06-01T09:20:00Z",
+         "approvals_required": 0, "author": {"username": "dev1"}, "changes_count": 500},
+    ]
+
+    ISSUES = [
+        {"state": "closed", "created_at": "2023-06-05T10:00:00Z", "closed_at": "2023-06-08T15:00:00Z",
+         "labels": ["bug", "Critical"], "author": {"username": "dev1"}, "assignee": {"username": "dev2"}},
+        {"state": "opened", "labels": ["enhancement", "priority::low"], "author": {"username": "dev2"}},
+        {"state": "closed", "created_at": "2023-06-15T14:00:00Z", "closed_at": "2023-06-16T11:00:00.5Z",
+         "labels": ["bug", "medium", "minor"], "author": {"username": "dev1"}, "assignee": {"username": "dev3"}},
+        {"state": "opened", "author": {"username": "dev3"}, "assignee": {"username": "dev2"}},
+        {"state": "closed", "labels": ["important"], "author": {}},
+    ]
+
+    PIPELINES = [
+        {"status": "success", "ref": "main", "created_at": "2023-06-12T00:30:00+02:00", "duration": 300},
+        {"status": "failed", "ref": "feature", "created_at": "2023-06-11T23:00:00Z", "duration": 120.5},
+        {"status": "manual", "ref": "main", "created_at": "2023-06-20T14:00:00Z"},
+        {"status": "success", "ref": "develop", "created_at": "2023-06-18T10:00:00Z", "duration": None},
+        {"status": "running", "created_at": None},
+        {"ref": "feature", "created_at": "2023-06-19T10:00:00Z"},
+    ]
+
+    @pytest.fixture
+    def mock_gateway(self):
+        """Fixture pour créer un mock de GitLabProjectsGateway alimenté par les jeux de données."""
+        gateway = MagicMock(spec=GitLabProjectsGateway)
+        gateway.get_project_commits.return_value = self.COMMITS
+        gateway.get_project_merge_requests.return_value = self.MERGE_REQUESTS
+        gateway.get_project_issues.return_value = self.ISSUES
+        gateway.get_project_pipelines.return_value = self.PIPELINES
+        return gateway
+
+    @staticmethod
+    def _assert_identical(expected, actual):
+        """Vérifie l'égalité, l'ordre des clés et les types Python des résultats."""
+        assert actual == expected
+        assert json.dumps(actual) == json.dumps(expected)
+
+    def test_unknown_backend_is_rejected(self, mock_gateway):
+        """Tester le refus d'un moteur de calcul inconnu."""
+        with pytest.raises(ValueError):
+            GitLabStatsExtractor(mock_gateway, backend="polars")
+
+    @pytest.mark.parametrize("method, kwargs", [
+        ("get_commit_stats", {"start_date": "2023-06-01", "end_date": "2023-06-30"}),
+        ("get_merge_request_stats", {}),
+        ("get_issue_stats", {}),
+        ("get_pipeline_stats", {}),
+    ])
+    def test_backends_produce_identical_stats(self, mock_gateway, method, kwargs):
+        """Tester que le moteur "pandas" reproduit exactement le moteur "python"."""
+        expected = getattr(GitLabStatsExtractor(mock_gateway), method)(1, **kwargs)
+        actual = getattr(GitLabStatsExtractor(mock_gateway, backend="pandas"), method)(1, **kwargs)
+
+        self._assert_identical(expected, actual)
+
+    @pytest.mark.parametrize("method, kwargs", [
+        ("get_commit_stats", {"start_date": "2023-06-01", "end_date": "2023-06-30"}),
+        ("get_merge_request_stats", {}),
+        ("get_issue_stats", {}),
+        ("get_pipeline_stats", {}),
+    ])
+    def test_backends_agree_on_empty_projects(self, mock_gateway, method, kwargs):
+        """Tester la parité des moteurs pour un projet sans données."""
+        for name in ("get_project_commits", "get_project_merge_requests",
+                     "get_project_issues", "get_project_pipelines"):
+            getattr(mock_gateway, name).return_value = []
+
+        expected = getattr(GitLabStatsExtractor(mock_gateway), method)(1, **kwargs)
+        actual = getattr(GitLabStatsExtractor(mock_gateway, backend="pandas"), method)(1, **kwargs)
+
+        self._assert_identical(expected, actual)
+
+
+class TestGitLabPortfolioStats:
+    """Tests pour GitLabStatsExtractor.get_portfolio_stats."""
+
+    DATA = {
+        1: {
+            "commits": [{"author_name": "Dev 1", "created_at": "2023-06-15T10:00:00Z"}],
+            "merge_requests": [{"state": "merged", "created_at": "2023-06-10T10:00:00Z",
+                                "merged_at": "2023-06-10T12:00:00Z", "author": {"username": "dev1"}}],
+            "issues": [{"state": "opened", "labels": ["bug"], "author": {"username": "dev1"}}],
+            "pipelines": [{"status": "success", "ref": "main", "created_at": "2023-06-12T10:00:00Z",
+                           "duration": 100}],
+        },
+        2: {
+            "commits": [{"author_name": "Dev 2", "created_at": "2023-06-16T10:00:00Z"},
+                        {"author_name": "Dev 1", "created_at": "2023-06-16T11:00:00Z"}],
+            "merge_requests": [{"state": "merged", "created_at": "2023-06-10T10:00:00Z",
+                                "merged_at": "2023-06-11T10:00:00Z", "author": {"username": "dev2"}}],
+            "issues": [],
+            "pipelines": [{"status": "failed", "ref": "main", "created_at": "2023-06-13T10:00:00Z",
+                           "duration": 300}],
+        },
+    }
+
+    @pytest.fixture
+    def mock_gateway(self):
+        """Fixture pour créer un mock de GitLabProjectsGateway servant les données par projet."""
+        gateway = MagicMock(spec=GitLabProjectsGateway)
+        for method, resource in (("get_project_commits", "commits"),
+                                 ("get_project_merge_requests", "merge_requests"),
+                                 ("get_project_issues", "issues"),
+                                 ("get_project_pipelines", "pipelines")):
+            getattr(gateway, method).side_effect = (
+                lambda project_id, params=None, resource=resource: self.DATA[project_id][resource]
+            )
+        return gateway
+
+    def test_each_resource_is_fetched_once_per_project(self, mock_gateway):
+        """Tester qu'une seule requête par ressource et par projet est émise."""
+        GitLabStatsExtractor(mock_gateway).get_portfolio_stats([1, 2, 1], "2023-06-01", "2023-06-30")
+
+        assert mock_gateway.get_project_commits.call_count == 2
+        assert mock_gateway.get_project_merge_requests.call_count == 2
+        assert mock_gateway.get_project_issues.call_count == 2
+        mock_gateway.get_project_pipelines.assert_any_call(
+            2, params={'updated_after': '2023-06-01', 'updated_before': '2023-06-30'}
+        )
+
+    def test_project_stats_match_single_project_methods(self, mock_gateway):
+        """Tester que les statistiques par projet sont celles des méthodes unitaires."""
+        extractor = GitLabStatsExtractor(mock_gateway)
+
+        portfolio = extractor.get_portfolio_stats([1, 2], "2023-06-01", "2023-06-30")
+
+        assert list(portfolio['projects']) == [1, 2]
+        project = portfolio['projects'][2]
+        assert project['commits'] == extractor.get_commit_stats(2, "2023-06-01", "2023-06-30")
+        assert project['merge_requests'] == extractor.get_merge_request_stats(2, "2023-06-01", "2023-06-30")
+        assert project['pipelines'] == extractor.get_pipeline_stats(2, "2023-06-01", "2023-06-30")
+
+    def test_global_rollup_is_computed_on_all_projects(self, mock_gateway):
+        """Tester l'agrégat global recalculé sur l'ensemble des éléments."""
+        portfolio = GitLabStatsExtractor(mock_gateway).get_portfolio_stats([1, 2], "2023-06-01", "2023-06-30")
+
+        rollup = portfolio['global']
+        assert rollup['total_projects'] == 2
+        assert rollup['commits']['total_commits'] == 3
+        assert rollup['commits']['authors'] == {"Dev 1": 2, "Dev 2": 1}
+        assert rollup['merge_requests']['avg_time_to_merge'] == 13.0  # (2 + 24) / 2
+        assert rollup['pipelines']['avg_duration'] == 200
+        assert rollup['issues']['total_issues'] == 1
+
+    def test_backends_agree_on_portfolio(self, mock_gateway):
+        """Tester la parité des moteurs sur les statistiques de portefeuille."""
+        expected = GitLabStatsExtractor(mock_gateway).get_portfolio_stats([1, 2], "2023-06-01", "2023-06-30")
+        actual = GitLabStatsExtractor(mock_gateway, backend="pandas").get_portfolio_stats(
+            [1, 2], "2023-06-01", "2023-06-30"
+        )
+
+        assert json.dumps(actual) == json.dumps(expected)
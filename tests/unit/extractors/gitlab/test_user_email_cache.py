@@ -0,0 +1,95 @@
+"""
+Module de tests unitaires pour GitLabUserEmailCache et l'enrichissement des emails.
+
+Ce module vérifie que les emails déjà résolus pour une même version de fiche
+utilisateur ne sont jamais redemandés à l'API.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import APIRateLimitError
+from src.extractors.gitlab.gitlab_client_improved import GitLabClient
+from src.extractors.gitlab.user_email_cache import GitLabUserEmailCache
+from src.extractors.gitlab.users_gateway import GitLabUsersGateway
+
+
+class TestGitLabUserEmailCache:
+    """Tests pour le cache d'emails et GitLabUsersGateway.enrich_user_emails."""
+
+    @pytest.fixture
+    def cache_file(self, tmp_path):
+        """Fixture fournissant un chemin de cache temporaire."""
+        return str(tmp_path / "emails.json")
+
+    @pytest.fixture
+    def users_gateway(self):
+        """Fixture pour créer un gateway dont la résolution d'email est mockée."""
+        client = MagicMock(spec=GitLabClient)
+        client._logger = MagicMock()
+        gateway = GitLabUsersGateway(client)
+        gateway._fetch_user_email = MagicMock(side_effect=lambda user_id: (True, f"user{user_id}@example.com"))
+        return gateway
+
+    def test_cache_is_persisted_and_versioned(self, cache_file):
+        """Tester la persistance et l'invalidation par 'updated_at'."""
+        cache = GitLabUserEmailCache(cache_file)
+        cache.store({"id": 1, "updated_at": "2024-01-01"}, "a@example.com")
+        cache.save()
+
+        reloaded = GitLabUserEmailCache(cache_file)
+
+        assert reloaded.lookup({"id": 1, "updated_at": "2024-01-01"}) == (True, "a@example.com")
+        assert reloaded.lookup({"id": 1, "updated_at": "2024-02-01"}) == (False, None)
+
+    def test_unchanged_users_are_not_resolved_again(self, users_gateway, cache_file):
+        """Tester qu'un utilisateur inchangé est complété depuis le cache."""
+        users = [{"id": 1, "updated_at": "t1"}, {"id": 2, "updated_at": "t1"}, {"id": 3, "email": "c@x.io"}]
+        users_gateway.enrich_user_emails(users, email_cache=GitLabUserEmailCache(cache_file))
+
+        second_run = [{"id": 1, "updated_at": "t1"}, {"id": 2, "updated_at": "t2"}]
+        resolved = users_gateway.enrich_user_emails(second_run, email_cache=GitLabUserEmailCache(cache_file))
+
+        assert resolved == 1
+        assert second_run[0]["email"] == "user1@example.com"
+        assert users_gateway._fetch_user_email.call_count == 3
+
+    def test_user_without_email_is_cached(self, users_gateway, cache_file):
+        """Tester qu'une résolution aboutie sans email n'est pas relancée."""
+        users_gateway._fetch_user_email.side_effect = lambda user_id: (True, None)
+        users_gateway.enrich_user_emails([{"id": 9, "updated_at": "t"}], email_cache=GitLabUserEmailCache(cache_file))
+
+        user = {"id": 9, "updated_at": "t"}
+        users_gateway.enrich_user_emails([user], email_cache=GitLabUserEmailCache(cache_file))
+
+        assert "email" not in user
+        users_gateway._fetch_user_email.assert_called_once_with(9)
+
+    def test_failed_lookup_is_retried(self, users_gateway, cache_file):
+        """Tester qu'un échec de requête n'est pas mis en cache et est retenté."""
+        users_gateway._fetch_user_email.side_effect = [(False, None), (True, "late@example.com")]
+        first = users_gateway.enrich_user_emails([{"id": 9, "updated_at": "t"}], email_cache=GitLabUserEmailCache(cache_file))
+
+        user = {"id": 9, "updated_at": "t"}
+        second = users_gateway.enrich_user_emails([user], email_cache=GitLabUserEmailCache(cache_file))
+
+        assert (first, second) == (0, 1)
+        assert user["email"] == "late@example.com"
+        assert users_gateway._fetch_user_email.call_count == 2
+
+    def test_fetch_user_email_distinguishes_failure(self, cache_file):
+        """Tester que _fetch_user_email sépare « aucun email » et « requête en échec »."""
+        client = MagicMock(spec=GitLabClient)
+        client._logger = MagicMock()
+        client._gitlab_client = MagicMock()
+        gateway = GitLabUsersGateway(client)
+
+        client._gitlab_client.http_get.side_effect = [{"id": 9}, []]
+        assert gateway._fetch_user_email(9) == (True, None)
+
+        client._gitlab_client.http_get.side_effect = [Exception("503"), Exception("503")]
+        assert gateway._fetch_user_email(9) == (False, None)
+
+        client._gitlab_client.http_get.side_effect = APIRateLimitError("limite atteinte")
+        with pytest.raises(APIRateLimitError):
+            gateway._fetch_user_email(9)
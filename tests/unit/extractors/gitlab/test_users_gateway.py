@@ -107,3 +107,14 @@ class TestGitLabUsersGateway:
         # Vérifications
         assert result == mock_current_user
         mock_gitlab_client.api_get.assert_called_once_with("user", {})
+
+    def test_get_all_groups_iterates_keyset_pages(self, users_gateway, mock_gitlab_client):
+        """Teste que les groupes sont parcourus page par page via le client."""
+        mock_gitlab_client.iter_http_pages.return_value = iter([[{"id": 1}], [{"id": 2}]])
+
+        result = users_gateway.get_all_groups()
+
+        assert result == [{"id": 1}, {"id": 2}]
+        mock_gitlab_client.iter_http_pages.assert_called_once_with(
+            "/groups", params={"per_page": 100}, resource_type="groups"
+        )
@@ -0,0 +1,130 @@
+"""
+Module de tests unitaires pour SonarQubeIssuesHarvester.
+
+Ce module vérifie que les recherches d'issues dépassant la fenêtre de
+pagination sont découpées par dates de création (puis par sévérité) et que
+le résultat fusionné est complet et sans doublon.
+"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.extractors.sonarqube.issues_harvester import SonarQubeIssuesHarvester, _parse_datetime
+from src.extractors.sonarqube.projects_gateway import SonarQubeProjectsGateway
+from src.extractors.sonarqube.sonarqube_client import SonarQubeClient
+
+WINDOW = 50
+PAGE_SIZE = 10
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _issues(count, seconds_apart=3600, severity="MAJOR", offset=0):
+    """Construit des issues simulées créées à intervalle régulier."""
+    return [
+        {
+            "key": f"{severity}-{offset + i}",
+            "severity": severity,
+            "type": "BUG",
+            "creationDate": (START + timedelta(seconds=(offset + i) * seconds_apart)).strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
+        for i in range(count)
+    ]
+
+
+class FakeIssuesSearch:
+    """Simule api/issues/search : filtres de date et de sévérité, fenêtre de pagination."""
+
+    def __init__(self, issues):
+        self.issues = issues
+        self.calls = []
+
+    def __call__(self, endpoint, params=None, paginate=False):
+        self.calls.append(dict(params))
+        matching = [issue for issue in self.issues if self._matches(issue, params)]
+        matching.sort(key=lambda issue: issue["creationDate"])
+        page, size = params["p"], params["ps"]
+        if page * size > WINDOW and size > 1:
+            raise AssertionError("pagination au-delà de la fenêtre")
+        return {
+            "paging": {"pageIndex": page, "pageSize": size, "total": len(matching)},
+            "issues": matching[(page - 1) * size:page * size],
+        }
+
+    @staticmethod
+    def _matches(issue, params):
+        created = _parse_datetime(issue["creationDate"])
+        if params.get("createdAfter") and created < _parse_datetime(params["createdAfter"]):
+            return False
+        if params.get("createdBefore") and created >= _parse_datetime(params["createdBefore"]):
+            return False
+        if params.get("severities") and issue["severity"] not in params["severities"].split(","):
+            return False
+        return True
+
+
+class TestSonarQubeIssuesHarvester:
+    """Tests pour la récupération exhaustive des issues."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Fixture pour créer un mock de SonarQubeClient."""
+        return MagicMock(spec=SonarQubeClient)
+
+    def _harvester(self, mock_client, issues, max_workers=1):
+        mock_client.get.side_effect = FakeIssuesSearch(issues)
+        return SonarQubeIssuesHarvester(mock_client, max_workers=max_workers, window=WINDOW, page_size=PAGE_SIZE)
+
+    def test_small_search_is_paged_without_split(self, mock_client):
+        """Tester qu'une recherche tenant dans la fenêtre n'est pas découpée."""
+        harvester = self._harvester(mock_client, _issues(25))
+
+        issues = harvester.harvest({"componentKeys": "app"})
+
+        assert [issue["key"] for issue in issues] == [f"MAJOR-{i}" for i in range(25)]
+        assert mock_client.get.call_count == 3
+        assert all("createdAfter" not in call.kwargs["params"] for call in mock_client.get.call_args_list)
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_large_search_is_split_by_creation_date(self, mock_client, max_workers):
+        """Tester la récupération complète et sans doublon d'une recherche de 180 issues."""
+        expected = _issues(180)
+        harvester = self._harvester(mock_client, expected, max_workers=max_workers)
+
+        issues = harvester.harvest({"componentKeys": "app", "createdAfter": "2023-01-01"})
+
+        assert sorted(issue["key"] for issue in issues) == sorted(issue["key"] for issue in expected)
+        assert len({issue["key"] for issue in issues}) == len(issues)
+        assert any("createdBefore" in call.kwargs["params"] for call in mock_client.get.call_args_list)
+
+    def test_oldest_issue_bounds_the_first_split(self, mock_client):
+        """Tester que la borne basse est la création de la plus ancienne issue sans 'createdAfter'."""
+        harvester = self._harvester(mock_client, _issues(120))
+
+        issues = harvester.harvest({"componentKeys": "app"})
+
+        assert len(issues) == 120
+        oldest_call = mock_client.get.call_args_list[1].kwargs["params"]
+        assert (oldest_call["s"], oldest_call["asc"], oldest_call["ps"]) == ("CREATION_DATE", "true", 1)
+
+    def test_same_second_burst_is_split_by_severity(self, mock_client):
+        """Tester le découpage par sévérité d'issues créées dans la même seconde."""
+        burst = _issues(40, seconds_apart=0, severity="MAJOR") + _issues(40, seconds_apart=0, severity="MINOR")
+        harvester = self._harvester(mock_client, burst)
+
+        issues = harvester.harvest({"componentKeys": "app", "createdAfter": "2023-01-01T00:00:00+0000"})
+
+        assert sorted(issue["key"] for issue in issues) == sorted(issue["key"] for issue in burst)
+        assert any(call.kwargs["params"].get("severities") == "MINOR" for call in mock_client.get.call_args_list)
+
+    def test_gateway_delegates_to_harvester(self, mock_client):
+        """Tester que la passerelle passe les paramètres de recherche au moissonneur."""
+        harvester = MagicMock(spec=SonarQubeIssuesHarvester)
+        harvester.harvest.return_value = [{"key": "i1"}]
+        gateway = SonarQubeProjectsGateway(mock_client, issues_harvester=harvester)
+
+        result = gateway.get_project_issues("app", types=["BUG"], branch="main")
+
+        harvester.harvest.assert_called_once_with({"componentKeys": "app", "types": "BUG", "branch": "main"})
+        mock_client.get.assert_not_called()
+        assert result == [{"key": "i1"}]
@@ -0,0 +1,163 @@
+"""
+Module de tests unitaires pour l'extraction SonarQube concurrente.
+
+Ce module vérifie que les projets sont extraits en parallèle, que la structure
+par projet est identique à l'extraction séquentielle et que le pool de
+connexions du client est dimensionné sur le nombre de workers. Il vérifie
+aussi la réutilisation des extractions des projets non réanalysés.
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.extractors.sonarqube.factories import SonarQubeClientFactory, SonarQubeExtractor
+from src.extractors.sonarqube.main import fetch_all_projects_resources
+from src.extractors.sonarqube.parallel import map_projects
+from src.extractors.sonarqube.projects_gateway import SonarQubeProjectsGateway
+from src.extractors.sonarqube.snapshot_store import SonarQubeSnapshotStore
+
+PROJECTS = [{"key": "alpha", "name": "Alpha"}, {"name": "sans clé"}, {"key": "beta"}, {"key": "gamma"}]
+
+
+class TestSonarQubeParallelExtraction:
+    """Tests pour le mode d'extraction concurrent SonarQube."""
+
+    @pytest.fixture
+    def mock_gateway(self):
+        """Fixture pour créer un mock de SonarQubeProjectsGateway répondant par clé de projet."""
+        gateway = MagicMock(spec=SonarQubeProjectsGateway)
+        gateway.get_projects.return_value = PROJECTS
+        gateway.get_projects_metrics.side_effect = lambda keys, metrics, branch=None: {
+            key: {"component": {"key": key, "measures": [{"metric": "bugs", "value": "1"},
+                                                        {"metric": "coverage", "value": "80.0"}]}}
+            for key in keys
+        }
+        gateway.get_project_issues.side_effect = lambda key, branch=None, **kwargs: [{"project": key}]
+        gateway.get_project_branches.side_effect = lambda key: [{"name": "main", "project": key}]
+        gateway.get_quality_gate_status.side_effect = lambda key, branch=None: {"status": "OK", "project": key}
+        gateway.get_compute_engine_activity.side_effect = lambda key, branch=None, only_current=False: []
+        gateway.get_project_branches_and_quality_gate.side_effect = (
+            lambda *args, **kwargs: SonarQubeProjectsGateway.get_project_branches_and_quality_gate(
+                gateway, *args, **kwargs
+            )
+        )
+        return gateway
+
+    def test_map_projects_runs_concurrently_and_keeps_order(self):
+        """Tester l'exécution simultanée et la conservation de l'ordre des projets."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def extract(delay):
+            barrier.wait()  # bloquerait indéfiniment en exécution séquentielle
+            time.sleep(delay)
+            return delay
+
+        assert map_projects(extract, [0.03, 0.02, 0.0], max_workers=3) == [0.03, 0.02, 0.0]
+
+    def test_fetch_all_projects_resources_matches_sequential(self, mock_gateway):
+        """Tester que la structure par projet est identique en mode concurrent."""
+        sequential = fetch_all_projects_resources(mock_gateway, max_workers=1)
+        concurrent = fetch_all_projects_resources(mock_gateway, max_workers=4)
+
+        assert concurrent == sequential
+        assert list(concurrent) == ["alpha", "beta", "gamma"]
+        assert concurrent["beta"]["quality_gate"] == {"status": "OK", "project": "beta"}
+        assert concurrent["beta"]["quality_measures"]["component"]["measures"] == [{"metric": "bugs", "value": "1"}]
+        assert concurrent["beta"]["coverage_measures"]["component"]["measures"] == [
+            {"metric": "coverage", "value": "80.0"}
+        ]
+        assert mock_gateway.get_projects_metrics.call_args.args[0] == ["alpha", "beta", "gamma"]
+
+    def test_fetch_all_projects_resources_records_errors_per_project(self, mock_gateway):
+        """Tester qu'une erreur sur un projet est consignée sans interrompre les autres."""
+        mock_gateway.get_project_branches.side_effect = (
+            lambda key: (_ for _ in ()).throw(RuntimeError("boom")) if key == "beta" else []
+        )
+
+        data = fetch_all_projects_resources(mock_gateway, max_workers=4)
+
+        assert data["beta"]["branches"] == {"error": "boom"}
+        assert data["gamma"]["branches"] == []
+
+    def test_extractor_extract_concurrent(self, mock_gateway):
+        """Tester SonarQubeExtractor.extract en mode concurrent."""
+        extractor = SonarQubeExtractor({"api_url": "https://sonar.example.com/api", "token": "t", "max_workers": 4})
+        extractor.projects = mock_gateway
+        extractor.is_connected = True
+
+        concurrent = extractor.extract(include_activity=True)
+        sequential = extractor.extract(include_activity=True, max_workers=1)
+
+        assert concurrent == sequential
+        assert [item["project"].get("key") for item in concurrent] == ["alpha", "beta", "gamma"]
+        assert concurrent[0]["measures"]["component"]["key"] == "alpha"
+        assert len(mock_gateway.get_projects_metrics.call_args.args[1]) == 29  # 27 métriques + statut de Quality Gate
+        mock_gateway.get_project_metrics.assert_not_called()
+
+    def test_client_pool_matches_workers(self):
+        """Tester le dimensionnement du pool de connexions sur le nombre de workers."""
+        client = SonarQubeClientFactory.create_client(
+            config={"api_url": "https://sonar.example.com/api", "token": "t", "max_workers": 12}
+        )
+
+        assert client.session.get_adapter("https://sonar.example.com/api")._pool_maxsize == 12
+
+    def test_extract_reuses_snapshots_of_projects_not_reanalyzed(self, mock_gateway, tmp_path):
+        """Tester que seuls les projets analysés depuis la précédente exécution sont réextraits."""
+        analyzed = {"alpha": "2024-06-01T10:00:00+0000", "beta": "2024-06-01T11:00:00+0000", "gamma": None}
+        mock_gateway.get_projects.side_effect = lambda **kwargs: [
+            {"key": key, "lastAnalysisDate": date} for key, date in analyzed.items()
+        ]
+        extractor = SonarQubeExtractor({"api_url": "https://sonar.example.com/api", "token": "t"})
+        extractor.projects = mock_gateway
+        extractor.is_connected = True
+        store = SonarQubeSnapshotStore(str(tmp_path / "snapshots"))
+        first = extractor.extract(snapshot_store=store)
+        store.save()
+
+        analyzed["beta"] = "2024-06-02T08:00:00+0000"
+        mock_gateway.get_project_branches.reset_mock()
+        second = extractor.extract(snapshot_store=SonarQubeSnapshotStore(str(tmp_path / "snapshots")))
+
+        assert [call.args[0] for call in mock_gateway.get_project_branches.call_args_list] == ["beta"]
+        assert mock_gateway.get_projects_metrics.call_args.args[0] == ["beta"]
+        assert [item["project"]["key"] for item in second] == ["alpha", "beta", "gamma"]
+        assert second[0] == first[0]
+        assert second[1]["project"]["lastAnalysisDate"] == "2024-06-02T08:00:00+0000"
+
+    def test_snapshot_is_not_reused_with_other_options(self, tmp_path):
+        """Tester qu'une extraction conservée n'est réutilisée qu'avec les mêmes options."""
+        store = SonarQubeSnapshotStore(str(tmp_path / "snapshots"))
+        store.store("org:app", "2024-06-01T10:00:00+0000", {"branch": None}, {"measures": {}})
+
+        assert store.get("org:app", "2024-06-01T10:00:00+0000", {"branch": None}) == {"measures": {}}
+        assert store.get("org:app", "2024-06-01T10:00:00+0000", {"branch": "develop"}) is None
+        assert store.get("org:app", "2024-06-03T10:00:00+0000", {"branch": None}) is None
+        assert store.watermark("org:app") == "2024-06-01T10:00:00+0000"
+
+    def test_quality_gate_comes_from_bulk_measures(self, mock_gateway):
+        """Tester que le statut de Quality Gate des mesures groupées évite l'appel par projet."""
+        details = '{"level":"ERROR","conditions":[{"metric":"coverage","op":"LT","error":"80","actual":"42.0","level":"ERROR"}]}'
+        mock_gateway.get_projects_metrics.side_effect = lambda keys, metrics, branch=None: {
+            key: {"component": {"key": key, "measures": [
+                {"metric": "bugs", "value": "1"},
+                {"metric": "alert_status", "value": "ERROR"},
+                {"metric": "quality_gate_details", "value": details},
+            ]}}
+            for key in keys
+        }
+        extractor = SonarQubeExtractor({"api_url": "https://sonar.example.com/api", "token": "t", "max_workers": 1})
+        extractor.projects = mock_gateway
+        extractor.is_connected = True
+
+        items = extractor.extract(include_issues=False)
+
+        mock_gateway.get_quality_gate_status.assert_not_called()
+        assert "alert_status" in mock_gateway.get_projects_metrics.call_args.args[1]
+        assert items[0]["quality_gate"]["projectStatus"]["status"] == "ERROR"
+        assert items[0]["quality_gate"]["projectStatus"]["conditions"][0]["metricKey"] == "coverage"
+        assert items[0]["measures"]["component"]["measures"] == [{"metric": "bugs", "value": "1"}]
+        assert items[0]["branches"] == [{"name": "main", "project": "alpha"}]
+
@@ -287,3 +287,72 @@ class TestSonarQubeProjectsGateway:
         )
         
         assert result == mock_response
+
+    def test_get_projects_metrics_batches_measures_search(self, gateway, mock_client):
+        """Tester la lecture groupée des mesures par lots de 100 projets et leur redistribution."""
+        keys = [f"p{i}" for i in range(150)]
+        mock_client.get.side_effect = [
+            {"measures": [
+                {"metric": "bugs", "value": "3", "component": "p0"},
+                {"metric": "coverage", "value": "81.5", "component": "p99", "bestValue": False},
+            ]},
+            {"measures": [{"metric": "bugs", "value": "0", "component": "p149"}]},
+        ]
+
+        result = gateway.get_projects_metrics(keys, ["bugs", "coverage"])
+
+        assert mock_client.get.call_count == 2
+        first_call = mock_client.get.call_args_list[0]
+        assert first_call.args == ("measures/search",)
+        assert first_call.kwargs["params"]["projectKeys"] == ",".join(keys[:100])
+        assert first_call.kwargs["params"]["metricKeys"] == "bugs,coverage"
+        assert mock_client.get.call_args_list[1].kwargs["params"]["projectKeys"] == ",".join(keys[100:])
+        assert result["p0"] == {"component": {"key": "p0", "measures": [{"metric": "bugs", "value": "3"}]}}
+        assert result["p99"]["component"]["measures"] == [
+            {"metric": "coverage", "value": "81.5", "bestValue": False}
+        ]
+        assert result["p149"]["component"]["measures"] == [{"metric": "bugs", "value": "0"}]
+        assert result["p50"] == {"component": {"key": "p50", "measures": []}}
+
+    def test_get_projects_metrics_with_branch_falls_back_per_project(self, gateway, mock_client):
+        """Tester la lecture projet par projet lorsqu'une branche est demandée."""
+        mock_client.get.side_effect = [
+            {"component": {"key": "p1", "measures": [{"metric": "bugs", "value": "1"}]}},
+            ResourceNotFoundError("missing"),
+        ]
+
+        result = gateway.get_projects_metrics(["p1", "p2"], ["bugs"], branch="develop")
+
+        assert list(result) == ["p1"]
+        mock_client.get.assert_any_call(
+            "measures/component",
+            params={"component": "p1", "metricKeys": "bugs", "branch": "develop"}
+        )
+
+    def test_quality_gate_is_derived_from_branch_list(self, gateway, mock_client):
+        """Tester que le statut de la branche principale évite l'appel à qualitygates/project_status."""
+        mock_client.get.return_value = {"branches": [
+            {"name": "develop", "isMain": False, "status": {"qualityGateStatus": "ERROR"}},
+            {"name": "main", "isMain": True, "status": {"qualityGateStatus": "OK"}},
+        ]}
+
+        result = gateway.get_project_branches_and_quality_gate("project1")
+
+        mock_client.get.assert_called_once_with("project_branches/list", params={"project": "project1"})
+        assert len(result["branches"]) == 2
+        assert result["quality_gate"] == {"projectStatus": {"status": "OK"}}
+
+    def test_quality_gate_falls_back_to_project_status(self, gateway, mock_client):
+        """Tester l'appel à qualitygates/project_status lorsque la branche n'a pas de statut."""
+        mock_client.get.side_effect = [
+            {"branches": [{"name": "main", "isMain": True}]},
+            {"projectStatus": {"status": "WARN", "conditions": []}},
+        ]
+
+        result = gateway.get_project_branches_and_quality_gate("project1", branch="main")
+
+        assert result["quality_gate"] == {"projectStatus": {"status": "WARN", "conditions": []}}
+        mock_client.get.assert_called_with(
+            "qualitygates/project_status", params={"projectKey": "project1", "branch": "main"}
+        )
+
@@ -6,6 +6,7 @@ l'authentification et les requêtes vers l'API SonarQube.
 """
 
 import json
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -14,8 +15,8 @@ import requests
 
 from src.core.exceptions import (
     APIAuthenticationError,
+    APIConnectionError,
     APIRateLimitError,
-    ConnectionError,
     ResourceNotFoundError,
 )
 from src.extractors.sonarqube.sonarqube_client import SonarQubeClient
@@ -25,8 +26,8 @@ class TestSonarQubeClient:
     """Tests pour la classe SonarQubeClient."""
 
     @pytest.fixture
-    def client(self):
-        """Fixture pour créer une instance de SonarQubeClient pour les tests."""
+    def client(self, mock_session):
+        """Fixture pour créer une instance de SonarQubeClient utilisant la session simulée."""
         return SonarQubeClient(
             api_url="https://sonarqube.example.com/api",
             token="test_token",
@@ -98,7 +99,7 @@ class TestSonarQubeClient:
         # Configuration du mock pour simuler une erreur de connexion
         mock_session.get.side_effect = requests.exceptions.ConnectionError("Connection refused")
         
-        with pytest.raises(ConnectionError):
+        with pytest.raises(APIConnectionError):
             client.test_connection()
 
     def test_get_success(self, client, mock_session):
@@ -150,7 +151,7 @@ class TestSonarQubeClient:
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("Server Error")
         mock_session.request.return_value = mock_response
         
-        with pytest.raises(ConnectionError):
+        with pytest.raises(APIConnectionError):
             client.get("projects")
 
     def test_paginated_get(self, client, mock_session):
@@ -200,3 +201,68 @@ class TestSonarQubeClient:
         
         # Vérifier que la méthode a été appelée deux fois avec les bons paramètres de pagination
         assert mock_session.request.call_count == 2
+
+
+def _component_page(page, page_size=2, total=5):
+    """Construit une page simulée de measures/component_tree."""
+    first = (page - 1) * page_size
+    return {
+        "paging": {"pageIndex": page, "pageSize": page_size, "total": total},
+        "baseComponent": {"key": "app"},
+        "components": [{"key": f"file{i}"} for i in range(first, min(first + page_size, total))],
+    }
+
+
+class TestSonarQubeClientStreaming:
+    """Tests pour le parcours en flux des ressources paginées."""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture pour créer une instance de SonarQubeClient sans accès réseau."""
+        client = SonarQubeClient(api_url="https://sonarqube.example.com/api", token="test_token")
+        client._make_request = MagicMock(side_effect=lambda method, endpoint, params=None: _component_page(params["p"]))
+        return client
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iter_items_yields_every_page(self, client, prefetch):
+        """Tester le parcours de toutes les pages sans modifier les paramètres de l'appelant."""
+        params = {"component": "app", "ps": 2}
+
+        items = list(client.iter_items("measures/component_tree", params, items_key="components", prefetch=prefetch))
+
+        assert [item["key"] for item in items] == [f"file{i}" for i in range(5)]
+        assert [call.args[2]["p"] for call in client._make_request.call_args_list] == [1, 2, 3]
+        assert params == {"component": "app", "ps": 2}
+
+    def test_iter_pages_prefetches_next_page(self, client):
+        """Tester que la page suivante est demandée pendant le traitement de la page courante."""
+        requested = threading.Event()
+
+        def make_request(method, endpoint, params=None):
+            if params["p"] == 2:
+                requested.set()
+            return _component_page(params["p"])
+
+        client._make_request.side_effect = make_request
+        pages = client.iter_pages("measures/component_tree", {"ps": 2})
+
+        first = next(pages)
+
+        assert first["paging"]["pageIndex"] == 1
+        assert requested.wait(timeout=5)
+        pages.close()
+
+    def test_abandoned_iteration_stops_fetching(self, client):
+        """Tester qu'un parcours interrompu ne demande pas d'autres pages."""
+        items = client.iter_items("measures/component_tree", {"ps": 2}, items_key="components")
+
+        assert next(items)["key"] == "file0"
+        items.close()
+
+        assert client._make_request.call_count <= 2
+
+    def test_get_paginate_materializes_items(self, client):
+        """Tester que get(paginate=True) renvoie toujours la liste complète."""
+        result = client.get("measures/component_tree", params={"ps": 2}, paginate=True)
+
+        assert len(result) == 5
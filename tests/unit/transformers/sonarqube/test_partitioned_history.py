@@ -0,0 +1,84 @@
+"""
+Module de tests unitaires pour PartitionedHistoryStore.
+
+Ce module vérifie que l'historique des métriques est écrit par partition de
+date, en ajout seul, et que la lecture ne porte que sur la période demandée.
+"""
+import json
+import os
+
+import pytest
+
+from src.transformers.sonarqube.main import append_history
+from src.transformers.sonarqube.partitioned_history import PartitionedHistoryStore
+
+
+def _row(project_key, date_id, bugs="0"):
+    """Construit une ligne de métriques simulée."""
+    return {"project_key": project_key, "date_id": date_id, "branch_name": "main", "n_bugs": bugs}
+
+
+class TestPartitionedHistoryStore:
+    """Tests pour l'historique partitionné des métriques SonarQube."""
+
+    @pytest.fixture
+    def history_dir(self, tmp_path):
+        """Fixture fournissant un dossier d'historique temporaire."""
+        return str(tmp_path / "history")
+
+    def test_rows_are_written_per_date_partition(self, history_dir):
+        """Tester l'écriture d'un fichier JSON Lines par date_id et du manifeste."""
+        store = PartitionedHistoryStore(history_dir)
+
+        written = store.append([_row("alpha", 20240601), _row("beta", 20240601), _row("alpha", 20240602)])
+
+        assert written == 3
+        assert sorted(os.listdir(history_dir)) == [
+            "date_id=20240601.jsonl", "date_id=20240602.jsonl", "manifest.json"
+        ]
+        with open(os.path.join(history_dir, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        assert manifest["partitions"]["20240601"]["rows"] == 2
+
+    def test_append_only_touches_new_rows(self, history_dir):
+        """Tester qu'une nouvelle exécution n'ajoute que les lignes nouvelles ou modifiées."""
+        PartitionedHistoryStore(history_dir).append([_row("alpha", 20240601), _row("alpha", 20240602)])
+        first_partition = os.path.join(history_dir, "date_id=20240601.jsonl")
+        mtime = os.stat(first_partition).st_mtime_ns
+
+        store = PartitionedHistoryStore(history_dir)
+        written = store.append([_row("alpha", 20240602), _row("alpha", 20240602, bugs="4")])
+
+        assert written == 1
+        assert os.stat(first_partition).st_mtime_ns == mtime
+        assert [row["n_bugs"] for row in store.read(20240602, 20240602)] == ["0", "4"]
+
+    def test_non_ascii_rows_are_not_appended_again(self, history_dir):
+        """Tester qu'une ligne contenant des caractères non ASCII n'est pas réécrite à la réexécution."""
+        row = {"date_id": 20261018, "project_key": "projet-é", "branch_name": "développement"}
+
+        assert PartitionedHistoryStore(history_dir).append([row]) == 1
+        assert PartitionedHistoryStore(history_dir).append([row]) == 0
+        assert list(PartitionedHistoryStore(history_dir).read()) == [row]
+
+    def test_read_prunes_partitions_by_date_range(self, history_dir):
+        """Tester que seules les partitions de la période sont lues."""
+        store = PartitionedHistoryStore(history_dir)
+        store.append([_row("alpha", date_id) for date_id in (20240530, 20240601, 20240603)])
+        os.remove(os.path.join(history_dir, "date_id=20240530.jsonl"))
+
+        rows = list(PartitionedHistoryStore(history_dir).read(start=20240601))
+
+        assert [row["date_id"] for row in rows] == [20240601, 20240603]
+
+    def test_legacy_json_history_is_imported_once(self, tmp_path, history_dir):
+        """Tester l'import de l'ancien fichier d'historique JSON unique."""
+        legacy_file = tmp_path / "fact_project_metrics_history.json"
+        legacy_file.write_text(json.dumps([_row("alpha", 20240501), _row("beta", 20240502)]), encoding="utf-8")
+
+        append_history([_row("alpha", 20240601)], history_dir=history_dir, legacy_file=str(legacy_file))
+
+        store = PartitionedHistoryStore(history_dir)
+        assert store.partitions() == ["20240501", "20240502", "20240601"]
+        assert not legacy_file.exists()
+        assert (tmp_path / "fact_project_metrics_history.json.migrated").exists()
@@ -0,0 +1,62 @@
+"""
+Module de tests unitaires pour la transformation des métriques SonarQube.
+
+Ce module vérifie que les métriques sont lues dans les sorties de
+l'extracteur comme de la passerelle, une seule fois par projet et branche.
+"""
+import pytest
+
+from src.transformers.sonarqube.main import transform_metrics, transform_metrics_columns
+
+MEASURES = [
+    {"metric": "bugs", "value": "3"},
+    {"metric": "coverage", "value": "81.5"},
+    {"metric": "lines_to_cover", "value": "1200"},
+]
+
+
+class TestSonarQubeMetricsTransform:
+    """Tests pour transform_metrics et transform_metrics_columns."""
+
+    @pytest.fixture
+    def raw_data(self):
+        """Fixture fournissant des fichiers bruts aux deux formats de sortie."""
+        extractor_output = [
+            {
+                "project": {"key": "alpha"},
+                "measures": {"component": {"key": "alpha", "measures": MEASURES}},
+                "branches": [{"name": "develop"}],
+            },
+            {"project": {"key": "broken"}, "measures": {"error": "boom"}},
+        ]
+        gateway_output = {
+            "alpha": {
+                "project": {"key": "alpha"},
+                "quality_measures": {"component": {"measures": MEASURES[:1]}},
+                "branches": [{"name": "develop"}],
+            },
+            "gamma": {
+                "project": {"key": "gamma"},
+                "quality_measures": {"component": {"key": "gamma", "measures": MEASURES[:1]}},
+                "coverage_measures": {"component": {"key": "gamma", "measures": MEASURES[1:]}},
+                "branches": {"error": "boom"},
+            },
+        }
+        return [gateway_output, extractor_output, [{"key": "alpha", "name": "Alpha"}]]
+
+    def test_both_output_shapes_are_read_once_per_project(self, raw_data):
+        """Tester la lecture des deux formats, la sortie de l'extracteur étant prioritaire."""
+        rows = transform_metrics(raw_data)
+
+        assert [(row["project_key"], row["branch_name"]) for row in rows] == [("alpha", "develop"), ("gamma", "main")]
+        assert rows[0]["coverage"] == "81.5"
+        assert rows[1]["n_bugs"] == "3"
+        assert rows[1]["n_lines_of_code"] == "1200"
+        assert rows[1]["n_vulnerabilities"] == "0"
+
+    def test_columns_are_aligned(self, raw_data):
+        """Tester que chaque colonne contient une valeur par projet."""
+        columns = transform_metrics_columns(raw_data)
+
+        assert {len(values) for values in columns.values()} == {2}
+        assert columns["project_key"] == ["alpha", "gamma"]